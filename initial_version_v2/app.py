@@ -1,10 +1,12 @@
 # app.py
 import streamlit as st
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from config.settings import settings
 from repositories.search_repository import SearchRepository
-from services.search_service import search_news
+from repositories.repository_factory import create_search_repository
+from services.search_service import search_news_cursor, load_more_news
+from services.search_cache import search_cache
 from services.ai_service import summarize_news_with_keywords
 from services.youtube_service import get_trending_videos
 from services.trending_news_service import get_home_trending_news
@@ -16,7 +18,7 @@ from domain.search_result import SearchResult
 
 from components.search_form import render_search_form
 from components.result_section import render_summary, render_news_list, render_related_keywords
-from components.trending_section import render_trending_section
+from components.trending_section import render_trending_section, render_keyword_trend
 from components.home_recommendation import render_home_recommendations
 from components.popup_viewer import render_popups
 from components.loading import show_loading
@@ -84,6 +86,9 @@ div.block-container { padding-top: 1.1rem !important; }
 # =========================================================
 def _open_nav_modal(name: str):
     st.session_state.nav_modal = name
+    # 검색기록 목록은 열 때마다 첫 페이지부터 다시 불러옴
+    st.session_state.pop("history_entries", None)
+    st.session_state.pop("history_cursor", None)
 
 def _close_nav_modal():
     st.session_state.nav_modal = None
@@ -111,6 +116,14 @@ def _dlg_api_limit():
 - 실제 한도는 플랜/키 설정에 따라 달라질 수 있습니다.
         """
     )
+    # 검색 결과 캐시 적중 현황 (이 서버 프로세스 기준)
+    if search_cache.enabled:
+        stats = search_cache.stats()
+        st.caption("🗂️ 검색 결과 캐시 (같은 조건의 검색은 API를 다시 호출하지 않음)")
+        c1, c2, c3 = st.columns(3)
+        c1.metric("적중률", f"{stats['hit_rate']:.0%}", help=f"{stats['hits']} / {stats['lookups']}회 검색")
+        c2.metric("절약한 호출", f"{stats['hits']}회")
+        c3.metric("절약한 크레딧(추정)", f"{stats['saved_credits']}")
     if st.button("닫기", width="stretch", key="btn_close_api"):
         _close_nav_modal()
         st.rerun()
@@ -126,45 +139,67 @@ def _dlg_storage():
         _close_nav_modal()
         st.rerun()
 
+# 검색기록 다이얼로그에서 한 번에 불러오는 기록 수
+HISTORY_PAGE_SIZE = 50
+
+def _load_history_page(repository: SearchRepository):
+    """
+    검색기록 목록의 다음 페이지를 불러와 세션에 이어 붙입니다. (첫 호출 시 첫 페이지)
+    """
+    page = repository.list_history(cursor=st.session_state.get("history_cursor"), page_size=HISTORY_PAGE_SIZE)
+    st.session_state.history_entries = st.session_state.get("history_entries", []) + page.entries
+    st.session_state.history_cursor = page.next_cursor
+
 @st.dialog("📜 검색 기록")
 def _dlg_history(repository: SearchRepository):
-    search_keys = repository.get_all_keys()
-    if not search_keys:
+    # 전체 기록 대신 최신 기록 한 페이지만 불러오고, 나머지는 '더 불러오기'로 이어 붙임
+    if "history_entries" not in st.session_state:
+        _load_history_page(repository)
+    entries = st.session_state.history_entries
+    if not entries:
         st.info("저장된 검색 기록이 없습니다.")
         if st.button("닫기", width="stretch"):
             _close_nav_modal()
             st.rerun()
         return
 
-    options = []
-    key_map = {}
-    for key in search_keys:
-        try:
-            keyword = key.rsplit("-", 1)[0]
-            ts_str = key.rsplit("-", 1)[1]
-            dt = datetime.strptime(ts_str, "%Y%m%d%H%M")
-            label = f"{keyword} ({dt.strftime('%Y-%m-%d %H:%M')})"
-        except:
-            label = key
-        options.append(label)
-        key_map[label] = key
-
-    selected = st.selectbox("기록 선택", options=options, index=None, placeholder="과거 결과 선택...")
+    labels = {}  # search_key -> 표시 라벨
+    query = st.text_input("기록 내용 검색", placeholder="기사 제목·본문·AI 요약에서 검색 (예: 반도체 실적)")
+    if query.strip():
+        # 전문 검색 결과(관련도순)로 선택 목록을 대신함
+        hits = repository.search_text(query, limit=30)
+        for hit in hits:
+            labels.setdefault(hit.search_key, f"{hit.title or '(AI 요약)'} · {hit.keyword} ({hit.search_time[:16]})")
+        st.caption(f"'{query.strip()}' 검색 결과 {len(labels)}건" if labels else "일치하는 기록이 없습니다.")
+    else:
+        for entry in entries:
+            labels.setdefault(entry.search_key, entry.label)
+
+    selected = st.selectbox(
+        "기록 선택", options=list(labels), format_func=labels.get, index=None, placeholder="과거 결과 선택..."
+    )
+    if not query.strip() and st.session_state.history_cursor:
+        st.button(
+            f"이전 기록 더 불러오기 (현재 {len(entries)}건)", width="stretch",
+            on_click=_load_history_page, args=(repository,)
+        )
     col1, col2 = st.columns([0.6, 0.4])
 
     with col1:
         if st.button("선택한 기록 열기", width="stretch", disabled=(selected is None)):
             st.session_state.current_mode = "history"
-            st.session_state.selected_key = key_map[selected]
+            st.session_state.selected_key = selected
             st.session_state.last_result = None
             _close_nav_modal()
             st.rerun()
 
     with col2:
-        csv_data = repository.get_all_as_csv()
+        # 다운로드를 누를 때만 내보내기 데이터를 만들도록 callable로 전달 (다이얼로그 렌더 시 전체 로드 방지)
+        # (callable data는 streamlit 1.54.0부터 지원. 누른 뒤에는 Streamlit이 결과 전체를 bytes로 받아 전달하므로
+        #  내보내기 전체가 한 번 메모리에 만들어짐 - 청크 단위 전송이 필요하면 별도 다운로드 경로가 필요)
         st.download_button(
             label="CSV 다운로드",
-            data=csv_data,
+            data=lambda: b"".join(repository.iter_csv_chunks()),
             file_name=f"trendtracker_export_{datetime.now().strftime('%Y%m%d')}.csv",
             mime="text/csv",
             width="stretch",
@@ -239,8 +274,37 @@ def render_top_nav(repository: SearchRepository):
 # =========================================================
 # 3) main()
 # =========================================================
+@st.cache_resource
+def _get_repository(
+    path: str,
+    backend: str,
+    trending_mode: str,
+    sketch_capacity: int,
+    write_batch_ms: int,
+    parquet_compact_files: int
+):
+    """
+    검색 기록 리포지토리를 프로세스당 한 번만 생성하여 모든 세션/재실행에서 공유합니다.
+    (SQLite 스키마 확인/이관 등 생성 비용을 재실행마다 치르지 않도록)
+    """
+    return create_search_repository(
+        path,
+        backend,
+        trending_mode=trending_mode,
+        sketch_capacity=sketch_capacity,
+        write_batch_ms=write_batch_ms,
+        parquet_compact_files=parquet_compact_files,
+    )
+
 def main():
-    repository = SearchRepository(settings.CSV_PATH)
+    repository = _get_repository(
+        settings.CSV_PATH,
+        settings.STORAGE_BACKEND,
+        settings.TRENDING_MODE,
+        settings.TRENDING_SKETCH_CAPACITY,
+        settings.WRITE_BATCH_MS,
+        settings.PARQUET_COMPACT_FILES,
+    )
 
     # 세션 상태 초기화
     if "current_mode" not in st.session_state:
@@ -249,6 +313,11 @@ def main():
         st.session_state.selected_key = None
     if "last_result" not in st.session_state:
         st.session_state.last_result = None
+    # 마지막 검색에서 받아 둔 결과와 표시 위치 ("더 보기"용)
+    if "result_cursor" not in st.session_state:
+        st.session_state.result_cursor = None
+    if "pending_load_more" not in st.session_state:
+        st.session_state.pending_load_more = False
 
     # Phase 9 & 10 세션 상태
     if "search_main_raw" not in st.session_state: st.session_state.search_main_raw = ""
@@ -292,7 +361,8 @@ def main():
         if filters:
             try:
                 with show_loading("🔍 뉴스를 검색하고 있습니다..."):
-                    articles = search_news(filters, num_results)
+                    cursor = search_news_cursor(filters, num_results)
+                    articles = cursor.visible
 
                 if not articles:
                     st.info("검색 결과가 없습니다. 다른 조건으로 시도해보세요.")
@@ -301,8 +371,8 @@ def main():
                         ai_output = summarize_news_with_keywords(articles)
 
                     keyword_display = ",".join(filters.main_terms)
-                    search_key = generate_search_key(keyword_display)
                     search_time = datetime.now()
+                    search_key = generate_search_key(search_time)
 
                     result = SearchResult(
                         search_key=search_key,
@@ -316,6 +386,7 @@ def main():
                     with show_loading("💾 결과를 저장하고 있습니다..."):
                         if repository.save(result):
                             st.session_state.last_result = result
+                            st.session_state.result_cursor = cursor
                             st.success(f"'{keyword_display}' 검색 완료! {len(articles)}건의 뉴스를 찾아서 저장했습니다.")
                             st.rerun()
                         else:
@@ -329,9 +400,21 @@ def main():
         # 결과 표시
         if st.session_state.last_result:
             res = st.session_state.last_result
+            cursor = st.session_state.result_cursor
+            if st.session_state.pending_load_more and cursor:
+                st.session_state.pending_load_more = False
+                try:
+                    with show_loading("📰 뉴스를 더 불러오고 있습니다..."):
+                        load_more_news(cursor)
+                except AppError as e:
+                    handle_error(e.error_type)
+
             render_summary(f"'{res.keyword}' 최신 트렌드 요약", res.ai_summary)
             render_related_keywords(res.related_keywords)
-            render_news_list(res.articles)
+            if cursor:
+                render_news_list(cursor.visible, has_more=cursor.has_more)
+            else:
+                render_news_list(res.articles)
         else:
             render_home_recommendations(
                 st.session_state.home_youtube_videos,
@@ -358,6 +441,12 @@ def main():
                 f"검색 기록: {result.keyword} ({result.search_time.strftime('%Y-%m-%d %H:%M')})",
                 result.ai_summary
             )
+            # 저장 시 갱신되는 일별 롤업에서 최근 2주 검색 추이를 읽음
+            now = datetime.now()
+            render_keyword_trend(
+                result.keyword,
+                repository.get_keyword_timeseries(result.keyword, start=now - timedelta(days=13), end=now, granularity="day")
+            )
             render_related_keywords(result.related_keywords)
             render_news_list(result.articles)
         else:
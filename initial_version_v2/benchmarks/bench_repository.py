@@ -0,0 +1,220 @@
+"""
+저장소(CSV / SQLite / Parquet / 날짜별 CSV 파티션)별 주요 API의 지연 시간과 최대 메모리를 측정합니다.
+
+benchmarks.synthetic_history로 합성 기록 CSV(한국어 키워드, 실제와 비슷한 길이의 본문)를 만들고
+각 저장소에 같은 기록을 채운 뒤, 연산마다 새 프로세스에서
+load / get_all_keys / find_by_key / get_trending_keywords / get_all_as_csv / save
+를 repeat회 호출하여 첫 호출(cold), 나머지 호출의 중앙값(warm), 최대 RSS를 기록합니다.
+(save는 기록을 늘리므로 마지막에 측정)
+
+결과는 --json으로 출력하거나 --output 파일(JSON Lines)에 실행 1회 = 1줄로 이어 써서
+커밋별 추이를 비교할 수 있습니다. 기사 1행은 CSV 기준 약 2KB이므로 500만 행이면 약 10GB의 디스크가 필요합니다.
+
+실행: uv run python -m benchmarks.bench_repository --rows 10000 100000 --output benchmarks/results.jsonl
+"""
+import os
+import sys
+import glob
+import json
+import time
+import shutil
+import platform
+import argparse
+import resource
+import statistics
+import tempfile
+import subprocess
+from datetime import datetime
+from typing import Dict, List
+import pandas as pd
+from benchmarks.synthetic_history import make_search_result, write_synthetic_csv
+
+BACKENDS = ("csv", "sqlite", "parquet", "partitioned")
+OPERATIONS = ("load", "get_all_keys", "find_by_key", "get_trending_keywords", "get_all_as_csv", "save")
+
+# 저장소별 데이터 경로 (create_search_repository가 경로로 종류를 판별할 수 있도록 확장자/슬래시를 맞춤)
+BACKEND_PATHS = {
+    "csv": "history.csv",
+    "sqlite": "history.db",
+    "parquet": "history.parquet",
+    "partitioned": "history_parts/",
+}
+
+CHILD = "from benchmarks.bench_repository import child_main; child_main()"
+
+def peak_rss_mib() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def child_main():
+    """
+    (측정용 자식 프로세스) 저장소 하나의 연산 하나를 repeat회 실행하고 결과를 JSON 한 줄로 출력합니다.
+    인자: <경로> <저장소 종류> <연산> <반복 횟수> <find_by_key에 쓸 search_key>
+    """
+    from repositories.repository_factory import create_search_repository
+
+    path, backend, operation, repeat, sample_key = sys.argv[1:6]
+    base_rss = peak_rss_mib()
+    repository = create_search_repository(path, backend)
+    calls = {
+        "load": lambda i: repository.load(),
+        "get_all_keys": lambda i: repository.get_all_keys(),
+        "find_by_key": lambda i: repository.find_by_key(sample_key),
+        "get_trending_keywords": lambda i: repository.get_trending_keywords(hours=24, limit=10),
+        "get_all_as_csv": lambda i: repository.get_all_as_csv(),
+        "save": lambda i: repository.save(make_search_result(seed=i)),
+    }
+
+    timings = []
+    result = None
+    for i in range(int(repeat)):
+        start = time.perf_counter()
+        result = calls[operation](i)
+        timings.append(time.perf_counter() - start)
+
+    print(json.dumps({
+        "cold_s": timings[0],
+        "warm_s": statistics.median(timings[1:]) if len(timings) > 1 else None,
+        "base_rss_mib": base_rss,
+        "peak_rss_mib": peak_rss_mib(),
+        # 연산이 실제로 일을 했는지 확인용 (행 수, 키 수, 찾았는지, 저장 성공 여부 등)
+        "result_size": len(result) if hasattr(result, "__len__") else int(result is not None and result is not False),
+    }))
+
+def seed_backend(backend: str, source_csv: str, path: str):
+    """
+    합성 CSV를 저장소에 채웁니다. 각 저장소의 이관 도구를 사용하며,
+    Parquet은 이관 도구가 없으므로 날짜 파티션별로 묶어 compact() 이후와 같은 형태의 파일로 씁니다.
+    (파일 이름은 이후 save()로 생기는 파일보다 앞에 정렬되도록 작은 번호를 사용)
+    """
+    from repositories.repository_factory import create_search_repository
+
+    if backend == "csv":
+        shutil.copy(source_csv, path)
+        shutil.copy(source_csv + ".meta.json", path + ".meta.json")
+        return
+    repository = create_search_repository(path, backend)
+    if backend in ("sqlite", "partitioned"):
+        repository.import_csv(source_csv)
+        return
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    chunks = pd.read_csv(source_csv, dtype={"search_time": str}, keep_default_na=False, chunksize=200_000)
+    for number, chunk in enumerate(chunks):
+        for day, part in chunk.groupby(chunk["search_time"].str[:10], sort=True):
+            part_dir = os.path.join(path, f"search_date={day}")
+            os.makedirs(part_dir, exist_ok=True)
+            table = pa.Table.from_pandas(part[repository.columns], schema=repository.schema, preserve_index=False)
+            pq.write_table(table, os.path.join(part_dir, f"part-{number:020d}-bench.parquet"))
+
+def remove_backend_files(path: str):
+    """
+    저장소 데이터와 부속 파일(<경로>-wal, <경로>.lock, <경로>.meta.json, <경로>.textidx 등)을 지웁니다.
+    """
+    if os.path.isdir(path):
+        shutil.rmtree(path, ignore_errors=True)
+        return
+    for name in glob.glob(glob.escape(path) + "*"):
+        os.remove(name)
+
+def run_operation(path: str, backend: str, operation: str, repeat: int, sample_key: str) -> Dict:
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD, path, backend, operation, str(repeat), sample_key],
+        capture_output=True, text=True, check=True, cwd=os.getcwd()
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+def environment() -> Dict:
+    """
+    결과를 비교할 때 필요한 실행 환경 정보(커밋, 버전, 플랫폼)를 모읍니다.
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    try:
+        import pyarrow
+        pyarrow_version = pyarrow.__version__
+    except ImportError:
+        pyarrow_version = None
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "pyarrow": pyarrow_version,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="저장소별 API 지연 시간/메모리 벤치마크")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000], help="합성 기사 행 수 (1만~500만, 여러 개 가능)")
+    parser.add_argument("--backends", nargs="+", choices=BACKENDS, default=list(BACKENDS))
+    parser.add_argument("--ops", nargs="+", choices=OPERATIONS, default=list(OPERATIONS))
+    parser.add_argument("--repeat", type=int, default=3, help="연산별 반복 횟수 (첫 호출 = cold, 나머지 중앙값 = warm)")
+    parser.add_argument("--days", type=int, default=90, help="합성 기록 기간(일)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workdir", default=None, help="데이터를 만들 디렉토리 (기본값: 임시 디렉토리, 종료 시 삭제)")
+    parser.add_argument("--output", default=None, help="결과를 JSON Lines로 이어 쓸 파일 경로")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    backends = list(args.backends)
+    if "parquet" in backends:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            print("[경고] pyarrow가 없어 parquet 저장소는 건너뜁니다. (uv sync --extra parquet)", file=sys.stderr)
+            backends.remove("parquet")
+    # save는 기록을 늘리므로 항상 마지막에 측정
+    operations = sorted(args.ops, key=OPERATIONS.index)
+
+    results: List[Dict] = []
+    datasets: List[Dict] = []
+    work_root = args.workdir or tempfile.mkdtemp(prefix="bench_repository_")
+    try:
+        for rows in args.rows:
+            data_dir = os.path.join(work_root, f"rows_{rows}")
+            os.makedirs(data_dir, exist_ok=True)
+            source_csv = os.path.join(data_dir, "source.csv")
+            start = time.perf_counter()
+            dataset = write_synthetic_csv(source_csv, rows, days=args.days, seed=args.seed)
+            dataset.update(generate_s=time.perf_counter() - start, file_mib=os.path.getsize(source_csv) / 1024 / 1024, seed_s={})
+            datasets.append(dataset)
+
+            for backend in backends:
+                path = os.path.join(data_dir, BACKEND_PATHS[backend])
+                start = time.perf_counter()
+                seed_backend(backend, source_csv, path)
+                dataset["seed_s"][backend] = time.perf_counter() - start
+                for operation in operations:
+                    measured = run_operation(path, backend, operation, args.repeat, dataset["sample_key"])
+                    results.append({"rows": dataset["rows"], "backend": backend, "op": operation, **measured})
+                    if not args.json:
+                        print(f"{dataset['rows']:>9,} rows {backend:<12} {operation:<22} "
+                              f"cold {measured['cold_s']:8.3f}s  warm {measured['warm_s'] or 0:8.3f}s  "
+                              f"peak RSS {measured['peak_rss_mib']:8.1f} MiB", flush=True)
+                # 다음 저장소를 채우기 전에 디스크 공간 확보
+                remove_backend_files(path)
+    finally:
+        if args.workdir is None:
+            shutil.rmtree(work_root, ignore_errors=True)
+
+    record = {
+        "benchmark": "bench_repository",
+        "environment": environment(),
+        "params": {"repeat": args.repeat, "days": args.days, "seed": args.seed},
+        "datasets": datasets,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    if args.json:
+        print(json.dumps(record, ensure_ascii=False, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+이전 스키마(v1, 8컬럼) 검색 기록 CSV를 현재 스키마로 변환하는 비용을 측정합니다.
+
+합성 v1 파일을 만든 뒤 별도 프로세스에서
+- streaming: repositories.schema_migration.migrate_csv (행 묶음 단위 스트리밍)
+- full: 파일 전체를 DataFrame으로 읽어 다시 쓰는 기존 방식
+을 실행하여 소요 시간과 최대 메모리(RSS)를 비교합니다. 파일 크기를 키워도 streaming의 메모리는 거의 늘지 않아야 합니다.
+
+실행: uv run python -m benchmarks.bench_schema_migration --rows 200000 400000
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+from typing import Dict
+import numpy as np
+import pandas as pd
+from repositories.schema_migration import SCHEMA_COLUMNS
+
+CHILD = """
+import sys, time, json, resource
+import pandas as pd
+from repositories.schema_migration import SCHEMA_COLUMNS, migrate_csv
+path, mode = sys.argv[1], sys.argv[2]
+start = time.perf_counter()
+if mode == "streaming":
+    migrate_csv(path)
+else:
+    df = pd.read_csv(path)
+    df["related_keywords"] = None
+    df[SCHEMA_COLUMNS[2]].to_csv(path, index=False, encoding="utf-8-sig")
+elapsed = time.perf_counter() - start
+peak_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({"elapsed_s": elapsed, "peak_rss_mib": peak_kib / 1024}))
+"""
+
+def make_v1_csv(path: str, rows: int, seed: int = 7):
+    """
+    기사 제목/스니펫/요약이 들어 있는 합성 v1 CSV를 만듭니다. (검색 1건당 기사 5개)
+    """
+    rng = np.random.default_rng(seed)
+    written = 0
+    with open(path, "w", encoding="utf-8-sig", newline="") as f:
+        f.write(",".join(SCHEMA_COLUMNS[1]) + "\n")
+        while written < rows:
+            n = min(50_000, rows - written)
+            idx = np.arange(written, written + n)
+            searches = idx // 5
+            df = pd.DataFrame({
+                "search_key": [f"키워드{s % 97}-2026{(s % 12) + 1:02d}01{s % 24:02d}{s % 60:02d}" for s in searches],
+                "search_time": "2026-10-18 09:00:00",
+                "keyword": [f"키워드{s % 97}" for s in searches],
+                "article_index": idx % 5 + 1,
+                "title": [f"기사 제목 {i}, \"인용\"" for i in idx],
+                "url": [f"https://news.example.com/{i}" for i in idx],
+                "snippet": ["본문 요약 " * int(k) for k in rng.integers(5, 30, n)],
+                "ai_summary": ["AI 요약\n둘째 줄"] * n,
+            })
+            df.to_csv(f, index=False, header=False, lineterminator="\n")
+            written += n
+
+def run(path: str, mode: str) -> Dict:
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD, path, mode],
+        capture_output=True, text=True, check=True, cwd=os.getcwd()
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description="CSV 스키마 이관 벤치마크")
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 400_000], help="합성 기사 행 수 (여러 개 가능)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for rows in args.rows:
+            source = os.path.join(tmp_dir, f"v1_{rows}.csv")
+            make_v1_csv(source, rows)
+            size_mib = os.path.getsize(source) / 1024 / 1024
+            for mode in ("streaming", "full"):
+                target = os.path.join(tmp_dir, f"{mode}_{rows}.csv")
+                shutil.copy(source, target)
+                results.append({"rows": rows, "file_mib": size_mib, "mode": mode, **run(target, mode)})
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+    for r in results:
+        print(f"{r['rows']:>9,} rows ({r['file_mib']:7.1f} MiB) {r['mode']:<9} "
+              f"{r['elapsed_s']:6.2f}s  peak RSS {r['peak_rss_mib']:7.1f} MiB")
+
+if __name__ == "__main__":
+    main()
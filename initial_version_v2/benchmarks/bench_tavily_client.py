@@ -0,0 +1,111 @@
+"""
+Tavily 검색 호출의 연결 재사용 효과를 로컬 HTTPS 스텁 서버로 측정합니다.
+
+- per-call: 기존 search_news처럼 검색마다 클라이언트를 새로 만듦 (매번 TCP 연결 + TLS 핸드셰이크)
+- pooled: services.tavily_client.TavilyHttpClient 하나를 공유 (keep-alive 연결 재사용)
+
+순차 호출의 지연 시간 분포(p50/p95)와, 여러 스레드(동시 Streamlit 세션)가 같은 클라이언트를 쓸 때의
+처리 시간/실패 수, 그리고 서버가 받은 연결 수를 비교합니다. pooled의 연결 수는 호출 수와 무관하게
+동시에 요청한 수(최대 pool_size) 정도에 머물러야 합니다.
+
+실행: uv run python -m benchmarks.bench_tavily_client --requests 200 --threads 8
+"""
+import os
+import json
+import time
+import argparse
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+from benchmarks.tavily_stub import StubServer
+from services.tavily_client import TavilyHttpClient
+
+def make_search(mode: str, base_url: str, pool_size: int) -> Callable[[str], Dict]:
+    """
+    모드에 맞는 검색 함수를 만듭니다.
+    """
+    if mode == "pooled":
+        client = TavilyHttpClient("stub-key", base_url=base_url, pool_size=pool_size)
+        return lambda query: client.search(query, search_depth="advanced", topic="news", max_results=20)
+
+    def per_call(query: str) -> Dict:
+        client = TavilyHttpClient("stub-key", base_url=base_url, pool_size=pool_size)
+        try:
+            return client.search(query, search_depth="advanced", topic="news", max_results=20)
+        finally:
+            client.close()
+    return per_call
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+def bench_mode(server: StubServer, mode: str, requests: int, threads: int, pool_size: int) -> Dict:
+    """
+    한 모드의 순차 호출 지연 시간과 동시 호출 처리 시간을 측정합니다.
+    """
+    search = make_search(mode, server.base_url, pool_size)
+    server.stats.reset()
+    latencies = []
+    for i in range(requests):
+        start = time.perf_counter()
+        search(f"반도체 {i % 10}")
+        latencies.append((time.perf_counter() - start) * 1000)
+    sequential_connections = server.stats.connections
+
+    server.stats.reset()
+    errors = 0
+
+    def worker(i: int) -> bool:
+        try:
+            return len(search(f"금리 {i % 10}")["results"]) == 20
+        except Exception:
+            return False
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        errors = sum(1 for ok in executor.map(worker, range(requests)) if not ok)
+    concurrent_s = time.perf_counter() - start
+
+    return {
+        "mode": mode,
+        "requests": requests,
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": percentile(latencies, 0.95),
+        "mean_ms": statistics.fmean(latencies),
+        "sequential_connections": sequential_connections,
+        "threads": threads,
+        "concurrent_s": concurrent_s,
+        "concurrent_connections": server.stats.connections,
+        "concurrent_errors": errors,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Tavily 클라이언트 연결 재사용 벤치마크")
+    parser.add_argument("--requests", type=int, default=200, help="모드별 호출 수")
+    parser.add_argument("--threads", type=int, default=8, help="동시 호출 스레드 수")
+    parser.add_argument("--pool-size", type=int, default=10)
+    parser.add_argument("--response-delay-ms", type=float, default=0, help="스텁 서버의 응답 지연 (검색 처리 시간 모사)")
+    parser.add_argument("--no-tls", action="store_true", help="HTTPS 대신 HTTP로 측정")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    with StubServer(tls=not args.no_tls, response_delay_ms=args.response_delay_ms) as server:
+        if server.cert_path:
+            os.environ["REQUESTS_CA_BUNDLE"] = server.cert_path
+        results = [
+            bench_mode(server, mode, args.requests, args.threads, args.pool_size)
+            for mode in ("per-call", "pooled")
+        ]
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+    for r in results:
+        print(f"{r['mode']:<9} sequential p50 {r['p50_ms']:6.2f} ms  p95 {r['p95_ms']:6.2f} ms  "
+              f"connections {r['sequential_connections']:>4} / {r['requests']}  |  "
+              f"{r['threads']} threads {r['concurrent_s']:6.2f}s  connections {r['concurrent_connections']:>4}  "
+              f"errors {r['concurrent_errors']}")
+
+if __name__ == "__main__":
+    main()
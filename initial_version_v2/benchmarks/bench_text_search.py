@@ -0,0 +1,122 @@
+"""
+검색 기록 전문 검색(TextIndex) 벤치마크입니다.
+
+한국어 뉴스 제목/스니펫 형태의 합성 기사를 만든 뒤
+색인 구축 시간, 색인 로그 크기, 로그에서 다시 읽는 시간(프로세스 재시작 가정),
+검색어별 조회 지연(p50/p95)을 측정합니다.
+
+실행: uv run python -m benchmarks.bench_text_search --articles 1000000
+"""
+import os
+import json
+import time
+import argparse
+import tempfile
+from typing import Dict, List
+import numpy as np
+import pandas as pd
+from repositories.text_index import TextIndex
+
+ARTICLES_PER_SEARCH = 5
+
+SUBJECTS = [
+    "삼성전자", "SK하이닉스", "현대차", "카카오", "네이버", "LG에너지솔루션", "셀트리온", "포스코",
+    "한국은행", "금융위원회", "국토교통부", "기획재정부", "서울시", "부산시", "국회", "대통령실",
+    "OpenAI", "엔비디아", "테슬라", "애플", "구글", "마이크로소프트", "TSMC", "인텔",
+]
+TOPICS = [
+    "반도체", "실적", "주가", "금리", "부동산", "환율", "전기차", "배터리", "인공지능", "수출",
+    "물가", "고용", "규제", "투자", "인수합병", "노사", "파업", "태풍", "폭염", "선거",
+    "예산", "세제", "개편", "신제품", "출시", "리콜", "소송", "보안", "해킹", "데이터센터",
+]
+PREDICATES = [
+    "발표", "급등", "급락", "전망", "우려", "확대", "축소", "논란", "합의", "추진",
+    "연기", "검토", "강화", "완화", "돌파", "역대 최대", "하락 전환", "반등", "기대감", "경고",
+]
+
+def make_articles(count: int, seed: int = 7) -> pd.DataFrame:
+    """
+    TEXT_INDEX_COLUMNS 형식의 합성 기사를 만듭니다. (검색 1건당 기사 ARTICLES_PER_SEARCH개, 요약은 검색 단위로 공유)
+    """
+    rng = np.random.default_rng(seed)
+    subjects = np.array(SUBJECTS)[rng.integers(0, len(SUBJECTS), count)]
+    topics = np.array(TOPICS)[rng.zipf(1.3, count) % len(TOPICS)]
+    topics2 = np.array(TOPICS)[rng.integers(0, len(TOPICS), count)]
+    predicates = np.array(PREDICATES)[rng.integers(0, len(PREDICATES), count)]
+
+    titles = [f"{s} {t} {p}" for s, t, p in zip(subjects, topics, predicates)]
+    snippets = [
+        f"{s}이(가) {t} 관련 {t2} 계획을 {p}했다. 업계에서는 {t2} 시장에 미칠 영향을 주시하고 있다."
+        for s, t, t2, p in zip(subjects, topics, topics2, predicates)
+    ]
+    searches = (count + ARTICLES_PER_SEARCH - 1) // ARTICLES_PER_SEARCH
+    summaries = np.repeat([f"요약: {TOPICS[i % len(TOPICS)]} 이슈 정리" for i in range(searches)], ARTICLES_PER_SEARCH)[:count]
+    keys = np.repeat([f"검색{i}-202610180000" for i in range(searches)], ARTICLES_PER_SEARCH)[:count]
+
+    return pd.DataFrame({
+        "search_key": keys,
+        "article_index": np.tile(np.arange(1, ARTICLES_PER_SEARCH + 1), searches)[:count],
+        "title": titles,
+        "snippet": snippets,
+        "ai_summary": summaries,
+    })
+
+def percentile_ms(samples: List[float], q: float) -> float:
+    return float(np.percentile(samples, q) * 1000)
+
+def main():
+    parser = argparse.ArgumentParser(description="전문 검색 색인 벤치마크")
+    parser.add_argument("--articles", type=int, default=200_000, help="합성 기사 수")
+    parser.add_argument("--repeat", type=int, default=20, help="검색어별 반복 횟수")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    df = make_articles(args.articles)
+    keys = df["search_key"]
+    queries = ["삼성전자 반도체", "금리", "전기차 배터리 투자", "엔비디아 데이터센터", "역대 최대 수출", "openai"]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        log_path = os.path.join(tmp_dir, "history.csv.textidx")
+
+        start = time.perf_counter()
+        index = TextIndex(log_path)
+        index.sync(len(df), lambda i: keys.iat[i], lambda a, b: df.iloc[a:b])
+        build_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        reloaded = TextIndex(log_path)
+        reloaded.sync(len(df), lambda i: keys.iat[i], lambda a, b: df.iloc[a:b])
+        reload_s = time.perf_counter() - start
+
+        latencies: Dict[str, Dict] = {}
+        for query in queries:
+            index.search(query)  # 토큰 배열 캐시 준비
+            samples = []
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                hits = index.search(query, limit=20)
+                samples.append(time.perf_counter() - start)
+            latencies[query] = {
+                "p50_ms": percentile_ms(samples, 50),
+                "p95_ms": percentile_ms(samples, 95),
+                "hits": len(hits),
+            }
+
+        results = {
+            "articles": len(df),
+            "build_s": build_s,
+            "reload_s": reload_s,
+            "log_mib": os.path.getsize(log_path) / 1024 / 1024,
+            "queries": latencies,
+        }
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+
+    print(f"articles={results['articles']:,}  build {build_s:.1f}s  reload {reload_s:.1f}s  log {results['log_mib']:.1f} MiB")
+    for query, r in latencies.items():
+        print(f"{query:<20} p50 {r['p50_ms']:7.2f} ms | p95 {r['p95_ms']:7.2f} ms | hits {r['hits']}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+인기 검색어 집계 방식별 성능/정확도 벤치마크입니다.
+
+키워드 분포가 긴 꼬리(Zipf)를 갖는 합성 검색 기록을 메모리에 만든 뒤,
+pandas 정확 집계(count_keywords_exact) / 시간 버킷 정확 집계(exact) / Space-Saving 근사 집계(approx)의
+구축 시간, 조회 시간, 집계기 메모리, 상위 키워드 일치율을 비교합니다.
+
+실행: uv run python -m benchmarks.bench_trending --rows 2000000 --capacity 1000
+"""
+import argparse
+import json
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import Dict
+import numpy as np
+import pandas as pd
+from repositories.trending_counter import TrendingCounter, count_keywords_exact
+
+ARTICLES_PER_SEARCH = 5
+
+def make_history(rows: int, days: int = 7, zipf_a: float = 1.2, seed: int = 42) -> pd.DataFrame:
+    """
+    search_key, search_time, keyword 컬럼만 가진 Long format 합성 기록을 만듭니다.
+    (검색 1건당 기사 ARTICLES_PER_SEARCH행, 키워드는 Zipf 분포로 긴 꼬리를 가짐)
+    """
+    rng = np.random.default_rng(seed)
+    searches = max(1, rows // ARTICLES_PER_SEARCH)
+    now = datetime.now()
+    offsets = rng.integers(0, days * 24 * 3600, size=searches)
+    times = pd.Series(pd.Timestamp(now) - pd.to_timedelta(offsets, unit="s")).dt.strftime("%Y-%m-%d %H:%M:%S")
+    keyword_ids = rng.zipf(zipf_a, size=searches)
+    keywords = pd.Series(keyword_ids).map(lambda n: f"키워드{n}")
+
+    return pd.DataFrame({
+        "search_key": np.repeat([f"s{i}" for i in range(searches)], ARTICLES_PER_SEARCH),
+        "search_time": np.repeat(times.to_numpy(), ARTICLES_PER_SEARCH),
+        "keyword": np.repeat(keywords.to_numpy(), ARTICLES_PER_SEARCH),
+    })
+
+def bench_counter(df: pd.DataFrame, mode: str, capacity: int, hours: int, limit: int) -> Dict:
+    """
+    TrendingCounter 구축/조회 시간과 구축 후 유지되는 메모리를 측정합니다.
+    """
+    start = time.perf_counter()
+    counter = TrendingCounter(mode=mode, sketch_capacity=capacity)
+    counter.add_rows(df)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    top = counter.top(hours=hours, limit=limit)
+    query = time.perf_counter() - start
+
+    # 메모리는 tracemalloc 오버헤드가 시간 측정에 섞이지 않도록 따로 측정
+    tracemalloc.start()
+    measured = TrendingCounter(mode=mode, sketch_capacity=capacity)
+    measured.add_rows(df)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {"build_s": build, "query_s": query, "retained_bytes": retained, "top": top}
+
+def main():
+    parser = argparse.ArgumentParser(description="인기 검색어 집계 벤치마크")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="합성 기록 행 수")
+    parser.add_argument("--hours", type=int, default=24)
+    parser.add_argument("--limit", type=int, default=12)
+    parser.add_argument("--capacity", type=int, default=1000, help="approx 모드 버킷당 추적 키워드 수")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    df = make_history(args.rows)
+    distinct = df["keyword"].nunique()
+
+    start = time.perf_counter()
+    exact_top = count_keywords_exact(df, hours=args.hours, limit=args.limit)
+    pandas_s = time.perf_counter() - start
+
+    results = {
+        "rows": len(df),
+        "distinct_keywords": int(distinct),
+        "pandas_exact_s": pandas_s,
+        "exact": bench_counter(df, "exact", args.capacity, args.hours, args.limit),
+        "approx": bench_counter(df, "approx", args.capacity, args.hours, args.limit),
+    }
+    for mode in ("exact", "approx"):
+        top = results[mode].pop("top")
+        results[mode]["top_k_recall"] = len(set(top) & set(exact_top)) / max(1, len(exact_top))
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+
+    print(f"rows={results['rows']:,}  distinct_keywords={distinct:,}  capacity={args.capacity}")
+    print(f"pandas exact : {pandas_s * 1000:9.1f} ms / query")
+    for mode in ("exact", "approx"):
+        r = results[mode]
+        print(
+            f"{mode:<13}: build {r['build_s'] * 1000:9.1f} ms | query {r['query_s'] * 1000:7.2f} ms | "
+            f"memory {r['retained_bytes'] / 1024 / 1024:7.1f} MiB | top-{args.limit} recall {r['top_k_recall']:.2f}"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+검색 기록 CSV 로더의 타입 지정 전/후 파싱 비용과 메모리를 비교합니다.
+
+합성 기록 CSV(검색 1건당 기사 5행)를 만든 뒤 별도 프로세스에서
+- before: 기존 방식 (pd.read_csv 기본값, 모든 컬럼이 문자열/object)
+- typed-c: parse_history_csv를 pandas C 엔진으로 실행 (pyarrow 미설치 환경)
+- typed-arrow: parse_history_csv를 pyarrow CSV 리더로 실행 (pyarrow 설치 시)
+로 읽어 파싱 시간, DataFrame 메모리(deep, 전체 / 타입을 지정한 4개 컬럼), 최대 RSS, 그리고 search_time을 쓰는 후속 집계
+(count_keywords_exact, TrendingCounter 구축) 시간을 측정합니다.
+
+실행: uv run python -m benchmarks.bench_typed_load --rows 500000 1000000
+"""
+import os
+import sys
+import json
+import argparse
+import tempfile
+import subprocess
+from datetime import datetime
+from typing import Dict
+import numpy as np
+import pandas as pd
+from repositories.schema_migration import SCHEMA_COLUMNS, CURRENT_SCHEMA_VERSION
+
+ARTICLES_PER_SEARCH = 5
+
+CHILD = """
+import io, sys, time, json, resource
+import pandas as pd
+import repositories.history_frame as history_frame
+from repositories.trending_counter import TrendingCounter, count_keywords_exact
+path, mode = sys.argv[1], sys.argv[2]
+with open(path, "rb") as f:
+    data = f.read()
+if mode == "typed-c":
+    history_frame.pa = None
+start = time.perf_counter()
+if mode == "before":
+    df = pd.read_csv(io.BytesIO(data), encoding="utf-8-sig")
+else:
+    df = history_frame.parse_history_csv(data)
+parse_s = time.perf_counter() - start
+frame_mib = df.memory_usage(deep=True).sum() / 1024 / 1024
+typed_mib = df[list(history_frame.HISTORY_DTYPES) + history_frame.STRING_COLUMNS].memory_usage(deep=True).sum() / 1024 / 1024
+start = time.perf_counter()
+count_keywords_exact(df, hours=24 * 365, limit=10)
+exact_s = time.perf_counter() - start
+start = time.perf_counter()
+TrendingCounter(retention_hours=24 * 365).add_rows(df)
+counter_s = time.perf_counter() - start
+peak_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({"parse_s": parse_s, "frame_mib": frame_mib, "typed_cols_mib": typed_mib, "peak_rss_mib": peak_kib / 1024,
+                  "exact_s": exact_s, "counter_s": counter_s}))
+"""
+
+def make_history_csv(path: str, rows: int, keywords: int = 500, seed: int = 42):
+    """
+    현재 스키마의 합성 검색 기록 CSV를 만듭니다. (최근 30일, 검색 1건당 기사 ARTICLES_PER_SEARCH행)
+    """
+    rng = np.random.default_rng(seed)
+    now = datetime.now().replace(microsecond=0)
+    written = 0
+    with open(path, "w", encoding="utf-8-sig", newline="") as f:
+        f.write(",".join(SCHEMA_COLUMNS[CURRENT_SCHEMA_VERSION]) + "\n")
+        while written < rows:
+            n = min(50_000, rows - written)
+            idx = np.arange(written, written + n)
+            searches = idx // ARTICLES_PER_SEARCH
+            offsets = rng.integers(0, 30 * 24 * 3600, size=n)
+            times = pd.Series(pd.Timestamp(now) - pd.to_timedelta(offsets, unit="s")).dt.strftime("%Y-%m-%d %H:%M:%S")
+            df = pd.DataFrame({
+                "search_key": [f"01JAB{s:021d}" for s in searches],
+                "search_time": times.to_numpy(),
+                "keyword": [f"키워드{s % keywords}" for s in searches],
+                "article_index": idx % ARTICLES_PER_SEARCH + 1,
+                "title": [f"기사 제목 {i}" for i in idx],
+                "url": [f"https://news.example.com/{i}" for i in idx],
+                "snippet": ["본문 요약 " * int(k) for k in rng.integers(5, 20, n)],
+                "ai_summary": "AI 요약",
+                "related_keywords": "연관1|연관2",
+            })
+            df.to_csv(f, index=False, header=False, lineterminator="\n")
+            written += n
+
+def run(path: str, mode: str) -> Dict:
+    out = subprocess.run(
+        [sys.executable, "-c", CHILD, path, mode],
+        capture_output=True, text=True, check=True, cwd=os.getcwd()
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description="타입 지정 CSV 로더 벤치마크")
+    parser.add_argument("--rows", type=int, nargs="+", default=[500_000], help="합성 기사 행 수 (여러 개 가능)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    try:
+        import pyarrow  # noqa: F401
+        modes = ("before", "typed-c", "typed-arrow")
+    except ImportError:
+        modes = ("before", "typed-c")
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for rows in args.rows:
+            path = os.path.join(tmp_dir, f"history_{rows}.csv")
+            make_history_csv(path, rows)
+            size_mib = os.path.getsize(path) / 1024 / 1024
+            for mode in modes:
+                results.append({"rows": rows, "file_mib": size_mib, "mode": mode, **run(path, mode)})
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+    for r in results:
+        print(f"{r['rows']:>9,} rows ({r['file_mib']:6.1f} MiB) {r['mode']:<11} "
+              f"parse {r['parse_s']:5.2f}s  frame {r['frame_mib']:7.1f} MiB (typed cols {r['typed_cols_mib']:6.1f})  peak RSS {r['peak_rss_mib']:7.1f} MiB  "
+              f"exact {r['exact_s']:5.2f}s  counter {r['counter_s']:5.2f}s")
+
+if __name__ == "__main__":
+    main()
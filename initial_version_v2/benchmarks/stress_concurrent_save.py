@@ -0,0 +1,225 @@
+"""
+여러 스레드/프로세스가 같은 검색 기록 파일에 동시에 저장하는 스트레스 테스트입니다.
+
+모든 작업자가 동시에 save()를 반복하는 동안 읽기 스레드가 load()를 반복하여
+읽은 행 수가 줄어들지 않는지(쓰는 중인 행을 읽다 실패하지 않는지) 확인하고,
+끝난 뒤 파일을 처음부터 다시 읽어 헤더가 한 번만 있는지,
+잘린 행이나 섞인 행 없이 모든 검색이 기사 수만큼 남아 있는지 확인합니다.
+하나라도 어긋나면 종료 코드 1을 반환합니다.
+
+실행: uv run python -m benchmarks.stress_concurrent_save --mode process --workers 8 --saves 200
+      uv run python -m benchmarks.stress_concurrent_save --mode thread --workers 32 --batch-ms 20
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import threading
+import multiprocessing
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+import pandas as pd
+from domain.news_article import NewsArticle
+from domain.search_result import SearchResult
+from repositories.repository_factory import create_search_repository
+from repositories.write_coordinator import write_coordinator
+
+ARTICLES_PER_SEARCH = 5
+
+def make_result(worker: int, seq: int) -> SearchResult:
+    """
+    작업자/순번별로 고유한 search_key를 갖는 검색 결과를 만듭니다.
+    (쉼표, 따옴표, 줄바꿈이 든 필드로 CSV 인용 처리까지 함께 확인)
+    """
+    search_time = datetime.now() - timedelta(seconds=seq)
+    keyword = f"키워드{seq % 17}"
+    articles = [
+        NewsArticle(
+            title=f"제목 {worker}-{seq}-{i}, \"인용\"",
+            url=f"https://example.com/{worker}/{seq}/{i}",
+            snippet=f"본문 {worker}-{seq}-{i}\n둘째 줄 " + "가" * 200,
+        )
+        for i in range(ARTICLES_PER_SEARCH)
+    ]
+    return SearchResult(
+        search_key=f"w{worker}-s{seq}",
+        search_time=search_time,
+        keyword=keyword,
+        articles=articles,
+        ai_summary=f"요약 {worker}-{seq}",
+        related_keywords=["연관1", "연관2"],
+    )
+
+def run_worker(path: str, backend: str, worker: int, saves: int, batch_ms: int, start_event) -> int:
+    """
+    start_event가 켜지면 saves번 저장하고 실패한 저장 수를 반환합니다.
+    """
+    repository = create_search_repository(path, backend, write_batch_ms=batch_ms)
+    start_event.wait()
+    failures = 0
+    for seq in range(saves):
+        if not repository.save(make_result(worker, seq)):
+            failures += 1
+    return failures
+
+def _process_entry(path, backend, worker, saves, batch_ms, start_event, failures):
+    failures.put(run_worker(path, backend, worker, saves, batch_ms, start_event))
+
+def run_reader(path: str, backend: str, stop_event: threading.Event, observed: List[int]):
+    """
+    저장이 끝날 때까지 load()를 반복하여 매번 읽은 행 수를 기록합니다.
+    """
+    repository = create_search_repository(path, backend)
+    while not stop_event.is_set():
+        observed.append(len(repository.load(columns=["search_key"])))
+        time.sleep(0.005)
+
+def run_threads(path: str, backend: str, workers: int, saves: int, batch_ms: int) -> Tuple[int, float]:
+    start_event = threading.Event()
+    failures: List[int] = []
+    threads = [
+        threading.Thread(
+            target=lambda w=w: failures.append(run_worker(path, backend, w, saves, batch_ms, start_event))
+        )
+        for w in range(workers)
+    ]
+    for t in threads:
+        t.start()
+    start = time.perf_counter()
+    start_event.set()
+    for t in threads:
+        t.join()
+    return sum(failures), time.perf_counter() - start
+
+def run_processes(path: str, backend: str, workers: int, saves: int, batch_ms: int) -> Tuple[int, float]:
+    ctx = multiprocessing.get_context("spawn")
+    start_event = ctx.Event()
+    failures = ctx.Queue()
+    procs = [
+        ctx.Process(target=_process_entry, args=(path, backend, w, saves, batch_ms, start_event, failures))
+        for w in range(workers)
+    ]
+    for p in procs:
+        p.start()
+    # spawn 프로세스가 모두 준비될 시간을 준 뒤 동시에 시작
+    time.sleep(1.0)
+    start = time.perf_counter()
+    start_event.set()
+    total = sum(failures.get() for _ in procs)
+    elapsed = time.perf_counter() - start
+    for p in procs:
+        p.join()
+    return total, elapsed
+
+def verify(path: str, backend: str, workers: int, saves: int) -> Dict:
+    """
+    저장된 파일을 캐시 없이 다시 읽어 정합성을 확인합니다.
+    """
+    if backend == "partitioned":
+        files = [
+            os.path.join(root, f) for root, _, names in os.walk(path) for f in names if f.endswith(".csv")
+        ]
+    else:
+        files = [path]
+
+    frames = []
+    for file_path in files:
+        with open(file_path, "r", encoding="utf-8-sig") as f:
+            header_lines = sum(1 for line in f if line.startswith("search_key,search_time"))
+        if header_lines != 1:
+            raise AssertionError(f"{file_path}: 헤더가 {header_lines}번 나타남")
+        # 잘리거나 섞인 행이 있으면 컬럼 수가 어긋나 여기서 오류가 발생
+        frames.append(pd.read_csv(file_path, encoding="utf-8-sig", on_bad_lines="error"))
+    df = pd.concat(frames, ignore_index=True)
+
+    expected_searches = workers * saves
+    per_key = df.groupby("search_key").size()
+    problems = {
+        "missing_searches": expected_searches - len(per_key),
+        "bad_article_counts": int((per_key != ARTICLES_PER_SEARCH).sum()),
+        "rows": len(df),
+        "expected_rows": expected_searches * ARTICLES_PER_SEARCH,
+    }
+    if problems["missing_searches"] or problems["bad_article_counts"] or problems["rows"] != problems["expected_rows"]:
+        raise AssertionError(f"정합성 불일치: {problems}")
+    return problems
+
+def main():
+    parser = argparse.ArgumentParser(description="동시 저장 스트레스 테스트")
+    parser.add_argument("--mode", choices=("thread", "process"), default="thread")
+    parser.add_argument("--backend", choices=("csv", "partitioned"), default="csv")
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--saves", type=int, default=100, help="작업자당 저장 횟수")
+    parser.add_argument("--batch-ms", type=int, default=0, help="저장 묶음 시간(밀리초), 0이면 묶지 않음")
+    parser.add_argument("--readers", type=int, default=2, help="저장 중 load()를 반복할 읽기 스레드 수")
+    parser.add_argument("--legacy", action="store_true",
+                        help="related_keywords가 없는 이전 스키마 파일에서 시작 (동시 스키마 업그레이드 확인)")
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if args.backend == "partitioned":
+            path = os.path.join(tmp_dir, "history") + os.sep
+        else:
+            path = os.path.join(tmp_dir, "search_history.csv")
+            if args.legacy:
+                with open(path, "w", encoding="utf-8-sig") as f:
+                    f.write("search_key,search_time,keyword,article_index,title,url,snippet,ai_summary\n")
+
+        stop_event = threading.Event()
+        observed: List[List[int]] = [[] for _ in range(args.readers)]
+        readers = [
+            threading.Thread(target=run_reader, args=(path, args.backend, stop_event, rows))
+            for rows in observed
+        ]
+        for t in readers:
+            t.start()
+
+        runner = run_processes if args.mode == "process" else run_threads
+        failures, elapsed = runner(path, args.backend, args.workers, args.saves, args.batch_ms)
+
+        stop_event.set()
+        for t in readers:
+            t.join()
+        # 읽은 행 수가 줄었다면 쓰는 중인 행을 읽다 실패(빈 결과)한 것
+        shrinks = sum(1 for rows in observed for a, b in zip(rows, rows[1:]) if b < a)
+
+        results = {
+            "mode": args.mode,
+            "backend": args.backend,
+            "workers": args.workers,
+            "saves": args.workers * args.saves,
+            "batch_ms": args.batch_ms,
+            "elapsed_s": elapsed,
+            "saves_per_s": args.workers * args.saves / elapsed,
+            "failed_saves": failures,
+            "reads": sum(len(rows) for rows in observed),
+            "read_shrinks": shrinks,
+        }
+        if args.mode == "thread":
+            stats = write_coordinator.stats()
+            results["flushes"] = sum(s["flushes"] for s in stats.values())
+
+        try:
+            results.update(verify(path.rstrip(os.sep), args.backend, args.workers, args.saves))
+            results["ok"] = failures == 0 and shrinks == 0
+        except AssertionError as e:
+            results["ok"] = False
+            results["error"] = str(e)
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+    else:
+        print(
+            f"{args.mode} x{args.workers} ({args.backend}, batch {args.batch_ms} ms): "
+            f"{results['saves']:,} saves in {elapsed:.2f}s ({results['saves_per_s']:,.0f}/s)"
+            + (f", {results['flushes']:,} flushes" if "flushes" in results else "")
+        )
+        print(f"{results['reads']:,} concurrent reads, {shrinks} shrinks")
+        print("OK" if results["ok"] else f"FAIL: {results.get('error', f'{failures} failed saves, {shrinks} shrinks')}")
+    sys.exit(0 if results["ok"] else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+벤치마크용 합성 검색 기록 생성기입니다.
+
+실제 기록과 비슷하도록
+- 키워드: 한국어 뉴스 키워드 조합, Zipf 분포 (소수 키워드에 검색이 몰리는 긴 꼬리)
+- 검색 시각: 최근 days일에 고르게 퍼진 시각을 오름차순으로 저장 (append 순서 = 시간 순서)
+- 검색 키: 검색 시각을 담은 26자 ULID 형식
+- 본문: 제목 20~60자, 스니펫 120~400자, AI 요약 300~600자의 한국어 문장
+을 만들어 현재 스키마의 Long format(기사 1건 = 1행) CSV로 씁니다. 같은 seed면 같은 기록을 만듭니다.
+"""
+from datetime import datetime
+from typing import Dict, Iterator, Optional
+import numpy as np
+import pandas as pd
+from domain.news_article import NewsArticle
+from domain.search_result import SearchResult
+from repositories.schema_migration import CURRENT_SCHEMA_VERSION, SCHEMA_COLUMNS, write_schema_stamp
+from utils.key_generator import CROCKFORD32, generate_search_key
+
+ARTICLES_PER_SEARCH = 5
+
+# 키워드 = 주제 + (선택) 수식어 조합
+TOPICS = [
+    "반도체", "금리", "환율", "부동산", "전기차", "배터리", "인공지능", "생성형 AI", "챗봇", "클라우드",
+    "삼성전자", "SK하이닉스", "카카오", "네이버", "현대차", "LG에너지솔루션", "코스피", "비트코인", "유가", "물가",
+    "수출", "고용", "저출산", "의대 정원", "기후변화", "태풍", "폭염", "올림픽", "K리그", "프로야구",
+    "아이돌", "넷플릭스", "웹툰", "게임", "스마트폰", "자율주행", "로봇", "우주항공", "원전", "수소",
+]
+MODIFIERS = ["", "", "", " 전망", " 실적", " 규제", " 정책", " 투자", " 논란", " 동향", " 수혜주", " 발표"]
+
+# 제목/스니펫/요약 문장을 잘라 쓰는 말뭉치
+CORPUS = (
+    "정부는 오늘 발표한 경제정책방향에서 올해 성장률 전망치를 소폭 하향 조정했다. "
+    "업계에서는 글로벌 수요 회복이 예상보다 늦어지면서 하반기 실적 개선 폭이 제한될 것이라는 관측이 나온다. "
+    "전문가들은 금리 인하 시점과 환율 변동성이 향후 투자 심리에 큰 영향을 줄 것으로 내다봤다. "
+    "한편 주요 기업들은 인공지능과 반도체 분야에 대한 설비 투자를 늘리겠다는 계획을 잇달아 내놓았다. "
+    "소비자 물가 상승률은 석 달 연속 둔화됐지만 체감 물가는 여전히 높은 수준이라는 지적이 많다. "
+    "이번 조치로 중소기업의 자금 조달 부담이 다소 줄어들 것으로 기대된다고 관계자는 설명했다. "
+    "시장에서는 외국인 순매수가 이어지며 지수가 장중 한때 연중 최고치를 경신하기도 했다. "
+    "지방자치단체들도 지역 경제 활성화를 위한 맞춤형 지원책을 마련해 시행에 들어갔다. "
+)
+
+def encode_ulids(times: pd.Series, rng: np.random.Generator) -> np.ndarray:
+    """
+    검색 시각 배열에 대해 ULID 형식 키(앞 10자 밀리초 타임스탬프 + 뒤 16자 난수)를 벡터 연산으로 만듭니다.
+    (utils.key_generator.generate_search_key와 같은 형식이며, 시각은 같은 방식으로 로컬 시각 기준)
+    """
+    local_offset_ms = int((datetime.fromtimestamp(0) - datetime(1970, 1, 1)).total_seconds() * 1000)
+    ms = times.to_numpy().astype("datetime64[ms]").astype(np.int64) - local_offset_ms
+    shifts = np.arange(9, -1, -1) * 5
+    time_digits = (ms[:, None] >> shifts) & 31
+    random_digits = rng.integers(0, 32, size=(len(ms), 16))
+    chars = np.array(list(CROCKFORD32))[np.concatenate([time_digits, random_digits], axis=1)]
+    return np.ascontiguousarray(chars).view("<U26").ravel()
+
+def _texts(rng: np.random.Generator, n: int, low: int, high: int) -> list:
+    """
+    말뭉치에서 임의 위치부터 low~high자를 잘라 n개의 문장을 만듭니다.
+    """
+    corpus = CORPUS * (high // len(CORPUS) + 2)
+    starts = rng.integers(0, len(CORPUS), size=n)
+    lengths = rng.integers(low, high + 1, size=n)
+    return [corpus[s:s + k] for s, k in zip(starts.tolist(), lengths.tolist())]
+
+def keyword_vocabulary() -> list:
+    """
+    주제 x 수식어 조합으로 만든 키워드 목록을 반환합니다. (Zipf 순위 1위부터)
+    """
+    vocabulary = []
+    for modifier in dict.fromkeys(MODIFIERS):
+        vocabulary.extend(topic + modifier for topic in TOPICS)
+    return vocabulary
+
+def iter_synthetic_history(
+    rows: int,
+    days: int = 90,
+    seed: int = 42,
+    chunk_searches: int = 10_000,
+    end: Optional[datetime] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    합성 검색 기록을 검색 시각 오름차순의 Long format DataFrame 조각으로 생성합니다.
+
+    Args:
+        rows (int): 만들 기사 행 수 (검색 1건당 ARTICLES_PER_SEARCH행)
+        days (int): 기록이 퍼져 있는 기간 (end 기준 최근 days일)
+        seed (int): 난수 시드
+        chunk_searches (int): 조각 하나에 담을 검색 수
+        end (datetime): 가장 최근 검색 시각 (기본값: 현재 시각)
+    """
+    rng = np.random.default_rng(seed)
+    searches = max(1, rows // ARTICLES_PER_SEARCH)
+    end = (end or datetime.now()).replace(microsecond=0)
+    offsets = np.sort(rng.integers(0, days * 24 * 3600, size=searches))[::-1]
+    vocabulary = np.array(keyword_vocabulary())
+
+    for first in range(0, searches, chunk_searches):
+        n = min(chunk_searches, searches - first)
+        times = pd.Series(pd.Timestamp(end) - pd.to_timedelta(offsets[first:first + n], unit="s"))
+        # 어휘 수를 넘는 순위는 나머지로 접어 긴 꼬리를 어휘 전체에 퍼뜨림
+        ranks = (rng.zipf(1.3, size=n) - 1) % len(vocabulary)
+        keywords = vocabulary[ranks]
+        related = ["|".join(vocabulary[rng.integers(0, len(vocabulary), size=3)]) for _ in range(n)]
+        summaries = _texts(rng, n, 300, 600)
+
+        article_rows = n * ARTICLES_PER_SEARCH
+        article_ids = np.arange(first * ARTICLES_PER_SEARCH, first * ARTICLES_PER_SEARCH + article_rows)
+        yield pd.DataFrame({
+            "search_key": np.repeat(encode_ulids(times, rng), ARTICLES_PER_SEARCH),
+            "search_time": np.repeat(times.dt.strftime("%Y-%m-%d %H:%M:%S").to_numpy(), ARTICLES_PER_SEARCH),
+            "keyword": np.repeat(keywords, ARTICLES_PER_SEARCH),
+            "article_index": np.tile(np.arange(1, ARTICLES_PER_SEARCH + 1), n),
+            "title": _texts(rng, article_rows, 20, 60),
+            "url": [f"https://news.example.co.kr/article/{i}" for i in article_ids.tolist()],
+            "snippet": _texts(rng, article_rows, 120, 400),
+            "ai_summary": np.repeat(summaries, ARTICLES_PER_SEARCH),
+            "related_keywords": np.repeat(related, ARTICLES_PER_SEARCH),
+        })
+
+def write_synthetic_csv(path: str, rows: int, days: int = 90, seed: int = 42) -> Dict:
+    """
+    합성 검색 기록을 현재 스키마 CSV로 쓰고 스키마 스탬프를 남깁니다.
+
+    Returns:
+        Dict: searches(검색 수), rows(기사 행 수), sample_key(기록 중간쯤의 search_key)
+    """
+    searches = 0
+    sample_key = None
+    middle = max(1, rows // ARTICLES_PER_SEARCH) // 2
+    with open(path, "w", encoding="utf-8-sig", newline="") as f:
+        f.write(",".join(SCHEMA_COLUMNS[CURRENT_SCHEMA_VERSION]) + "\n")
+        for chunk in iter_synthetic_history(rows, days=days, seed=seed):
+            chunk_searches = len(chunk) // ARTICLES_PER_SEARCH
+            if sample_key is None and searches + chunk_searches > middle:
+                sample_key = chunk["search_key"].iloc[(middle - searches) * ARTICLES_PER_SEARCH]
+            chunk.to_csv(f, index=False, header=False, lineterminator="\n")
+            searches += chunk_searches
+    write_schema_stamp(path)
+    return {"searches": searches, "rows": searches * ARTICLES_PER_SEARCH, "sample_key": sample_key}
+
+def make_search_result(seed: int = 0) -> SearchResult:
+    """
+    save() 측정용으로 현재 시각의 검색 결과 1건(기사 ARTICLES_PER_SEARCH개)을 만듭니다.
+    """
+    rng = np.random.default_rng(seed)
+    now = datetime.now()
+    vocabulary = keyword_vocabulary()
+    return SearchResult(
+        search_key=generate_search_key(now),
+        search_time=now,
+        keyword=vocabulary[int(rng.integers(0, len(vocabulary)))],
+        articles=[
+            NewsArticle(title=title, url=f"https://news.example.co.kr/bench/{now:%H%M%S%f}/{i}", snippet=snippet)
+            for i, (title, snippet) in enumerate(zip(_texts(rng, ARTICLES_PER_SEARCH, 20, 60),
+                                                     _texts(rng, ARTICLES_PER_SEARCH, 120, 400)))
+        ],
+        ai_summary=_texts(rng, 1, 300, 600)[0],
+        related_keywords=vocabulary[:3]
+    )
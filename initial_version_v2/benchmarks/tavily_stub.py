@@ -0,0 +1,140 @@
+"""
+벤치마크/동작 확인용 로컬 Tavily 스텁 서버입니다.
+
+POST /search 요청에 가짜 뉴스 결과를 JSON으로 돌려주며, 받은 요청 수와 새로 맺어진 연결 수를 셉니다.
+tls=True이면 임시 자체 서명 인증서(openssl 명령 필요)로 HTTPS를 제공하여 실제 API처럼 연결마다 TLS 핸드셰이크가 일어납니다.
+(클라이언트는 REQUESTS_CA_BUNDLE=<cert_path>로 인증서를 신뢰하게 함)
+"""
+import os
+import ssl
+import socket
+import json
+import time
+import tempfile
+import threading
+import subprocess
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+@dataclass
+class StubStats:
+    """
+    스텁 서버가 받은 요청 수와 연결 수입니다.
+    """
+    requests: int = 0
+    connections: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def add(self, requests: int = 0, connections: int = 0):
+        with self.lock:
+            self.requests += requests
+            self.connections += connections
+
+    def reset(self):
+        with self.lock:
+            self.requests = 0
+            self.connections = 0
+
+class _StubHandler(BaseHTTPRequestHandler):
+    # keep-alive 연결을 유지하려면 HTTP/1.1 + Content-Length가 필요
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        # 헤더와 본문을 따로 보내므로 Nagle 알고리즘이 지연 ACK와 맞물려 응답이 늦어지지 않도록 끔
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if isinstance(self.connection, ssl.SSLSocket):
+            # 핸드셰이크를 accept 스레드가 아니라 연결 처리 스레드에서 수행
+            self.connection.do_handshake()
+        self.server.stats.add(connections=1)
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        request = json.loads(body or b"{}")
+        self.server.stats.add(requests=1)
+        if self.server.response_delay:
+            time.sleep(self.server.response_delay)
+
+        if self.server.fail_status:
+            status, payload = self.server.fail_status, {"detail": {"error": "Stub failure."}}
+        elif self.headers.get("Authorization") != "Bearer stub-key":
+            status, payload = 401, {"detail": {"error": "Unauthorized: missing or invalid API key."}}
+        else:
+            status, payload = 200, {
+                "query": request.get("query", ""),
+                "results": [
+                    {
+                        "title": f"{request.get('query', '')} 관련 기사 {i}",
+                        "url": f"https://news.example.co.kr/stub/{i}",
+                        "content": "스텁 서버가 돌려준 기사 본문입니다. " * 5,
+                        "published_date": f"2026-10-{18 - i % 10:02d}",
+                    }
+                    for i in range(int(request.get("max_results", 5)))
+                ],
+            }
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+class StubServer:
+    """
+    백그라운드 스레드에서 실행되는 스텁 서버입니다. (with 문으로 사용)
+
+    Attributes:
+        base_url (str): 클라이언트에 넘길 기본 주소 (예: "https://127.0.0.1:54321")
+        cert_path (Optional[str]): TLS 사용 시 자체 서명 인증서 경로
+        stats (StubStats): 받은 요청/연결 수
+        fail_status (Optional[int]): 지정하면 모든 요청에 이 HTTP 상태 코드로 실패 응답 (오류 전달 확인용, 실행 중 변경 가능)
+    """
+    def __init__(self, tls: bool = True, response_delay_ms: float = 0):
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.stats = self.stats = StubStats()
+        self._httpd.response_delay = response_delay_ms / 1000
+        self._httpd.fail_status = None
+        self._tmp_dir = None
+        self.cert_path = None
+        if tls:
+            self._tmp_dir = tempfile.TemporaryDirectory()
+            self.cert_path = os.path.join(self._tmp_dir.name, "cert.pem")
+            key_path = os.path.join(self._tmp_dir.name, "key.pem")
+            subprocess.run(
+                ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+                 "-keyout", key_path, "-out", self.cert_path, "-subj", "/CN=localhost",
+                 "-addext", "subjectAltName=IP:127.0.0.1,DNS:localhost"],
+                check=True, capture_output=True
+            )
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            context.load_cert_chain(self.cert_path, key_path)
+            self._httpd.socket = context.wrap_socket(
+                self._httpd.socket, server_side=True, do_handshake_on_connect=False
+            )
+        scheme = "https" if tls else "http"
+        self.base_url = f"{scheme}://127.0.0.1:{self._httpd.server_address[1]}"
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def fail_status(self) -> Optional[int]:
+        return self._httpd.fail_status
+
+    @fail_status.setter
+    def fail_status(self, status: Optional[int]):
+        self._httpd.fail_status = status
+
+    def __enter__(self) -> "StubServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._tmp_dir is not None:
+            self._tmp_dir.cleanup()
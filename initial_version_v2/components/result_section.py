@@ -10,8 +10,11 @@ def render_summary(title: str, summary: str):
     # AI 요약 내용을 강조된 박스에 표시
     st.info(summary)
 
-def render_news_list(articles: List[NewsArticle]):
-    """뉴스 기사 리스트를 각 기사별 expander로 렌더링합니다."""
+def render_news_list(articles: List[NewsArticle], has_more: bool = False):
+    """
+    뉴스 기사 리스트를 각 기사별 expander로 렌더링합니다.
+    has_more가 True이면 목록 아래에 "더 보기" 버튼을 표시합니다.
+    """
     st.markdown("---")
     st.subheader("📰 최신 관련 뉴스")
     
@@ -37,6 +40,11 @@ def render_news_list(articles: List[NewsArticle]):
             else:
                 st.write("(URL 정보 없음)")
 
+    if has_more and st.button("더 보기", key="btn_load_more_news", width="stretch"):
+        # 클릭 시 다음 페이지 요청을 예약하고 화면 갱신 (받아 둔 결과가 있으면 API를 호출하지 않음)
+        st.session_state.pending_load_more = True
+        st.rerun()
+
 def render_related_keywords(keywords: List[str]):
     """
     연관 키워드를 가로 가변 버튼 리스트로 렌더링합니다.
@@ -1,6 +1,7 @@
 from typing import List, Optional
 import streamlit as st
 from datetime import datetime
+from utils.key_generator import search_key_time, split_legacy_key
 
 def render_sidebar_header():
     """사이드바 상단 제목과 소개를 렌더링합니다."""
@@ -60,13 +61,13 @@ def render_history_list(search_keys: List[str], keywords_map: dict = None) -> Op
     key_map = {}
     
     for key in search_keys:
-        try:
-            # keywords_map이 있으면 키워드를 가져오고, 없으면 키에서 추출
-            keyword = keywords_map.get(key) if keywords_map else key.rsplit('-', 1)[0]
-            ts_str = key.rsplit('-', 1)[1]
-            dt = datetime.strptime(ts_str, "%Y%m%d%H%M")
+        # keywords_map이 있으면 키워드를 가져오고, 없으면 이전 형식 키("키워드-yyyymmddhhmm")에서 추출
+        legacy = split_legacy_key(key)
+        keyword = keywords_map.get(key) if keywords_map else (legacy[0] if legacy else None)
+        dt = search_key_time(key)
+        if keyword and dt:
             display_str = f"{keyword} ({dt.strftime('%Y-%m-%d %H:%M')})"
-        except:
+        else:
             display_str = key
             
         options.append(display_str)
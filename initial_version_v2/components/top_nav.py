@@ -253,25 +253,17 @@ def render_nav_panels(repository, csv_data: str, is_empty: bool):
     elif menu == "history":
         st.markdown("<h3>📜 검색기록</h3>", unsafe_allow_html=True)
 
-        search_keys = repository.get_all_keys()
-        if not search_keys:
+        # 최근 15건만 조회 (전체 키 목록을 불러오지 않음)
+        entries = repository.list_history(page_size=15).entries
+        if not entries:
             st.markdown("<p>저장된 검색 기록이 없습니다.</p>", unsafe_allow_html=True)
         else:
-            keys = list(search_keys)[-15:][::-1]
             st.markdown('<div class="tt-history">', unsafe_allow_html=True)
 
-            for k in keys:
-                try:
-                    keyword = k.rsplit("-", 1)[0]
-                    ts_str = k.rsplit("-", 1)[1]
-                    dt = datetime.strptime(ts_str, "%Y%m%d%H%M")
-                    meta = dt.strftime("%Y-%m-%d %H:%M")
-                except Exception:
-                    keyword = k
-                    meta = ""
-
+            for entry in entries:
                 st.markdown(
-                    f'<a href="?history_key={k}"><div>{keyword}</div><div class="meta">{meta}</div></a>',
+                    f'<a href="?history_key={entry.search_key}"><div>{entry.keyword}</div>'
+                    f'<div class="meta">{entry.search_time[:16]}</div></a>',
                     unsafe_allow_html=True
                 )
 
@@ -1,4 +1,5 @@
 import streamlit as st
+import pandas as pd
 from typing import List
 
 def render_trending_section(keywords: List[str]):
@@ -22,3 +23,17 @@ def render_trending_section(keywords: List[str]):
                 # 클릭 시 검색어로 예약
                 st.session_state.pending_keyword = keyword
                 st.rerun()
+
+def render_keyword_trend(keyword: str, trend: pd.DataFrame):
+    """
+    검색 키워드의 일별 검색 수 추이를 막대 차트로 렌더링합니다. (기간 내 검색이 없으면 생략)
+
+    Args:
+        keyword (str): 검색 키워드
+        trend (pd.DataFrame): bucket(날짜), search_count(검색 수) 컬럼의 시계열
+    """
+    if trend.empty or not trend["search_count"].any():
+        return
+
+    st.caption(f"📈 '{keyword}' 최근 {len(trend)}일 검색 추이")
+    st.bar_chart(trend, x="bucket", y="search_count", x_label="", y_label="검색 수", height=160)
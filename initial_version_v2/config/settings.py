@@ -11,8 +11,36 @@ class Settings:
         load_dotenv()
         
         self.TAVILY_API_KEY = os.getenv("TAVILY_API_KEY")
+        # Tavily API 주소 (프록시/로컬 스텁 서버를 쓸 때만 변경)
+        self.TAVILY_API_BASE_URL = os.getenv("TAVILY_API_BASE_URL", "https://api.tavily.com")
+        # Tavily 연결 풀 크기(프로세스 전체에서 유지하는 keep-alive 연결 수)와 연결/응답 타임아웃(초)
+        self.TAVILY_POOL_SIZE = int(os.getenv("TAVILY_POOL_SIZE", "10"))
+        self.TAVILY_CONNECT_TIMEOUT = float(os.getenv("TAVILY_CONNECT_TIMEOUT", "5"))
+        self.TAVILY_READ_TIMEOUT = float(os.getenv("TAVILY_READ_TIMEOUT", "30"))
+        # 검색 결과 캐시: 최대 항목 수(0이면 사용 안 함), 기간 필터별 보관 시간(초),
+        # 디스크 캐시 SQLite 경로(비우면 메모리만 사용, 지정하면 같은 서버의 워커 프로세스끼리 공유)
+        self.SEARCH_CACHE_SIZE = int(os.getenv("SEARCH_CACHE_SIZE", "256"))
+        self.SEARCH_CACHE_TTL_24H = int(os.getenv("SEARCH_CACHE_TTL_24H", "300"))
+        self.SEARCH_CACHE_TTL_7D = int(os.getenv("SEARCH_CACHE_TTL_7D", "1800"))
+        self.SEARCH_CACHE_TTL_30D = int(os.getenv("SEARCH_CACHE_TTL_30D", "7200"))
+        self.SEARCH_CACHE_TTL_CUSTOM = int(os.getenv("SEARCH_CACHE_TTL_CUSTOM", "7200"))
+        self.SEARCH_CACHE_PATH = os.getenv("SEARCH_CACHE_PATH", "")
+        # 분할 검색(fan-out): "off" | "terms"(OR 검색어별 요청) | "domains"(도메인 카테고리별 요청)
+        # 나눈 요청은 최대 SEARCH_FANOUT_WORKERS개씩 동시에 보내고, SEARCH_FANOUT_DEADLINE(초) 안에 끝난 결과만 합침
+        self.SEARCH_FANOUT = os.getenv("SEARCH_FANOUT", "off")
+        self.SEARCH_FANOUT_WORKERS = int(os.getenv("SEARCH_FANOUT_WORKERS", "4"))
+        self.SEARCH_FANOUT_DEADLINE = float(os.getenv("SEARCH_FANOUT_DEADLINE", "15"))
         self.GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
         self.CSV_PATH = os.getenv("CSV_PATH")
+        # 저장소 종류: "csv" | "sqlite" | "parquet" | "partitioned" (비우면 CSV_PATH 형태로 판단)
+        self.STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "")
+        # 인기 검색어 집계 방식: "exact" | "approx" (approx: 버킷당 최대 TRENDING_SKETCH_CAPACITY개 키워드만 추적)
+        self.TRENDING_MODE = os.getenv("TRENDING_MODE", "exact")
+        self.TRENDING_SKETCH_CAPACITY = int(os.getenv("TRENDING_SKETCH_CAPACITY", "1000"))
+        # 저장 묶음 시간(밀리초): 0보다 크면 여러 세션의 저장 요청을 모아 한 번에 기록 (CSV 저장소)
+        self.WRITE_BATCH_MS = int(os.getenv("WRITE_BATCH_MS", "0"))
+        # Parquet 저장소: 한 날짜 파티션의 파일 수가 이 값에 이르면 저장 직후 하나로 합침 (0이면 끔)
+        self.PARQUET_COMPACT_FILES = int(os.getenv("PARQUET_COMPACT_FILES", "64"))
         self.GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
         self.SEARCH_DOMAINS = os.getenv("SEARCH_DOMAINS", "")
         self.YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
@@ -0,0 +1,30 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+@dataclass
+class HistoryEntry:
+    """
+    검색 기록 목록(list_history)의 항목 1건을 담는 데이터 클래스입니다.
+
+    Attributes:
+        search_key (str): 검색 결과의 고유 키
+        search_time (str): 검색 실행 시간 ("YYYY-MM-DD HH:MM:SS")
+        keyword (str): 당시 검색어
+        label (str): 목록에 바로 표시할 문자열 (예: "반도체 (2026-10-18 09:15)")
+    """
+    search_key: str   # 검색 결과 키
+    search_time: str  # 검색 실행 시간
+    keyword: str      # 검색 키워드
+    label: str        # 표시용 라벨
+
+@dataclass
+class HistoryPage:
+    """
+    최신순 검색 기록 목록의 한 페이지를 담는 데이터 클래스입니다.
+
+    Attributes:
+        entries (List[HistoryEntry]): 이 페이지의 항목들 (검색 시간 최신순)
+        next_cursor (Optional[str]): 다음 페이지 조회 시 넘길 커서 (마지막 페이지이면 None)
+    """
+    entries: List[HistoryEntry] = field(default_factory=list)  # 페이지 항목
+    next_cursor: Optional[str] = None                          # 다음 페이지 커서
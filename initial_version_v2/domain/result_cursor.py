@@ -0,0 +1,43 @@
+from dataclasses import dataclass, field
+from typing import List
+from .news_article import NewsArticle
+from .search_filters import SearchFilters
+
+@dataclass
+class ResultCursor:
+    """
+    한 검색 세션에서 받아 둔 검색 결과와 지금까지 보여준 위치를 담는 데이터 클래스입니다.
+    search_news는 정렬을 위해 표시할 개수보다 많이 받아 오므로, 남은 결과를 버리지 않고 보관했다가
+    "더 보기"에서 API 호출 없이 다음 페이지로 보여줍니다. (services/search_service.load_more_news 참고)
+
+    Attributes:
+        filters (SearchFilters): 검색 조건 (추가로 받아 올 때 다시 사용)
+        page_size (int): 한 번에 더 보여줄 기사 수
+        articles (List[NewsArticle]): 지금까지 받아 둔 전체 기사 (보여준 순서대로)
+        shown (int): 지금까지 보여준 기사 수
+        max_results (int): 마지막으로 API에 요청한 결과 수
+        exhausted (bool): API에서 더 받아 올 결과가 없는지 여부
+        fanout (str): 검색에 사용한 분할 검색 방식
+    """
+    filters: SearchFilters                                       # 검색 조건
+    page_size: int                                               # 페이지 크기
+    articles: List[NewsArticle] = field(default_factory=list)    # 받아 둔 기사
+    shown: int = 0                                               # 보여준 기사 수
+    max_results: int = 0                                         # 마지막 요청 결과 수
+    exhausted: bool = False                                      # 더 받아 올 결과 없음
+    fanout: str = "off"                                          # 분할 검색 방식
+
+    @property
+    def visible(self) -> List[NewsArticle]:
+        """지금까지 보여준 기사들을 반환합니다."""
+        return self.articles[:self.shown]
+
+    @property
+    def buffered(self) -> int:
+        """받아 두었지만 아직 보여주지 않은 기사 수를 반환합니다."""
+        return max(0, len(self.articles) - self.shown)
+
+    @property
+    def has_more(self) -> bool:
+        """더 보여줄 기사가 있거나 API에서 더 받아 올 수 있는지 여부를 반환합니다."""
+        return self.buffered > 0 or not self.exhausted
@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List
+from typing import Dict, List, Tuple
 import pandas as pd
 from .news_article import NewsArticle
 
@@ -10,13 +10,13 @@ class SearchResult:
     한 번의 검색 수행 결과와 AI 요약을 포함하는 데이터 클래스입니다.
     
     Attributes:
-        search_key (str): 검색 결과의 고유 키 (예: "키워드-YYYYMMDDHHMM")
+        search_key (str): 검색 결과의 고유 키 (시간순 정렬되는 26자 ULID, 이전 기록은 "키워드-YYYYMMDDHHMM")
         search_time (datetime): 검색이 실행된 실제 시간
         keyword (str): 사용자가 입력한 검색어
         articles (List[NewsArticle]): 검색된 뉴스 기사 객체들의 리스트
         ai_summary (str): AI가 생성한 핵심 요약 텍스트
     """
-    search_key: str              # PK, "키워드-yyyymmddhhmm" 형식
+    search_key: str              # PK, ULID 형식 (utils/key_generator 참고)
     search_time: datetime        # 검색 실행 시간
     keyword: str                 # 검색 키워드
     articles: List[NewsArticle]  # 뉴스 기사 리스트
@@ -59,3 +59,101 @@ class SearchResult:
             })
             
         return pd.DataFrame(data)
+
+    def to_records(self) -> Tuple[Dict, List[Dict]]:
+        """
+        검색 결과를 정규화 저장을 위해 검색 1건 레코드와 기사별 레코드로 분리합니다.
+        (요약/연관 키워드는 검색 레코드에 한 번만 담기고, 기사 레코드는 기사 정보만 가집니다.)
+        """
+        search_record = {
+            "search_key": self.search_key,
+            "search_time": self.search_time.strftime("%Y-%m-%d %H:%M:%S"),
+            "keyword": self.keyword,
+            "ai_summary": self.ai_summary,
+            "related_keywords": "|".join(self.related_keywords)
+        }
+        article_records = [
+            {
+                "article_index": i,
+                "title": article.title,
+                "url": article.url,
+                "snippet": article.snippet,
+                "pub_date": article.pub_date
+            }
+            for i, article in enumerate(self.articles, 1)
+        ]
+        return search_record, article_records
+
+    @classmethod
+    def from_records(cls, search_record: Dict, article_records: List[Dict]) -> "SearchResult":
+        """
+        to_records() 형식의 검색 레코드와 기사 레코드들로 SearchResult 객체를 복원합니다.
+        """
+        try:
+            search_time = datetime.strptime(str(search_record["search_time"]), "%Y-%m-%d %H:%M:%S")
+        except:
+            search_time = datetime.now()
+
+        rel_keywords_raw = search_record.get("related_keywords") or ""
+        related_keywords = [k.strip() for k in rel_keywords_raw.split("|") if k.strip()]
+
+        articles = [
+            NewsArticle(
+                title=record.get("title") or "",
+                url=record.get("url") or "",
+                snippet=record.get("snippet") or "",
+                pub_date=record.get("pub_date") or ""
+            )
+            for record in article_records
+        ]
+
+        return cls(
+            search_key=str(search_record["search_key"]),
+            search_time=search_time,
+            keyword=str(search_record["keyword"]),
+            articles=articles,
+            ai_summary=search_record.get("ai_summary") or "",
+            related_keywords=related_keywords
+        )
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> "SearchResult":
+        """
+        to_dataframe()의 Long format 행들(같은 search_key)을 SearchResult 객체로 복원합니다.
+        article_index가 0인 행은 기사 없이 기본 정보만 담은 레코드로 간주합니다.
+        """
+        # 첫 번째 행에서 기본 정보 추출
+        first_row = df.iloc[0]
+        
+        # 결측값은 한 번에 채우고, 기사가 있는 행(article_index > 0)만 컬럼 배열로 추출
+        has_article = pd.to_numeric(df["article_index"], errors="coerce").fillna(0).to_numpy() > 0
+        texts = df.loc[has_article, ["title", "url", "snippet"]].fillna("").astype(str)
+        articles = [
+            NewsArticle(title=title, url=url, snippet=snippet)
+            for title, url, snippet in zip(
+                texts["title"].tolist(), texts["url"].tolist(), texts["snippet"].tolist()
+            )
+        ]
+        
+        try:
+            raw_time = first_row["search_time"]
+            if isinstance(raw_time, pd.Timestamp):
+                # CSV 로더가 이미 datetime64로 변환한 경우
+                search_time = raw_time.to_pydatetime()
+            else:
+                search_time = datetime.strptime(str(raw_time), "%Y-%m-%d %H:%M:%S")
+        except:
+            search_time = datetime.now()
+            
+        # 연관 키워드 복원
+        rel_keywords_raw = str(first_row["related_keywords"]) if pd.notna(first_row.get("related_keywords")) else ""
+        related_keywords = [k.strip() for k in rel_keywords_raw.split("|") if k.strip()]
+
+        return cls(
+            search_key=str(first_row["search_key"]),
+            search_time=search_time,
+            keyword=str(first_row["keyword"]),
+            articles=articles,
+            ai_summary=str(first_row["ai_summary"]) if pd.notna(first_row["ai_summary"]) else "",
+            related_keywords=related_keywords
+        )
@@ -0,0 +1,25 @@
+from dataclasses import dataclass
+
+@dataclass
+class TextSearchHit:
+    """
+    저장된 검색 기록 전문 검색(search_text)의 결과 1건을 담는 데이터 클래스입니다.
+
+    Attributes:
+        search_key (str): 기사가 포함된 검색 결과의 고유 키
+        search_time (str): 검색 실행 시간 ("YYYY-MM-DD HH:MM:SS")
+        keyword (str): 당시 검색어
+        article_index (int): 검색 결과 내 기사 순번 (기사 없는 기록은 0)
+        title (str): 기사 제목
+        url (str): 기사 URL
+        snippet (str): 기사 스니펫
+        score (float): BM25 관련도 점수 (클수록 관련도 높음)
+    """
+    search_key: str      # 검색 결과 키
+    search_time: str     # 검색 실행 시간
+    keyword: str         # 검색 키워드
+    article_index: int   # 기사 순번
+    title: str           # 기사 제목
+    url: str             # 기사 URL
+    snippet: str         # 기사 스니펫
+    score: float         # 관련도 점수
@@ -0,0 +1,29 @@
+from datetime import datetime
+from typing import Iterable, Iterator, List, Optional
+import pandas as pd
+
+# 엑셀에서 한글이 깨지지 않도록 내보내기 파일 맨 앞에 붙이는 BOM
+UTF8_BOM = "\ufeff".encode("utf-8")
+
+def format_search_time(value: Optional[datetime]) -> Optional[str]:
+    """
+    기간 필터 값을 저장 형식("%Y-%m-%d %H:%M:%S") 문자열로 변환합니다. (None은 그대로)
+    """
+    return value.strftime("%Y-%m-%d %H:%M:%S") if value is not None else None
+
+def iter_csv_bytes(frames: Iterable[pd.DataFrame], columns: List[str]) -> Iterator[bytes]:
+    """
+    DataFrame 조각들을 순서대로 CSV 바이트 청크로 인코딩합니다.
+    첫 청크에만 BOM과 헤더를 붙이며, 조각이 하나도 없으면 아무것도 내보내지 않습니다.
+    """
+    first = True
+    for frame in frames:
+        if frame.empty:
+            continue
+        chunk = frame[columns].to_csv(
+            index=False, header=first, lineterminator="\n", date_format="%Y-%m-%d %H:%M:%S"
+        ).encode("utf-8")
+        if first:
+            chunk = UTF8_BOM + chunk
+            first = False
+        yield chunk
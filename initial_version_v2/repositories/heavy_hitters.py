@@ -0,0 +1,96 @@
+import heapq
+from typing import Dict, List, Tuple
+
+class SpaceSaving:
+    """
+    Space-Saving 알고리즘으로 빈도 상위 항목(heavy hitters)을 근사 집계하는 스케치입니다.
+    최대 capacity개 항목만 추적하므로 메모리 사용량이 서로 다른 키워드 수와 무관하게 고정됩니다.
+
+    오차 보장 (N = 지금까지 반영한 전체 가중치 합):
+        - 추적 중인 항목의 추정치는 실제 빈도보다 작지 않고, 최대 N / capacity 만큼 클 수 있습니다.
+        - 실제 빈도가 N / capacity 보다 큰 항목은 반드시 추적됩니다.
+
+    Attributes:
+        capacity (int): 추적할 최대 항목 수
+        total (int): 지금까지 반영한 전체 가중치 합
+    """
+    def __init__(self, capacity: int = 1000):
+        if capacity <= 0:
+            raise ValueError("capacity는 1 이상이어야 합니다.")
+        self.capacity = capacity
+        self.total = 0
+        self._counts: Dict[str, int] = {}
+        self._errors: Dict[str, int] = {}
+        # (count, item) 최소 힙 - 갱신된 항목은 새로 넣고 오래된 값은 꺼낼 때 건너뜀(lazy deletion)
+        self._heap: List[Tuple[int, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def update(self, item: str, weight: int = 1):
+        """
+        항목의 빈도를 weight만큼 증가시킵니다.
+        추적 목록이 가득 찬 상태에서 새 항목이 들어오면 최소 빈도 항목을 대체하고,
+        대체된 빈도를 새 항목의 오차로 기록합니다.
+        """
+        self.total += weight
+        if item in self._counts:
+            self._counts[item] += weight
+        elif len(self._counts) < self.capacity:
+            self._counts[item] = weight
+            self._errors[item] = 0
+        else:
+            min_item, min_count = self._pop_min()
+            del self._counts[min_item]
+            del self._errors[min_item]
+            self._counts[item] = min_count + weight
+            self._errors[item] = min_count
+
+        heapq.heappush(self._heap, (self._counts[item], item))
+        if len(self._heap) > 2 * self.capacity:
+            self._heap = [(count, key) for key, count in self._counts.items()]
+            heapq.heapify(self._heap)
+
+    def _pop_min(self) -> Tuple[str, int]:
+        """
+        현재 추적 중인 항목 중 빈도가 가장 작은 항목을 찾습니다. (힙의 오래된 값은 버림)
+        """
+        while True:
+            count, item = self._heap[0]
+            if self._counts.get(item) == count:
+                return item, count
+            heapq.heappop(self._heap)
+
+    def merge(self, other: "SpaceSaving"):
+        """
+        다른 스케치의 집계를 합칩니다. 합친 결과도 capacity개로 잘라내며,
+        오차 한계는 두 스케치의 전체 가중치 합 기준(N / capacity)으로 유지됩니다.
+        """
+        counts = dict(self._counts)
+        errors = dict(self._errors)
+        # 한쪽에만 있는 항목은 다른 쪽에서 최대 그 스케치의 최소 빈도만큼 놓쳤을 수 있음
+        self_min = min(self._counts.values()) if len(self._counts) >= self.capacity else 0
+        other_min = min(other._counts.values()) if len(other._counts) >= other.capacity else 0
+
+        for item in set(counts) | set(other._counts):
+            counts[item] = self._counts.get(item, self_min) + other._counts.get(item, other_min)
+            errors[item] = self._errors.get(item, self_min) + other._errors.get(item, other_min)
+
+        kept = heapq.nlargest(self.capacity, counts.items(), key=lambda kv: kv[1])
+        self._counts = dict(kept)
+        self._errors = {item: errors[item] for item in self._counts}
+        self._heap = [(count, item) for item, count in self._counts.items()]
+        heapq.heapify(self._heap)
+        self.total += other.total
+
+    def top(self, limit: int = 10) -> List[Tuple[str, int]]:
+        """
+        추정 빈도 기준 상위 limit개 (항목, 추정 빈도)를 반환합니다.
+        """
+        return heapq.nlargest(limit, self._counts.items(), key=lambda kv: kv[1])
+
+    def estimate(self, item: str) -> Tuple[int, int]:
+        """
+        항목의 (추정 빈도, 최대 과대추정 오차)를 반환합니다. 추적 중이 아니면 (0, 0)입니다.
+        """
+        return self._counts.get(item, 0), self._errors.get(item, 0)
@@ -0,0 +1,129 @@
+import io
+from typing import List, Optional
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # 선택 의존성: uv sync --extra parquet (없으면 pandas C 엔진으로 파싱)
+    pa = None
+
+# 검색 기록 CSV 저장 시각 형식
+SEARCH_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# 로더가 만드는 컬럼별 메모리 표현 (나머지 텍스트 컬럼은 문자열 그대로)
+# - keyword: 종류가 적고 기사 행마다 반복되므로 사전 인코딩(category)하여 값은 한 번만 보관
+# - search_key: 검색마다 새 값이라 category로 두면 이어 붙일 때마다 전체 키 집합을 다시 합쳐야 하므로 문자열 그대로 둠
+# - search_time: 한 번만 datetime64로 변환해 두고 이후 집계/필터에서 다시 파싱하지 않음
+# - article_index: 검색 1건당 기사 수는 작으므로 int16
+HISTORY_DTYPES = {
+    "search_time": "datetime64[s]",
+    "keyword": "category",
+    "article_index": "int16",
+}
+CATEGORY_COLUMNS = [col for col, dtype in HISTORY_DTYPES.items() if dtype == "category"]
+
+# 타입 추론 없이 문자열로 읽는 컬럼 (시각처럼 생긴 분 단위 레거시 키도 문자열로 유지)
+STRING_COLUMNS = ["search_key"]
+
+def empty_history_frame(columns: List[str]) -> pd.DataFrame:
+    """
+    로더와 같은 컬럼 타입을 가진 빈 DataFrame을 만듭니다.
+    """
+    return pd.DataFrame({col: pd.Series(dtype=HISTORY_DTYPES.get(col, object)) for col in columns})
+
+def as_search_times(values: pd.Series) -> pd.Series:
+    """
+    search_time 컬럼을 datetime64 Series로 반환합니다. 로더가 이미 변환한 컬럼은 그대로 돌려주고,
+    문자열 컬럼(SQLite/Parquet 조회 결과 등)만 파싱합니다. (형식이 어긋난 값은 NaT)
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    return pd.to_datetime(values, format=SEARCH_TIME_FORMAT, errors="coerce")
+
+def coerce_history_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    파싱된 검색 기록의 컬럼을 HISTORY_DTYPES로 맞춥니다. (이미 맞는 컬럼은 건드리지 않음)
+    article_index가 비었거나 숫자가 아닌 행은 기사 없는 행(0)으로 간주합니다.
+    """
+    for col, dtype in HISTORY_DTYPES.items():
+        if col not in df.columns or df[col].dtype == dtype:
+            continue
+        if col == "search_time":
+            df[col] = as_search_times(df[col]).astype(dtype)
+        elif col == "article_index":
+            df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0).astype(dtype)
+        else:
+            df[col] = df[col].astype(dtype)
+    return df
+
+def _read_arrow(data: bytes, names: Optional[List[str]]) -> pd.DataFrame:
+    """
+    pyarrow CSV 리더로 컬럼 타입을 지정해 바로 읽습니다. (멀티스레드, 사전 인코딩 컬럼은 category로 변환됨)
+    """
+    column_types = {
+        "search_key": pa.string(),
+        "keyword": pa.dictionary(pa.int32(), pa.string()),
+        "search_time": pa.timestamp("s"),
+        "article_index": pa.int16(),
+    }
+    table = pa_csv.read_csv(
+        io.BytesIO(data),
+        read_options=pa_csv.ReadOptions(column_names=names),
+        parse_options=pa_csv.ParseOptions(newlines_in_values=True),
+        convert_options=pa_csv.ConvertOptions(
+            column_types=column_types,
+            timestamp_parsers=[SEARCH_TIME_FORMAT],
+            strings_can_be_null=True,
+        ),
+    )
+    # 블록마다 따로 만든 사전을 하나로 합쳐 category 코드가 전체에서 같은 값을 가리키도록 함
+    return table.unify_dictionaries().to_pandas()
+
+def parse_history_csv(data: bytes, names: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    검색 기록 CSV 바이트를 타입이 지정된 DataFrame으로 파싱합니다.
+    pyarrow가 설치되어 있으면 pyarrow CSV 리더를, 없거나 형식이 어긋난 값이 있으면
+    pandas C 엔진(dtype 지정 후 개별 보정)을 사용합니다.
+
+    Args:
+        data (bytes): CSV 바이트 (UTF-8, BOM 허용)
+        names (List[str]): 지정하면 헤더 없는 행들로 보고 이 컬럼 이름을 붙임 (추가분 파싱용)
+
+    Returns:
+        pd.DataFrame: keyword는 category, search_key는 문자열, search_time은 datetime64, article_index는 int16인 DataFrame
+    """
+    if pa is not None:
+        try:
+            return coerce_history_dtypes(_read_arrow(data, names))
+        except pa.ArrowInvalid:
+            pass  # 날짜/숫자 형식이 어긋난 행이 있으면 pandas로 읽으면서 개별 값만 NaT/0으로 보정
+    df = pd.read_csv(
+        io.BytesIO(data),
+        header=None if names else "infer",
+        names=names,
+        encoding="utf-8-sig",
+        dtype={**{col: "category" for col in CATEGORY_COLUMNS}, **{col: str for col in STRING_COLUMNS}},
+    )
+    return coerce_history_dtypes(df)
+
+def concat_history_frames(frames: List[pd.DataFrame], columns: List[str]) -> pd.DataFrame:
+    """
+    로더가 만든 DataFrame들을 이어 붙입니다.
+    pd.concat은 category 값 집합이 다르면 문자열(object)로 풀어 버리므로 category 컬럼은 값 집합을 합쳐 유지합니다.
+    """
+    frames = [frame for frame in frames if len(frame)]
+    if not frames:
+        return empty_history_frame(columns)
+    if len(frames) == 1:
+        return frames[0][columns]
+
+    data = {}
+    for col in columns:
+        parts = [frame[col] for frame in frames]
+        if all(isinstance(part.dtype, pd.CategoricalDtype) for part in parts):
+            data[col] = union_categoricals(parts, ignore_order=True)
+        else:
+            data[col] = pd.concat(parts, ignore_index=True)
+    return pd.DataFrame(data)
@@ -0,0 +1,183 @@
+import threading
+from datetime import datetime
+from typing import List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from domain.history_page import HistoryEntry, HistoryPage
+from repositories.csv_export import format_search_time
+from repositories.history_frame import as_search_times
+
+# list_history() 기본 페이지 크기
+DEFAULT_PAGE_SIZE = 50
+
+# 키워드 접두어 필터 적용 시 한 번에 훑는 최소 검색 수
+PREFIX_SCAN_CHUNK = 1024
+
+# 목록 배열을 처음 만들 때 확보하는 최소 칸 수 (이후 모자라면 2배씩 늘림)
+MIN_CAPACITY = 64
+
+def make_entry(search_key: str, search_time: str, keyword: str) -> HistoryEntry:
+    """
+    검색 기록 항목을 만들면서 표시용 라벨("키워드 (YYYY-MM-DD HH:MM)")을 미리 만들어 둡니다.
+    """
+    search_time = str(search_time)
+    return HistoryEntry(
+        search_key=search_key,
+        search_time=search_time,
+        keyword=keyword,
+        label=f"{keyword} ({search_time[:16]})"
+    )
+
+def encode_cursor(entry: HistoryEntry) -> str:
+    """
+    항목의 (search_time, search_key)를 다음 페이지 커서 문자열로 만듭니다.
+    (호출하는 쪽은 커서를 해석하지 말고 그대로 다시 넘겨야 함)
+    """
+    return f"{entry.search_time}|{entry.search_key}"
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """
+    커서를 (search_time, search_key)로 되돌립니다. search_time에는 "|"가 없으므로 첫 구분자에서 나눕니다.
+    """
+    search_time, _, search_key = cursor.partition("|")
+    return search_time, search_key
+
+def make_page(entries: List[HistoryEntry], page_size: int) -> HistoryPage:
+    """
+    page_size + 1개까지 조회한 항목으로 페이지를 만듭니다. (남는 1개가 있으면 다음 페이지가 있다는 뜻)
+    """
+    if len(entries) > page_size:
+        return HistoryPage(entries=entries[:page_size], next_cursor=encode_cursor(entries[page_size - 1]))
+    return HistoryPage(entries=entries)
+
+class HistoryListing:
+    """
+    검색 기록을 검색 1건 = 1항목으로 (search_time, search_key) 순 정렬해 두는 인메모리 목록입니다.
+    ULID 검색 키는 같은 초 안에서도 생성 순서대로 정렬되므로 (search_time, search_key) 순서가 곧 검색 순서입니다.
+    커서 위치와 기간 경계를 이진 탐색으로 찾고 그 앞의 page_size개만 꺼내므로,
+    한 페이지 조회 비용은 전체 검색 수가 아니라 페이지 크기에 비례합니다.
+    (키워드 접두어 필터는 커서 위치부터 페이지가 찰 때까지만 훑음)
+
+    새 행은 보통 가장 최근 검색이므로 여유 칸을 두고 확보한 배열 끝에 써 넣고(모자랄 때만 2배로 늘려 복사),
+    순서가 어긋나는 경우에만 다시 정렬합니다. 따라서 저장 1건을 반영하는 비용은 전체 검색 수와 무관합니다.
+    검색 시간은 datetime64 배열로 보관하고, 문자열은 꺼내는 페이지의 항목에 대해서만 만듭니다.
+    (search_time을 해석할 수 없는 검색은 목록에서 제외)
+    """
+    def __init__(self):
+        self._times = np.array([], dtype="datetime64[s]")
+        self._keys = np.array([], dtype=object)
+        self._keywords = np.array([], dtype=object)
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def add_rows(self, df: pd.DataFrame):
+        """
+        Long format 행들을 검색 단위로 묶어 목록에 반영합니다.
+
+        Args:
+            df (pd.DataFrame): search_key, search_time, keyword 컬럼을 포함한 행들
+        """
+        searches = (
+            df[["search_key", "search_time", "keyword"]]
+            .dropna(subset=["search_key", "search_time"])
+            .drop_duplicates(subset=["search_key", "search_time"])
+        )
+        if searches.empty:
+            return
+        searches = pd.DataFrame({
+            "search_time": as_search_times(searches["search_time"]).astype("datetime64[s]"),
+            "search_key": searches["search_key"].astype(str),
+            "keyword": searches["keyword"].astype(object).fillna("").astype(str),
+        }).dropna(subset=["search_time"]).sort_values(["search_time", "search_key"], kind="stable")
+        if searches.empty:
+            return
+        times = searches["search_time"].to_numpy()
+        keys = searches["search_key"].to_numpy(dtype=object)
+        keywords = searches["keyword"].to_numpy(dtype=object)
+
+        with self._lock:
+            size = self._size
+            in_order = not size or (self._times[size - 1], self._keys[size - 1]) <= (times[0], keys[0])
+            if not in_order:
+                times = np.concatenate((self._times[:size], times))
+                keys = np.concatenate((self._keys[:size], keys))
+                keywords = np.concatenate((self._keywords[:size], keywords))
+                order = pd.DataFrame({"t": times, "k": keys}).sort_values(["t", "k"], kind="stable").index.to_numpy()
+                # 조회 중인 다른 스레드가 보던 배열은 그대로 두고 새 배열로 교체
+                self._times, self._keys, self._keywords = times[order], keys[order], keywords[order]
+                self._size = len(order)
+                return
+
+            if size + len(times) > len(self._times):
+                # 여유 칸이 모자라면 2배로 늘린 새 배열로 옮김 (조회 중인 배열은 그대로 남음)
+                capacity = max(MIN_CAPACITY, 2 * len(self._times), size + len(times))
+                self._times = self._grow(self._times, size, capacity)
+                self._keys = self._grow(self._keys, size, capacity)
+                self._keywords = self._grow(self._keywords, size, capacity)
+            # 조회는 [:size] 범위만 보므로 그 뒤 칸에 써도 조회 중인 값은 바뀌지 않음
+            self._times[size:size + len(times)] = times
+            self._keys[size:size + len(times)] = keys
+            self._keywords[size:size + len(times)] = keywords
+            self._size = size + len(times)
+
+    @staticmethod
+    def _grow(values: np.ndarray, size: int, capacity: int) -> np.ndarray:
+        grown = np.empty(capacity, dtype=values.dtype)
+        grown[:size] = values[:size]
+        return grown
+
+    def _view(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        (잠금을 잡은 상태에서 호출) 현재까지 채워진 범위의 (검색 시간, 키, 키워드) 배열을 반환합니다.
+        """
+        size = self._size
+        return self._times[:size], self._keys[:size], self._keywords[:size]
+
+    def keys_newest_first(self) -> List[str]:
+        """
+        모든 search_key를 검색 시간 최신순으로 반환합니다. (정렬된 배열을 뒤집기만 함)
+        """
+        with self._lock:
+            _, keys, _ = self._view()
+        return keys[::-1].tolist()
+
+    def page(
+        self,
+        cursor: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        keyword_prefix: Optional[str] = None
+    ) -> HistoryPage:
+        """
+        최신순으로 커서 다음의 page_size개 항목을 반환합니다. (list_history()와 같은 인자)
+        """
+        with self._lock:
+            times, keys, keywords = self._view()
+
+        lo = int(np.searchsorted(times, np.datetime64(start, "s"), side="left")) if start is not None else 0
+        hi = int(np.searchsorted(times, np.datetime64(end, "s"), side="right")) if end is not None else len(times)
+        if cursor:
+            cursor_time, cursor_key = decode_cursor(cursor)
+            cursor_time = np.datetime64(cursor_time, "s")
+            first = int(np.searchsorted(times, cursor_time, side="left"))
+            last = int(np.searchsorted(times, cursor_time, side="right"))
+            hi = min(hi, first + int(np.searchsorted(keys[first:last], cursor_key, side="left")))
+
+        limit = page_size + 1
+        if not keyword_prefix:
+            picked = range(hi - 1, max(lo, hi - limit) - 1, -1)
+        else:
+            picked = []
+            stop = hi
+            while stop > lo and len(picked) < limit:
+                begin = max(lo, stop - max(limit, PREFIX_SCAN_CHUNK))
+                matches = [i for i in range(stop - 1, begin - 1, -1) if keywords[i].startswith(keyword_prefix)]
+                picked.extend(matches)
+                stop = begin
+            picked = picked[:limit]
+
+        return make_page(
+            [make_entry(keys[i], format_search_time(times[i].astype(datetime)), keywords[i]) for i in picked],
+            page_size
+        )
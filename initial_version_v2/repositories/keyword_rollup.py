@@ -0,0 +1,123 @@
+import threading
+from collections import Counter
+from datetime import date, datetime
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+import pandas as pd
+from repositories.history_frame import as_search_times
+
+# 키워드 검색 수 시계열의 집계 단위
+ROLLUP_GRANULARITIES = ("hour", "day")
+
+# 시계열 조회 구간 경계 (date는 그날 0시로 간주)
+TimeBound = Optional[Union[datetime, date]]
+
+def bucket_start(value: Union[datetime, date], granularity: str) -> datetime:
+    """
+    시각이 속한 집계 구간(1시간 / 1일)의 시작 시각을 반환합니다.
+    """
+    value = pd.Timestamp(value).to_pydatetime()
+    if granularity == "hour":
+        return value.replace(minute=0, second=0, microsecond=0)
+    return value.replace(hour=0, minute=0, second=0, microsecond=0)
+
+def fill_buckets(counts: Mapping[datetime, int], start: TimeBound, end: TimeBound, granularity: str) -> pd.DataFrame:
+    """
+    구간 시작 시각별 검색 수를 빈 구간은 0으로 채운 시계열 DataFrame으로 만듭니다.
+    start/end가 없으면 집계된 첫/마지막 구간까지를 범위로 사용합니다.
+
+    Args:
+        counts (Mapping[datetime, int]): 구간 시작 시각 -> 검색 수
+        start (datetime | date): 이 시각이 속한 구간부터 포함
+        end (datetime | date): 이 시각이 속한 구간까지 포함
+        granularity (str): "hour" | "day"
+
+    Returns:
+        pd.DataFrame: bucket(datetime64), search_count(int) 컬럼
+    """
+    if granularity not in ROLLUP_GRANULARITIES:
+        raise ValueError(f"지원하지 않는 집계 단위입니다: {granularity}")
+    if start is None and end is None and not counts:
+        return pd.DataFrame({"bucket": pd.Series(dtype="datetime64[ns]"), "search_count": pd.Series(dtype="int64")})
+
+    if end is not None:
+        last = bucket_start(end, granularity)
+    else:
+        last = max(counts) if counts else bucket_start(datetime.now(), granularity)
+    if start is not None:
+        first = bucket_start(start, granularity)
+    else:
+        first = min(counts) if counts else last
+    buckets = pd.date_range(first, last, freq="h" if granularity == "hour" else "D")
+    return pd.DataFrame({
+        "bucket": buckets,
+        "search_count": [int(counts.get(bucket.to_pydatetime(), 0)) for bucket in buckets],
+    })
+
+def top_counts(counts: Mapping[str, int], limit: int) -> List[Tuple[str, int]]:
+    """
+    검색 수 내림차순(같으면 키워드순)으로 상위 limit개 (키워드, 검색 수)를 반환합니다.
+    """
+    return sorted(counts.items(), key=lambda item: (-item[1], item[0]))[:limit]
+
+class KeywordRollup:
+    """
+    검색 기록을 키워드별 시간/일 단위 검색 수와 일별 검색 수로 미리 집계해 두는 인메모리 롤업입니다.
+    저장되는 행을 받을 때마다 해당 구간만 갱신하므로, 추이 조회 비용은 원본 기사 행 수가 아니라
+    조회 구간의 (구간 수 x 키워드 수)에 비례합니다. (SQLite 저장소의 keyword_hourly/keyword_daily/daily_searches 테이블과 같은 값)
+
+    키워드 검색 수와 일별 검색 수는 모두 search_key 기준 1회만 카운트합니다.
+    """
+    def __init__(self):
+        self._hourly: Dict[datetime, Counter] = {}
+        self._daily: Dict[datetime, Counter] = {}
+        self._daily_searches: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def add_rows(self, df: pd.DataFrame):
+        """
+        Long format 행들을 롤업에 반영합니다. (한 검색의 행들은 함께 전달되어야 함)
+
+        Args:
+            df (pd.DataFrame): search_key, search_time, keyword 컬럼을 포함한 행들
+        """
+        searches = df[["search_key", "search_time", "keyword"]].dropna().drop_duplicates(subset=["search_key", "keyword"])
+        if searches.empty:
+            return
+
+        times = as_search_times(searches["search_time"])
+        searches = searches.assign(hour=times.dt.floor("h"), day=times.dt.floor("D")).dropna(subset=["hour"])
+        hourly = searches.groupby(["hour", "keyword"], observed=True).size()
+        daily = searches.groupby(["day", "keyword"], observed=True).size()
+        daily_searches = searches.drop_duplicates(subset=["search_key"]).groupby("day").size()
+
+        with self._lock:
+            for target, counts in ((self._hourly, hourly), (self._daily, daily)):
+                for (bucket, keyword), count in counts.items():
+                    target.setdefault(bucket.to_pydatetime(), Counter())[keyword] += int(count)
+            for day, count in daily_searches.items():
+                self._daily_searches[day.to_pydatetime()] += int(count)
+
+    def timeseries(self, keyword: str, start: TimeBound = None, end: TimeBound = None, granularity: str = "hour") -> pd.DataFrame:
+        """
+        키워드의 구간별 검색 수 시계열을 반환합니다. (fill_buckets 형식)
+        """
+        buckets = self._hourly if granularity == "hour" else self._daily
+        with self._lock:
+            counts = {bucket: counter[keyword] for bucket, counter in buckets.items() if keyword in counter}
+        return fill_buckets(counts, start, end, granularity)
+
+    def top_by_day(self, day: Union[datetime, date], limit: int = 10) -> List[Tuple[str, int]]:
+        """
+        해당 날짜의 검색 수 상위 limit개 (키워드, 검색 수)를 반환합니다.
+        """
+        with self._lock:
+            counts = dict(self._daily.get(bucket_start(day, "day"), {}))
+        return top_counts(counts, limit)
+
+    def daily_searches(self, start: TimeBound = None, end: TimeBound = None) -> pd.DataFrame:
+        """
+        날짜별 검색 수(서로 다른 search_key 수) 시계열을 반환합니다. (fill_buckets 형식)
+        """
+        with self._lock:
+            counts = dict(self._daily_searches)
+        return fill_buckets(counts, start, end, "day")
@@ -0,0 +1,443 @@
+import os
+import time
+import uuid
+import threading
+import pandas as pd
+from contextlib import ExitStack, contextmanager
+from datetime import date, datetime, timedelta
+from typing import Iterator, List, Optional, Tuple, Union
+from domain.search_result import SearchResult
+from domain.text_search_hit import TextSearchHit
+from domain.history_page import HistoryPage
+from repositories.csv_export import format_search_time, iter_csv_bytes
+from repositories.text_index import TEXT_INDEX_COLUMNS, TEXT_INDEX_SUFFIX, TextIndex, hits_for_docs, text_indexes
+from repositories.trending_counter import count_keywords_exact
+from repositories.keyword_rollup import KeywordRollup, TimeBound, fill_buckets
+from repositories.history_listing import DEFAULT_PAGE_SIZE, HistoryListing
+from repositories.snapshot_cache import count_urls
+from repositories.write_coordinator import file_lock
+from utils.url_normalizer import normalize_url
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+except ImportError:  # 선택 의존성: uv sync --extra parquet
+    pa = None
+
+# 한 날짜 파티션의 파일 수가 이 값에 이르면 저장 직후 하나로 합침 (0이면 자동으로 합치지 않음)
+DEFAULT_COMPACT_FILES = 64
+
+# 파일 교체를 기다리는 배타적 잠금이 계속 들어오는 조회에 밀리지 않도록, 공유 잠금을 잡기 전에 거치는 관문 잠금 접미사
+LOCK_GATE_SUFFIX = ".gate"
+
+# 파일 이름에 쓰는 마지막 기록 시각(나노초). 같은 프로세스에서 시계가 같거나 되돌아가도 이름 순서가 저장 순서를 따르도록 함
+_last_write_ns = 0
+_write_ns_lock = threading.Lock()
+
+def _next_write_ns() -> int:
+    global _last_write_ns
+    with _write_ns_lock:
+        _last_write_ns = max(time.time_ns(), _last_write_ns + 1)
+        return _last_write_ns
+
+class ParquetSearchRepository:
+    """
+    검색 기록을 날짜별로 파티션된 Parquet 파일(컬럼 지향)로 저장하고 조회하는 리포지토리 클래스입니다.
+    SearchRepository(CSV)와 같은 공개 메서드를 제공하며, 필요한 컬럼만 읽는 column projection을 지원하여
+    키 목록/인기 검색어 조회 시 기사 본문(snippet, ai_summary)을 읽지 않습니다.
+
+    저장 구조: <root_dir>/search_date=YYYY-MM-DD/part-<기록 시각(ns, 20자리)>-<난수>.parquet (저장 1회당 파일 1개)
+    파일은 이름순으로 읽으므로, 같은 초에 저장해도 행 순서가 저장 순서와 같습니다. (전문 검색 색인의 문서 번호가 밀리지 않음)
+
+    파티션의 파일 수가 compact_files에 이르면 저장 직후 그 파티션을 하나의 파일로 합칩니다.
+    저장과 조회는 "<root_dir>.lock" 공유 잠금을 잡고, 합친 파일로 원래 파일들을 교체하는 순간에만 배타적 잠금을 잡으므로
+    조회 중에 파일이 지워지거나 합쳐진 파일과 원래 파일이 함께 읽혀 행이 중복되지 않습니다.
+
+    Attributes:
+        root_dir (str): Parquet 파티션들이 저장될 디렉토리 경로
+        columns (List[str]): 검색 기록 컬럼 리스트 (CSV와 동일)
+        compact_files (int): 저장 직후 파티션을 합치는 기준 파일 수 (0이면 합치지 않음)
+    """
+    def __init__(self, root_dir: str, compact_files: int = DEFAULT_COMPACT_FILES):
+        """
+        ParquetSearchRepository를 초기화합니다. 필요한 경우 저장 디렉토리를 생성합니다.
+
+        Args:
+            root_dir (str): 검색 기록을 저장할 디렉토리 경로
+            compact_files (int): 저장 직후 파티션을 합치는 기준 파일 수 (0이면 합치지 않음)
+        """
+        if pa is None:
+            raise ImportError("Parquet 저장소를 사용하려면 pyarrow가 필요합니다. (uv sync --extra parquet)")
+
+        self.root_dir = root_dir
+        self.compact_files = compact_files
+        self.columns = [
+            "search_key", "search_time", "keyword", "article_index",
+            "title", "url", "snippet", "ai_summary", "related_keywords"
+        ]
+        self.schema = pa.schema([
+            ("search_key", pa.string()),
+            ("search_time", pa.string()),
+            ("keyword", pa.string()),
+            ("article_index", pa.int32()),
+            ("title", pa.string()),
+            ("url", pa.string()),
+            ("snippet", pa.string()),
+            ("ai_summary", pa.string()),
+            ("related_keywords", pa.string()),
+        ])
+        os.makedirs(self.root_dir, exist_ok=True)
+
+    @contextmanager
+    def _lock(self, shared: bool = True) -> Iterator[None]:
+        """
+        저장 디렉토리 전체에 대한 파일 잠금을 잡습니다. (저장/조회는 공유, 합친 파일로 교체할 때만 배타적)
+        공유 잠금도 관문 잠금을 잠깐 거쳐 잡으므로, 배타적 잠금을 기다리는 동안 새 조회는 그 뒤에 줄을 섭니다.
+        같은 스레드에서 겹쳐 잡지 않도록 공개 메서드에서만 잡습니다. (Windows는 공유 잠금도 배타적)
+        """
+        root = self.root_dir.rstrip("/\\")
+        if not shared:
+            with file_lock(root + LOCK_GATE_SUFFIX), file_lock(root):
+                yield
+            return
+        with ExitStack() as stack:
+            with file_lock(root + LOCK_GATE_SUFFIX, shared=True):
+                stack.enter_context(file_lock(root, shared=True))
+            yield
+
+    def _dataset(self, since: Optional[datetime] = None) -> Optional["ds.Dataset"]:
+        """
+        파티션 디렉토리들로 Dataset을 구성합니다. since가 주어지면 그 날짜 이전 파티션은 열지 않습니다.
+        저장된 파일이 없으면 None을 반환합니다.
+        """
+        files = []
+        since_date = since.strftime("%Y-%m-%d") if since else None
+        for name in sorted(os.listdir(self.root_dir)):
+            if not name.startswith("search_date="):
+                continue
+            if since_date and name.split("=", 1)[1] < since_date:
+                continue
+            part_dir = os.path.join(self.root_dir, name)
+            files.extend(
+                os.path.join(part_dir, f) for f in sorted(os.listdir(part_dir)) if f.endswith(".parquet")
+            )
+        if not files:
+            return None
+        return ds.dataset(files, schema=self.schema, format="parquet")
+
+    def load(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        검색 기록을 DataFrame으로 로드합니다. columns를 지정하면 해당 컬럼만 파일에서 읽습니다.
+        """
+        columns = columns or self.columns
+        try:
+            with self._lock():
+                dataset = self._dataset()
+                if dataset is None:
+                    return pd.DataFrame(columns=columns)
+                return dataset.to_table(columns=columns).to_pandas()
+        except Exception as e:
+            print(f"[경고] Parquet 로드 실패: {e}")
+            return pd.DataFrame(columns=columns)
+
+    def save(self, search_result: SearchResult) -> bool:
+        """
+        검색 결과를 검색 날짜 파티션에 새 Parquet 파일로 저장합니다. (기존 파일은 건드리지 않음)
+        임시 파일에 쓴 뒤 이름을 바꾸므로 읽는 쪽에서 쓰다 만 파일을 보지 않습니다.
+        저장 후 파티션의 파일 수가 compact_files 이상이면 그 파티션을 합칩니다.
+        """
+        search_date = search_result.search_time.strftime('%Y-%m-%d')
+        try:
+            new_df = search_result.to_dataframe()[self.columns]
+            part_dir = os.path.join(self.root_dir, f"search_date={search_date}")
+            table = pa.Table.from_pandas(new_df, schema=self.schema, preserve_index=False)
+            with self._lock():
+                os.makedirs(part_dir, exist_ok=True)
+                # 이름순 = 저장 순서가 되도록 단조 증가하는 기록 시각을 앞에 둠 (난수는 다른 프로세스와의 충돌 방지용)
+                file_name = f"part-{_next_write_ns():020d}-{uuid.uuid4().hex[:8]}.parquet"
+                tmp_path = os.path.join(part_dir, f".{file_name}.tmp")
+                pq.write_table(table, tmp_path)
+                os.replace(tmp_path, os.path.join(part_dir, file_name))
+                file_count = sum(1 for f in os.listdir(part_dir) if f.endswith(".parquet"))
+        except Exception as e:
+            print(f"[에러] Parquet 저장 실패: {e}")
+            return False
+
+        if self.compact_files and file_count >= self.compact_files:
+            try:
+                self.compact(search_date)
+            except Exception as e:
+                print(f"[경고] Parquet 파티션 합치기 실패: {e}")
+
+        # 이 프로세스에서 전문 검색 색인을 쓰고 있으면 방금 추가된 행까지 색인
+        index = text_indexes.opened(self._text_index_path())
+        if index is not None:
+            try:
+                with self._lock():
+                    self._sync_text_index(index)
+            except Exception as e:
+                print(f"[경고] 검색 색인 갱신 실패: {e}")
+        return True
+
+    def compact(self, search_date: str) -> int:
+        """
+        한 날짜 파티션의 작은 파일들을 하나의 파일로 합칩니다. (저장 1회당 파일 1개가 쌓이므로 주기적 정리용)
+        save()가 compact_files 기준으로 자동 호출하며, 직접 호출해도 됩니다.
+        파일을 읽고 합친 파일을 쓰는 동안은 공유 잠금만 잡고, 원래 파일들을 교체/삭제하는 순간에만 배타적 잠금을 잡습니다.
+        그 사이 다른 프로세스가 같은 파일들을 먼저 합쳤으면 아무것도 바꾸지 않습니다.
+        합친 파일은 가장 앞선 파일 이름을 쓰므로 전체 행 순서(전문 검색 색인의 문서 번호)는 바뀌지 않습니다.
+
+        Args:
+            search_date (str): 합칠 파티션 날짜 (YYYY-MM-DD)
+
+        Returns:
+            int: 합쳐진 파일 수
+        """
+        part_dir = os.path.join(self.root_dir, f"search_date={search_date}")
+
+        def list_files() -> List[str]:
+            return sorted(os.path.join(part_dir, f) for f in os.listdir(part_dir) if f.endswith(".parquet"))
+
+        with self._lock():
+            if not os.path.isdir(part_dir):
+                return 0
+            files = list_files()
+            if len(files) <= 1:
+                return 0
+            table = ds.dataset(files, schema=self.schema, format="parquet").to_table()
+            tmp_path = os.path.join(part_dir, f".compacted-{uuid.uuid4().hex[:8]}.tmp")
+            pq.write_table(table, tmp_path)
+
+        with self._lock(shared=False):
+            # 합치는 사이에 추가된 파일은 이름이 더 뒤이므로 그대로 두고, 합친 파일 중 하나라도 없어졌으면 포기
+            if list_files()[:len(files)] != files:
+                os.remove(tmp_path)
+                return 0
+            # 이름 순으로 정렬되도록 가장 앞선 파일 이름을 재사용하고 나머지는 삭제
+            os.replace(tmp_path, files[0])
+            for path in files[1:]:
+                os.remove(path)
+        return len(files)
+
+    def get_all_keys(self) -> List[str]:
+        """
+        저장된 모든 search_key를 검색 시간 기준 최신순으로 정렬하여 반환합니다.
+        (search_key, search_time 컬럼만 읽음)
+        """
+        df = self.load(columns=["search_key", "search_time"])
+        if df.empty:
+            return []
+        # 같은 초에 저장된 검색은 생성 순서대로 정렬되는 ULID 키로 순서를 정함
+        keys_df = df.drop_duplicates()
+        return keys_df.sort_values(by=["search_time", "search_key"], ascending=False)["search_key"].tolist()
+
+    def list_history(
+        self,
+        cursor: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        keyword_prefix: Optional[str] = None
+    ) -> HistoryPage:
+        """
+        검색 기록을 검색 시간 최신순으로 한 페이지씩 반환합니다. (목록 표시용 라벨 포함)
+        start 이후 날짜 파티션의 search_key, search_time, keyword 컬럼만 읽어 정렬합니다.
+
+        Args:
+            cursor (str): 이전 페이지의 next_cursor (없으면 가장 최근 검색부터)
+            page_size (int): 한 페이지의 최대 항목 수
+            start (datetime): 이 시각 이후(포함) 검색만 나열
+            end (datetime): 이 시각 이전(포함) 검색만 나열
+            keyword_prefix (str): 검색어가 이 문자열로 시작하는 기록만 나열
+
+        Returns:
+            HistoryPage: 검색 시간 최신순 항목들과 다음 페이지 커서
+        """
+        try:
+            listing = HistoryListing()
+            with self._lock():
+                dataset = self._dataset(since=start)
+                if dataset is not None:
+                    listing.add_rows(dataset.to_table(columns=["search_key", "search_time", "keyword"]).to_pandas())
+            return listing.page(cursor, page_size, start, end, keyword_prefix)
+        except Exception as e:
+            print(f"[경고] 검색 기록 목록 조회 실패: {e}")
+            return HistoryPage()
+
+    def find_by_key(self, search_key: str) -> Optional[SearchResult]:
+        """
+        특정 search_key에 해당하는 행만 필터로 읽어 SearchResult 객체로 복원합니다.
+        """
+        with self._lock():
+            dataset = self._dataset()
+            if dataset is None:
+                return None
+            target_df = dataset.to_table(filter=ds.field("search_key") == search_key).to_pandas()
+        if target_df.empty:
+            return None
+        return SearchResult.from_dataframe(target_df)
+
+    def get_all_as_csv(self) -> str:
+        """
+        전체 데이터를 CSV 형식의 문자열로 반환합니다.
+        (대용량 기록은 iter_csv_chunks()로 스트리밍하는 것을 권장합니다.)
+        """
+        return b"".join(self.iter_csv_chunks()).decode("utf-8-sig")
+
+    def iter_csv_chunks(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        keyword: Optional[str] = None,
+        chunk_rows: int = 5000
+    ) -> Iterator[bytes]:
+        """
+        검색 기록을 CSV 바이트 청크로 나누어 스트리밍합니다. (첫 청크에 BOM + 헤더 포함)
+        start 이전 날짜 파티션은 열지 않고, 나머지 조건은 Parquet 필터로 적용합니다.
+        스트리밍하는 동안 공유 잠금을 잡고 있으므로 파티션 합치기는 끝날 때까지 기다립니다.
+        """
+        with self._lock():
+            yield from self._iter_csv_chunks(start, end, keyword, chunk_rows)
+
+    def _iter_csv_chunks(
+        self,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        keyword: Optional[str],
+        chunk_rows: int
+    ) -> Iterator[bytes]:
+        dataset = self._dataset(since=start)
+        if dataset is None:
+            return
+
+        condition = None
+        for expr in (
+            ds.field("search_time") >= format_search_time(start) if start is not None else None,
+            ds.field("search_time") <= format_search_time(end) if end is not None else None,
+            ds.field("keyword") == keyword if keyword is not None else None,
+        ):
+            if expr is not None:
+                condition = expr if condition is None else condition & expr
+
+        batches = dataset.to_batches(filter=condition, batch_size=chunk_rows)
+        yield from iter_csv_bytes((batch.to_pandas() for batch in batches), self.columns)
+
+    def get_trending_keywords(self, hours: int = 24, limit: int = 10) -> List[str]:
+        """
+        최근 hours 시간 기준 keyword count를 집계하여 상위 리스트를 반환합니다.
+        구간에 해당하는 날짜 파티션의 search_key, search_time, keyword 컬럼만 읽습니다.
+        """
+        try:
+            now = datetime.now()
+            with self._lock():
+                dataset = self._dataset(since=now - timedelta(hours=hours))
+                if dataset is None:
+                    return []
+                df = dataset.to_table(columns=["search_key", "search_time", "keyword"]).to_pandas()
+            return count_keywords_exact(df, hours=hours, limit=limit, now=now)
+        except Exception as e:
+            print(f"[경고] 인기 검색어 집계 실패: {e}")
+            return []
+
+    def get_keyword_timeseries(
+        self,
+        keyword: str,
+        start: TimeBound = None,
+        end: TimeBound = None,
+        granularity: str = "hour"
+    ) -> pd.DataFrame:
+        """
+        키워드의 시간/일 단위 검색 수 추이를 반환합니다. (bucket, search_count 컬럼, 빈 구간은 0)
+        Parquet은 저장 시 갱신하는 롤업이 없으므로 start 이후 날짜 파티션의 search_key, search_time, keyword 컬럼만 읽어 집계합니다.
+        """
+        try:
+            return self._keyword_rollup(start).timeseries(keyword, start, end, granularity)
+        except Exception as e:
+            print(f"[경고] 키워드 추이 집계 실패: {e}")
+            return fill_buckets({}, None, None, granularity)
+
+    def get_top_keywords_by_day(self, day: Union[datetime, date], limit: int = 10) -> List[Tuple[str, int]]:
+        """
+        해당 날짜에 많이 검색된 키워드 상위 limit개를 (키워드, 검색 수)로 반환합니다.
+        """
+        try:
+            return self._keyword_rollup(day).top_by_day(day, limit)
+        except Exception as e:
+            print(f"[경고] 일별 인기 검색어 집계 실패: {e}")
+            return []
+
+    def get_daily_search_counts(self, start: TimeBound = None, end: TimeBound = None) -> pd.DataFrame:
+        """
+        날짜별 검색 수(서로 다른 search_key 수)를 반환합니다. (bucket, search_count 컬럼, 빈 날짜는 0)
+        """
+        try:
+            return self._keyword_rollup(start).daily_searches(start, end)
+        except Exception as e:
+            print(f"[경고] 일별 검색 수 집계 실패: {e}")
+            return fill_buckets({}, None, None, "day")
+
+    def _keyword_rollup(self, since: TimeBound = None) -> KeywordRollup:
+        """
+        since 날짜 이후 파티션의 검색을 키워드 롤업으로 집계합니다.
+        """
+        rollup = KeywordRollup()
+        with self._lock():
+            dataset = self._dataset(since=since)
+            if dataset is not None:
+                rollup.add_rows(dataset.to_table(columns=["search_key", "search_time", "keyword"]).to_pandas())
+        return rollup
+
+    def count_searches_for_url(self, url: str) -> int:
+        """
+        해당 기사 URL(정규화 기준)을 결과로 보여 준 검색 수를 반환합니다.
+        (search_key, url 컬럼만 읽어 집계하므로 기록 크기에 비례합니다. 자주 조회하면 CSV/SQLite 저장소 권장)
+        """
+        df = self.load(columns=["search_key", "url"])
+        if df.empty:
+            return 0
+        return count_urls(df).get(normalize_url(url), 0)
+
+    def search_text(self, query: str, limit: int = 20) -> List[TextSearchHit]:
+        """
+        저장된 기사의 제목, 스니펫, AI 요약에서 검색어를 찾아 관련도(BM25) 순으로 반환합니다.
+        색인은 "<저장 디렉토리>.textidx"에 보관되며 load()와 같은 행 순서를 문서 번호로 사용하고,
+        결과 행만 Dataset.take로 읽습니다.
+        """
+        if not query.strip():
+            return []
+
+        try:
+            index = text_indexes.get(self._text_index_path())
+            with self._lock():
+                dataset = self._sync_text_index(index)
+                if dataset is None:
+                    return []
+                ranked = index.search(query, limit=limit, max_doc=dataset.count_rows())
+                if not ranked:
+                    return []
+                df = dataset.take([doc_id for doc_id, _ in ranked], columns=self.columns).to_pandas()
+            # 읽은 행과 결과를 위치가 아닌 문서 키로 짝지음
+            docs, scores = index.docs(ranked)
+            return hits_for_docs(df, docs, scores)
+        except Exception as e:
+            print(f"[경고] 기록 검색 실패: {e}")
+            return []
+
+    def _text_index_path(self) -> str:
+        return self.root_dir.rstrip("/\\") + TEXT_INDEX_SUFFIX
+
+    def _sync_text_index(self, index: TextIndex) -> Optional["ds.Dataset"]:
+        """
+        현재 파티션 파일들의 행까지 색인을 맞추고, 결과를 꺼낼 때 쓸 Dataset을 반환합니다.
+        (호출하는 쪽에서 공유 잠금을 잡고 있어야 함)
+        """
+        dataset = self._dataset()
+        if dataset is None:
+            return None
+        index.sync(
+            dataset.count_rows(),
+            lambda i: dataset.take([i], columns=["search_key"]).column(0)[0].as_py(),
+            lambda start, stop: dataset.take(list(range(start, stop)), columns=TEXT_INDEX_COLUMNS).to_pandas()
+        )
+        return dataset
@@ -0,0 +1,463 @@
+import os
+import sys
+import json
+import pandas as pd
+from datetime import date, datetime, timedelta
+from collections import Counter
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+from domain.search_result import SearchResult
+from domain.text_search_hit import TextSearchHit
+from domain.history_page import HistoryPage
+from repositories.search_repository import SearchRepository
+from repositories.csv_export import format_search_time, iter_csv_bytes
+from repositories.history_frame import as_search_times, concat_history_frames
+from repositories.trending_counter import count_keywords_exact
+from repositories.keyword_rollup import TimeBound, bucket_start, fill_buckets, top_counts
+from repositories.history_listing import DEFAULT_PAGE_SIZE, decode_cursor, make_page
+from repositories.write_coordinator import atomic_write, file_lock
+from repositories.schema_migration import write_schema_stamp
+from utils.key_generator import search_key_time
+
+class PartitionedSearchRepository:
+    """
+    검색 기록을 날짜별 CSV 파티션(<root>/YYYY-MM/YYYY-MM-DD.csv)으로 나누어 저장하는 리포지토리 클래스입니다.
+    SearchRepository(CSV)와 같은 공개 메서드를 제공하며, 각 파티션은 SearchRepository로 읽고 쓰므로
+    append 저장, 스냅샷 캐시, 증분 읽기를 그대로 사용합니다.
+
+    manifest.json에 파티션별 최소/최대 search_time, 행 수, 파일 크기를 기록해 두고,
+    기간이 정해진 조회(인기 검색어, 기간 내보내기)는 구간과 겹치는 파티션만 엽니다.
+
+    Attributes:
+        root_dir (str): 파티션 디렉토리 경로
+        columns (List[str]): 검색 기록 컬럼 리스트 (CSV와 동일)
+        write_batch_ms (int): 0보다 크면 파티션별로 이 시간(밀리초) 동안 모인 저장 요청을 한 번에 기록
+    """
+    def __init__(self, root_dir: str, write_batch_ms: int = 0):
+        """
+        PartitionedSearchRepository를 초기화합니다. 필요한 경우 저장 디렉토리를 생성합니다.
+
+        Args:
+            root_dir (str): 검색 기록 파티션을 저장할 디렉토리 경로
+            write_batch_ms (int): 저장 요청을 모으는 시간(밀리초), 0이면 요청마다 바로 기록
+        """
+        self.root_dir = root_dir.rstrip("/\\")
+        self.write_batch_ms = write_batch_ms
+        self.columns = [
+            "search_key", "search_time", "keyword", "article_index",
+            "title", "url", "snippet", "ai_summary", "related_keywords"
+        ]
+        self.manifest_path = os.path.join(self.root_dir, "manifest.json")
+        # 마지막으로 읽은 매니페스트 파일의 (inode, 수정 시각, 크기)와 내용
+        self._manifest_cache: Optional[Tuple[Tuple[int, int, int], Dict[str, Dict]]] = None
+        self._manifest_validated = False
+        os.makedirs(self.root_dir, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # 파티션 / 매니페스트
+    # ------------------------------------------------------------------
+    def _partition_name(self, search_time: datetime) -> str:
+        """
+        검색 시각이 속하는 파티션의 상대 경로를 반환합니다. (예: "2026-10/2026-10-18.csv")
+        """
+        return f"{search_time.strftime('%Y-%m')}/{search_time.strftime('%Y-%m-%d')}.csv"
+
+    def _partition(self, name: str) -> SearchRepository:
+        return SearchRepository(os.path.join(self.root_dir, name), write_batch_ms=self.write_batch_ms)
+
+    def _scan_partitions(self) -> List[str]:
+        """
+        디스크에 있는 파티션 파일들의 상대 경로를 날짜순으로 반환합니다.
+        """
+        names = []
+        for month in sorted(os.listdir(self.root_dir)):
+            month_dir = os.path.join(self.root_dir, month)
+            if not os.path.isdir(month_dir):
+                continue
+            names.extend(f"{month}/{f}" for f in sorted(os.listdir(month_dir)) if f.endswith(".csv"))
+        return names
+
+    def _describe(self, name: str) -> Dict:
+        """
+        파티션 파일을 읽어 매니페스트 항목(최소/최대 시각, 행 수, 파일 크기)을 만듭니다.
+        """
+        path = os.path.join(self.root_dir, name)
+        size = os.path.getsize(path)
+        times = as_search_times(self._partition(name).load(columns=["search_time"])["search_time"]).dropna()
+        return {
+            "min_time": format_search_time(times.min()) if not times.empty else "",
+            "max_time": format_search_time(times.max()) if not times.empty else "",
+            "rows": int(len(times)),
+            "size": size
+        }
+
+    def _read_manifest(self) -> Dict[str, Dict]:
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f).get("partitions", {})
+        except (FileNotFoundError, ValueError):
+            return {}
+
+    def _write_manifest(self, partitions: Dict[str, Dict]):
+        """
+        매니페스트를 임시 파일에 쓴 뒤 교체합니다. (읽는 쪽이 쓰다 만 파일을 보지 않도록)
+        """
+        data = json.dumps({"partitions": dict(sorted(partitions.items()))}, ensure_ascii=False, indent=2)
+        atomic_write(self.manifest_path, data.encode("utf-8"))
+
+    def manifest(self) -> Dict[str, Dict]:
+        """
+        파티션 매니페스트를 반환합니다. (조회 경로)
+        저장하는 쪽이 파티션에 쓸 때마다 매니페스트를 갱신하고 파일을 통째로 교체하므로, 읽을 때는 잠금 없이 읽고
+        파일이 바뀌지 않았으면 이 프로세스에 보관한 내용을 그대로 사용합니다. (파티션 파일 stat 없음)
+        이 인스턴스에서 처음 읽을 때나 매니페스트가 없을 때만 디스크 전체와 맞춰 봅니다. (refresh_manifest)
+        """
+        try:
+            stat = os.stat(self.manifest_path)
+        except FileNotFoundError:
+            return self.refresh_manifest()
+        if not self._manifest_validated:
+            return self.refresh_manifest()
+
+        signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        cached = self._manifest_cache
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        partitions = self._read_manifest()
+        self._manifest_cache = (signature, partitions)
+        return partitions
+
+    def refresh_manifest(self, names: Optional[List[str]] = None) -> Dict[str, Dict]:
+        """
+        파일 크기가 기록과 다르거나(다른 프로세스의 저장) 기록에 없는 파티션을 다시 읽어 매니페스트를 갱신합니다.
+        names를 주면 해당 파티션만, 없으면 디스크의 모든 파티션을 확인합니다.
+        잠금 없이 먼저 확인하고, 고칠 항목이 있을 때만 매니페스트 파일의 배타적 잠금을 잡은 뒤 다시 확인하여 갱신합니다.
+        (여러 세션/프로세스가 동시에 고쳐 쓰지 않으면서, 고칠 것이 없는 대부분의 호출은 서로 기다리지 않음)
+
+        Args:
+            names (List[str]): 확인할 파티션 상대 경로 목록 (None이면 전체)
+
+        Returns:
+            Dict[str, Dict]: 갱신된 매니페스트
+        """
+        partitions = self._read_manifest()
+        if self._stale_partitions(partitions, names) or not os.path.exists(self.manifest_path):
+            with file_lock(self.manifest_path):
+                partitions = self._read_manifest()
+                stale = self._stale_partitions(partitions, names)
+                if stale or not os.path.exists(self.manifest_path):
+                    for name in stale:
+                        if os.path.exists(os.path.join(self.root_dir, name)):
+                            partitions[name] = self._describe(name)
+                        else:
+                            partitions.pop(name, None)
+                    self._write_manifest(partitions)
+        if names is None:
+            self._manifest_validated = True
+        self._manifest_cache = None
+        return partitions
+
+    def _stale_partitions(self, partitions: Dict[str, Dict], names: Optional[List[str]] = None) -> List[str]:
+        """
+        매니페스트 기록이 실제 파일과 다른 파티션(새로 생김, 크기 변경, 삭제됨)의 상대 경로를 반환합니다.
+        """
+        if names is None:
+            on_disk = self._scan_partitions()
+            names = on_disk + sorted(set(partitions) - set(on_disk))
+        stale = []
+        for name in names:
+            try:
+                size = os.path.getsize(os.path.join(self.root_dir, name))
+            except FileNotFoundError:
+                if name in partitions:
+                    stale.append(name)
+                continue
+            entry = partitions.get(name)
+            if entry is None or entry.get("size") != size:
+                stale.append(name)
+        return stale
+
+    def _partitions_between(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> List[str]:
+        """
+        [start, end] 구간과 search_time 범위가 겹치는 파티션만 날짜순으로 반환합니다. (partition pruning)
+        """
+        start_str, end_str = format_search_time(start), format_search_time(end)
+        selected = []
+        for name, entry in sorted(self.manifest().items()):
+            if not entry["rows"]:
+                continue
+            if start_str and entry["max_time"] < start_str:
+                continue
+            if end_str and entry["min_time"] > end_str:
+                continue
+            selected.append(name)
+        return selected
+
+    # ------------------------------------------------------------------
+    # 공개 API (SearchRepository와 동일)
+    # ------------------------------------------------------------------
+    def load(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        모든 파티션의 데이터를 날짜순으로 이어 붙여 로드합니다. columns를 지정하면 해당 컬럼만 반환합니다.
+        """
+        columns = columns or self.columns
+        frames = [self._partition(name).load(columns=columns) for name in self._partitions_between()]
+        return concat_history_frames(frames, columns)
+
+    def save(self, search_result: SearchResult) -> bool:
+        """
+        검색 결과를 검색 날짜 파티션 파일 끝에 추가 저장하고 매니페스트를 갱신합니다.
+        """
+        name = self._partition_name(search_result.search_time)
+        os.makedirs(os.path.join(self.root_dir, os.path.dirname(name)), exist_ok=True)
+        if not self._partition(name).save(search_result):
+            return False
+
+        try:
+            # 방금 쓴 파티션만 확인하여 매니페스트 갱신
+            self.refresh_manifest([name])
+        except Exception as e:
+            # 매니페스트는 다음 조회 때 다시 맞춰지므로 저장 자체는 성공으로 처리
+            print(f"[경고] 매니페스트 갱신 실패: {e}")
+        return True
+
+    def get_all_keys(self) -> List[str]:
+        """
+        저장된 모든 search_key를 검색 시간 기준 최신순으로 정렬하여 반환합니다.
+        파티션끼리는 시간 범위가 겹치지 않으므로 최신 파티션부터 각 파티션의 정렬된 키 목록을 이어 붙입니다.
+        """
+        return [key for name in reversed(self._partitions_between()) for key in self._partition(name).get_all_keys()]
+
+    def list_history(
+        self,
+        cursor: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        keyword_prefix: Optional[str] = None
+    ) -> HistoryPage:
+        """
+        검색 기록을 검색 시간 최신순으로 한 페이지씩 반환합니다. (목록 표시용 라벨 포함)
+        날짜 파티션은 서로 시간 범위가 겹치지 않으므로 최신 파티션부터 차례로 페이지가 찰 때까지만 엽니다.
+        (커서보다 최근인 파티션은 건너뜀)
+
+        Args:
+            cursor (str): 이전 페이지의 next_cursor (없으면 가장 최근 검색부터)
+            page_size (int): 한 페이지의 최대 항목 수
+            start (datetime): 이 시각 이후(포함) 검색만 나열
+            end (datetime): 이 시각 이전(포함) 검색만 나열
+            keyword_prefix (str): 검색어가 이 문자열로 시작하는 기록만 나열
+
+        Returns:
+            HistoryPage: 검색 시간 최신순 항목들과 다음 페이지 커서
+        """
+        try:
+            upper = end
+            if cursor:
+                cursor_time = datetime.strptime(decode_cursor(cursor)[0], "%Y-%m-%d %H:%M:%S")
+                upper = min(upper, cursor_time) if upper is not None else cursor_time
+
+            # 다음 페이지가 있는지 알 수 있도록 page_size + 1개까지 모음
+            entries = []
+            for name in reversed(self._partitions_between(start, upper)):
+                page = self._partition(name).list_history(
+                    cursor, page_size + 1 - len(entries), start, end, keyword_prefix
+                )
+                entries.extend(page.entries)
+                if len(entries) > page_size:
+                    break
+            return make_page(entries, page_size)
+        except Exception as e:
+            print(f"[경고] 검색 기록 목록 조회 실패: {e}")
+            return HistoryPage()
+
+    def find_by_key(self, search_key: str) -> Optional[SearchResult]:
+        """
+        특정 search_key의 검색 결과를 복원합니다.
+        키에 검색 시각이 들어 있으면 해당 날짜 파티션을 먼저 찾고, 없으면 최신 파티션부터 찾습니다.
+        """
+        names = self._partitions_between()
+        hint = self._partition_hint(search_key)
+        if hint in names:
+            names.remove(hint)
+            names.insert(0, hint)
+        else:
+            names.reverse()
+
+        for name in names:
+            result = self._partition(name).find_by_key(search_key)
+            if result is not None:
+                return result
+        return None
+
+    def _partition_hint(self, search_key: str) -> Optional[str]:
+        """
+        검색 키에 담긴 검색 시각(ULID 키 또는 이전 형식 "키워드-yyyymmddhhmm")으로 날짜 파티션 이름을 추정합니다.
+        """
+        ts = search_key_time(search_key)
+        return self._partition_name(ts) if ts is not None else None
+
+    def get_all_as_csv(self) -> str:
+        """
+        전체 데이터를 CSV 형식의 문자열로 반환합니다.
+        (대용량 기록은 iter_csv_chunks()로 스트리밍하는 것을 권장합니다.)
+        """
+        return b"".join(self.iter_csv_chunks()).decode("utf-8-sig")
+
+    def iter_csv_chunks(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        keyword: Optional[str] = None,
+        chunk_rows: int = 5000
+    ) -> Iterator[bytes]:
+        """
+        검색 기록을 CSV 바이트 청크로 나누어 스트리밍합니다. (첫 청크에 BOM + 헤더 포함)
+        기간과 겹치는 파티션만 차례로 읽습니다.
+        """
+        def frames():
+            for name in self._partitions_between(start, end):
+                df = self._partition(name).load()
+                mask = pd.Series(True, index=df.index)
+                search_times = as_search_times(df["search_time"])
+                if start is not None:
+                    mask &= search_times >= start
+                if end is not None:
+                    mask &= search_times <= end
+                if keyword is not None:
+                    mask &= df["keyword"] == keyword
+                df = df[mask]
+                for i in range(0, len(df), chunk_rows):
+                    yield df.iloc[i:i + chunk_rows]
+
+        yield from iter_csv_bytes(frames(), self.columns)
+
+    def get_trending_keywords(self, hours: int = 24, limit: int = 10) -> List[str]:
+        """
+        최근 hours 시간 기준 keyword count를 집계하여 상위 리스트를 반환합니다.
+        구간과 겹치는 파티션(24시간이면 보통 1~2개)의 필요한 컬럼만 읽습니다.
+        """
+        try:
+            now = datetime.now()
+            columns = ["search_key", "search_time", "keyword"]
+            frames = [
+                self._partition(name).load(columns=columns)
+                for name in self._partitions_between(start=now - timedelta(hours=hours))
+            ]
+            if not frames:
+                return []
+            return count_keywords_exact(concat_history_frames(frames, columns), hours=hours, limit=limit, now=now)
+        except Exception as e:
+            print(f"[경고] 인기 검색어 집계 실패: {e}")
+            return []
+
+    def get_keyword_timeseries(
+        self,
+        keyword: str,
+        start: TimeBound = None,
+        end: TimeBound = None,
+        granularity: str = "hour"
+    ) -> pd.DataFrame:
+        """
+        키워드의 시간/일 단위 검색 수 추이를 반환합니다. (bucket, search_count 컬럼, 빈 구간은 0)
+        구간과 겹치는 파티션의 롤업만 읽어 합산합니다. (한 구간은 한 날짜에 속하므로 파티션끼리 겹치지 않음)
+        """
+        try:
+            counts = Counter()
+            for name in self._partitions_between(*self._day_range(start, end)):
+                series = self._partition(name).get_keyword_timeseries(keyword, granularity=granularity)
+                counts.update({bucket.to_pydatetime(): int(count) for bucket, count in zip(series["bucket"], series["search_count"])})
+            return fill_buckets(counts, start, end, granularity)
+        except Exception as e:
+            print(f"[경고] 키워드 추이 집계 실패: {e}")
+            return fill_buckets({}, None, None, granularity)
+
+    def get_top_keywords_by_day(self, day: Union[datetime, date], limit: int = 10) -> List[Tuple[str, int]]:
+        """
+        해당 날짜에 많이 검색된 키워드 상위 limit개를 (키워드, 검색 수)로 반환합니다. (그날 파티션만 읽음)
+        """
+        counts = Counter()
+        for name in self._partitions_between(*self._day_range(day, day)):
+            counts.update(dict(self._partition(name).get_top_keywords_by_day(day, limit=sys.maxsize)))
+        return top_counts(counts, limit)
+
+    def get_daily_search_counts(self, start: TimeBound = None, end: TimeBound = None) -> pd.DataFrame:
+        """
+        날짜별 검색 수(서로 다른 search_key 수)를 반환합니다. (bucket, search_count 컬럼, 빈 날짜는 0)
+        """
+        try:
+            counts = Counter()
+            for name in self._partitions_between(*self._day_range(start, end)):
+                series = self._partition(name).get_daily_search_counts()
+                counts.update({bucket.to_pydatetime(): int(count) for bucket, count in zip(series["bucket"], series["search_count"])})
+            return fill_buckets(counts, start, end, "day")
+        except Exception as e:
+            print(f"[경고] 일별 검색 수 집계 실패: {e}")
+            return fill_buckets({}, None, None, "day")
+
+    @staticmethod
+    def _day_range(start: TimeBound, end: TimeBound) -> Tuple[Optional[datetime], Optional[datetime]]:
+        """
+        집계 구간 경계를 파티션 선택용 시각 범위로 바꿉니다. (end가 속한 날 전체를 포함)
+        """
+        first = bucket_start(start, "day") if start is not None else None
+        last = bucket_start(end, "day") + timedelta(days=1) - timedelta(seconds=1) if end is not None else None
+        return first, last
+
+    def count_searches_for_url(self, url: str) -> int:
+        """
+        해당 기사 URL(정규화 기준)을 결과로 보여 준 검색 수를 반환합니다. (파티션별 카운터 합계)
+        """
+        return sum(self._partition(name).count_searches_for_url(url) for name in self._partitions_between())
+
+    def search_text(self, query: str, limit: int = 20) -> List[TextSearchHit]:
+        """
+        저장된 기사의 제목, 스니펫, AI 요약에서 검색어를 찾아 관련도(BM25) 순으로 반환합니다.
+        파티션마다 색인("<파티션>.csv.textidx")을 두고 각 파티션의 상위 결과를 점수순으로 합칩니다.
+        (점수의 IDF는 파티션 단위로 계산되므로 파티션 간 순위는 근사치입니다.)
+        """
+        hits: List[TextSearchHit] = []
+        for name in self._partitions_between():
+            hits.extend(self._partition(name).search_text(query, limit=limit))
+        return sorted(hits, key=lambda hit: hit.score, reverse=True)[:limit]
+
+    def import_csv(self, csv_path: str, chunksize: int = 10000) -> int:
+        """
+        단일 CSV 검색 기록을 날짜 파티션으로 나누어 가져옵니다. (1회성 이관용)
+
+        Args:
+            csv_path (str): 가져올 CSV 파일 경로
+            chunksize (int): 한 번에 읽을 행 수
+
+        Returns:
+            int: 가져온 행 수
+        """
+        imported = 0
+        for chunk in pd.read_csv(csv_path, chunksize=chunksize):
+            # 구 버전(8컬럼) CSV 호환
+            for col in self.columns:
+                if col not in chunk.columns:
+                    chunk[col] = None
+            chunk = chunk[self.columns]
+            times = pd.to_datetime(chunk["search_time"], errors="coerce")
+            chunk = chunk[times.notna()]
+            for name, part in chunk.groupby(times[times.notna()].map(self._partition_name), sort=True):
+                path = os.path.join(self.root_dir, name)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with file_lock(path):
+                    exists = os.path.exists(path)
+                    part.to_csv(path, mode="a", header=not exists, index=False,
+                                encoding="utf-8" if exists else "utf-8-sig", lineterminator="\n")
+                    if not exists:
+                        write_schema_stamp(path)
+                imported += len(part)
+        self.refresh_manifest()
+        return imported
+
+
+if __name__ == "__main__":
+    # 사용법: python -m repositories.partitioned_search_repository <CSV 경로> <파티션 디렉토리>
+    if len(sys.argv) != 3:
+        print("사용법: python -m repositories.partitioned_search_repository <CSV 경로> <파티션 디렉토리>")
+        sys.exit(1)
+    count = PartitionedSearchRepository(sys.argv[2]).import_csv(sys.argv[1])
+    print(f"{count}개 행을 {sys.argv[2]}로 가져왔습니다.")
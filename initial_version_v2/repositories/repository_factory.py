@@ -0,0 +1,49 @@
+import os
+from typing import Union
+from repositories.search_repository import SearchRepository
+from repositories.sqlite_search_repository import SqliteSearchRepository
+from repositories.parquet_search_repository import ParquetSearchRepository
+from repositories.partitioned_search_repository import PartitionedSearchRepository
+
+# 확장자로 SQLite 저장소를 판별할 때 사용하는 목록
+SQLITE_EXTENSIONS = (".db", ".sqlite", ".sqlite3")
+
+def create_search_repository(
+    path: str,
+    backend: str = "",
+    trending_mode: str = "exact",
+    sketch_capacity: int = 1000,
+    write_batch_ms: int = 0,
+    parquet_compact_files: int = 64
+) -> Union[SearchRepository, SqliteSearchRepository, ParquetSearchRepository, PartitionedSearchRepository]:
+    """
+    설정에 맞는 검색 기록 리포지토리를 생성합니다.
+    - backend가 "csv" | "sqlite" | "parquet" | "partitioned"이면 해당 저장소를 사용
+    - 비어 있으면 path로 판단: .db/.sqlite/.sqlite3 → SQLite, .parquet → Parquet 디렉토리,
+      "/"로 끝나거나 이미 있는 디렉토리 → 날짜별 CSV 파티션, 그 외 → CSV 파일
+    - trending_mode/sketch_capacity는 인메모리 인기 검색어 집계를 쓰는 CSV 저장소에 적용
+    - write_batch_ms는 CSV 파일에 직접 append하는 저장소(CSV, 날짜별 CSV 파티션)에 적용
+    - parquet_compact_files는 Parquet 저장소가 저장 직후 파티션을 합치는 기준 파일 수 (0이면 합치지 않음)
+    """
+    backend = (backend or "").strip().lower()
+    if not backend:
+        ext = os.path.splitext(path)[1].lower()
+        if ext in SQLITE_EXTENSIONS:
+            backend = "sqlite"
+        elif ext == ".parquet":
+            backend = "parquet"
+        elif path.endswith(("/", "\\")) or os.path.isdir(path):
+            backend = "partitioned"
+        else:
+            backend = "csv"
+
+    if backend == "sqlite":
+        return SqliteSearchRepository(path)
+    if backend == "partitioned":
+        return PartitionedSearchRepository(path, write_batch_ms=write_batch_ms)
+    if backend == "parquet":
+        return ParquetSearchRepository(path, compact_files=parquet_compact_files)
+    if backend == "csv":
+        return SearchRepository(path, trending_mode=trending_mode, sketch_capacity=sketch_capacity,
+                                write_batch_ms=write_batch_ms)
+    raise ValueError(f"지원하지 않는 저장소 종류입니다: {backend}")
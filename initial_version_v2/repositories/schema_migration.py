@@ -0,0 +1,144 @@
+import os
+import sys
+import csv
+import json
+from typing import Dict, List, Optional
+import pandas as pd
+from repositories.csv_export import UTF8_BOM
+from repositories.write_coordinator import atomic_write, file_lock
+
+# 검색 기록 CSV 스키마 버전별 컬럼 구성
+SCHEMA_COLUMNS: Dict[int, List[str]] = {
+    # initial_version: 연관 키워드 없음
+    1: ["search_key", "search_time", "keyword", "article_index", "title", "url", "snippet", "ai_summary"],
+    # Phase 9: related_keywords 추가
+    2: ["search_key", "search_time", "keyword", "article_index", "title", "url", "snippet", "ai_summary", "related_keywords"],
+}
+CURRENT_SCHEMA_VERSION = 2
+
+# 스키마 스탬프 파일 접미사 ("<CSV 경로>.meta.json")
+META_SUFFIX = ".meta.json"
+
+# 이관 시 한 번에 읽어 쓰는 행 수 (메모리 사용량 상한)
+MIGRATION_CHUNK_ROWS = 20000
+
+def header_bytes(version: int = CURRENT_SCHEMA_VERSION) -> bytes:
+    """
+    해당 스키마 버전 파일의 헤더 줄(BOM 제외)을 반환합니다.
+    """
+    return (",".join(SCHEMA_COLUMNS[version]) + "\n").encode("utf-8")
+
+def detect_schema_version(header: List[str]) -> Optional[int]:
+    """
+    헤더 컬럼 구성과 일치하는 스키마 버전을 반환합니다. 알 수 없는 구성이면 None을 반환합니다.
+    """
+    for version, columns in SCHEMA_COLUMNS.items():
+        if header == columns:
+            return version
+    return None
+
+def read_header(path: str) -> Optional[List[str]]:
+    """
+    CSV 파일의 헤더(첫 줄)만 읽어 컬럼 리스트로 반환합니다. 파일이 없거나 비어 있으면 None을 반환합니다.
+    """
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return None
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        first_line = f.readline()
+    if not first_line.strip():
+        return None
+    return [col.strip() for col in next(csv.reader([first_line]))]
+
+def read_schema_stamp(path: str) -> Optional[int]:
+    """
+    "<path>.meta.json"에 기록된 스키마 버전을 반환합니다. 스탬프가 없거나 읽을 수 없으면 None을 반환합니다.
+    """
+    try:
+        with open(path + META_SUFFIX, "r", encoding="utf-8") as f:
+            return int(json.load(f)["schema_version"])
+    except (FileNotFoundError, ValueError, KeyError, TypeError):
+        return None
+
+def write_schema_stamp(path: str, version: int = CURRENT_SCHEMA_VERSION):
+    """
+    CSV 파일이 해당 스키마 버전으로 기록되어 있음을 "<path>.meta.json"에 남깁니다.
+    """
+    meta = {"schema_version": version, "columns": SCHEMA_COLUMNS[version]}
+    atomic_write(path + META_SUFFIX, json.dumps(meta, ensure_ascii=False, indent=2).encode("utf-8"))
+
+def is_current_schema(path: str, data: bytes) -> bool:
+    """
+    파일이 현재 스키마로 스탬프되어 있고, 읽은 바이트의 헤더도 그와 같은지 확인합니다.
+    (스탬프 이후 다른 파일로 교체된 경우를 헤더 비교로 걸러냄)
+    """
+    if read_schema_stamp(path) != CURRENT_SCHEMA_VERSION:
+        return False
+    if data.startswith(UTF8_BOM):
+        data = data[len(UTF8_BOM):]
+    return data.startswith(header_bytes())
+
+def migrate_csv(path: str, chunk_rows: int = MIGRATION_CHUNK_ROWS) -> Dict:
+    """
+    검색 기록 CSV를 현재 스키마로 변환하고 스키마 스탬프를 남깁니다. (파일 잠금을 잡고 수행)
+    이미 현재 스키마인 파일은 다시 쓰지 않고 스탬프만 남깁니다.
+
+    Args:
+        path (str): 변환할 CSV 파일 경로
+        chunk_rows (int): 한 번에 읽어 쓰는 행 수
+
+    Returns:
+        Dict: from_version(원래 버전, 알 수 없으면 None), rows(다시 쓴 행 수), rewritten(재작성 여부)
+    """
+    with file_lock(path):
+        return migrate_locked(path, chunk_rows)
+
+def migrate_locked(path: str, chunk_rows: int = MIGRATION_CHUNK_ROWS) -> Dict:
+    """
+    migrate_csv()와 같지만 호출하는 쪽이 이미 파일 잠금을 잡고 있을 때 사용합니다.
+
+    행을 chunk_rows개씩 문자열 그대로 읽어 현재 컬럼 순서로 맞춘 뒤 임시 파일에 이어 쓰고,
+    다 쓰면 원본과 교체합니다. 메모리에는 한 묶음만 올라가므로 파일 크기와 무관하게 사용량이 일정하며,
+    값은 문자열로 옮기므로 숫자/빈 칸 표현이 바뀌지 않습니다. (현재 스키마에 없는 컬럼은 버림)
+    """
+    header = read_header(path)
+    if header is None:
+        return {"from_version": None, "rows": 0, "rewritten": False}
+
+    version = detect_schema_version(header)
+    if version == CURRENT_SCHEMA_VERSION:
+        write_schema_stamp(path)
+        return {"from_version": version, "rows": 0, "rewritten": False}
+
+    columns = SCHEMA_COLUMNS[CURRENT_SCHEMA_VERSION]
+    rows = 0
+
+    def write(tmp_path: str):
+        nonlocal rows
+        with open(tmp_path, "wb") as out:
+            out.write(UTF8_BOM + header_bytes())
+            chunks = pd.read_csv(
+                path, encoding="utf-8-sig", dtype=str, keep_default_na=False, chunksize=chunk_rows
+            )
+            for chunk in chunks:
+                for col in columns:
+                    if col not in chunk.columns:
+                        chunk[col] = ""
+                out.write(chunk[columns].to_csv(index=False, header=False, lineterminator="\n").encode("utf-8"))
+                rows += len(chunk)
+
+    atomic_write(path, write)
+    write_schema_stamp(path)
+    return {"from_version": version, "rows": rows, "rewritten": True}
+
+
+if __name__ == "__main__":
+    # 사용법: python -m repositories.schema_migration <CSV 경로> [<CSV 경로> ...]
+    if len(sys.argv) < 2:
+        print("사용법: python -m repositories.schema_migration <CSV 경로> [<CSV 경로> ...]")
+        sys.exit(1)
+    for csv_path in sys.argv[1:]:
+        result = migrate_csv(csv_path)
+        if result["rewritten"]:
+            print(f"{csv_path}: v{result['from_version'] or '?'} → v{CURRENT_SCHEMA_VERSION} ({result['rows']}개 행 변환)")
+        else:
+            print(f"{csv_path}: 이미 v{CURRENT_SCHEMA_VERSION} 스키마입니다. (스탬프만 기록)")
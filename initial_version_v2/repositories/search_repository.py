@@ -1,9 +1,25 @@
 import os
 import pandas as pd
-from typing import List, Optional
-from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+from datetime import date, datetime
 from domain.search_result import SearchResult
-from domain.news_article import NewsArticle
+from domain.text_search_hit import TextSearchHit
+from domain.history_page import HistoryPage
+from repositories.snapshot_cache import ChunkedRows, snapshot_cache, file_stat
+from repositories.csv_export import UTF8_BOM, iter_csv_bytes
+from repositories.trending_counter import count_keywords_exact
+from repositories.keyword_rollup import KeywordRollup, TimeBound, fill_buckets
+from repositories.history_listing import DEFAULT_PAGE_SIZE
+from repositories.history_frame import as_search_times, empty_history_frame, parse_history_csv
+from repositories.schema_migration import (
+    CURRENT_SCHEMA_VERSION, is_current_schema, migrate_locked, read_header, read_schema_stamp, write_schema_stamp
+)
+from repositories.write_coordinator import atomic_write, file_lock, write_coordinator
+from repositories.text_index import TEXT_INDEX_SUFFIX, TextIndex, hits_for_docs, text_indexes
+from utils.url_normalizer import normalize_url
+
+# 인기 검색어 시간 버킷을 메모리에 보관하는 기간 (이보다 긴 조회는 전체 기록으로 집계)
+TRENDING_RETENTION_HOURS = 24 * 7
 
 class SearchRepository:
     """
@@ -12,15 +28,30 @@ class SearchRepository:
     Attributes:
         csv_path (str): 데이터가 저장될 CSV 파일 경로
         columns (List[str]): CSV 파일의 고유 컬럼 리스트
+        trending_mode (str): 인기 검색어 집계 방식 ("exact" | "approx")
+        sketch_capacity (int): approx 모드에서 시간 버킷당 추적할 최대 키워드 수
+        write_batch_ms (int): 0보다 크면 이 시간(밀리초) 동안 모인 저장 요청을 한 번에 기록
     """
-    def __init__(self, csv_path: str):
+    def __init__(
+        self,
+        csv_path: str,
+        trending_mode: str = "exact",
+        sketch_capacity: int = 1000,
+        write_batch_ms: int = 0
+    ):
         """
         SearchRepository를 초기화합니다. 필요한 경우 데이터 디렉토리를 생성합니다.
         
         Args:
             csv_path (str): 검색 기록을 저장할 파일 경로
+            trending_mode (str): 인기 검색어 집계 방식 ("exact" | "approx")
+            sketch_capacity (int): approx 모드에서 시간 버킷당 추적할 최대 키워드 수
+            write_batch_ms (int): 저장 요청을 모으는 시간(밀리초), 0이면 요청마다 바로 기록
         """
         self.csv_path = csv_path
+        self.trending_mode = trending_mode
+        self.sketch_capacity = sketch_capacity
+        self.write_batch_ms = write_batch_ms
         self.columns = [
             "search_key", "search_time", "keyword", "article_index",
             "title", "url", "snippet", "ai_summary", "related_keywords"
@@ -28,132 +59,402 @@ class SearchRepository:
         # data/ 폴더가 없으면 자동 생성
         os.makedirs(os.path.dirname(self.csv_path), exist_ok=True)
 
-    def load(self) -> pd.DataFrame:
+    def load(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
         """
         CSV 파일에서 데이터를 로드합니다. 파일이 없으면 빈 DataFrame을 반환합니다.
+        columns를 지정하면 해당 컬럼만 반환합니다. (CSV는 행 단위 형식이라 스냅샷에서 골라냄)
+        파싱 결과는 프로세스 전역 스냅샷 캐시에 보관되어 파일이 바뀌기 전까지 재사용되고,
+        다른 세션이 행을 추가한 경우에는 추가된 바이트만 파싱하여 이어 붙입니다.
+        search_time은 datetime64, keyword는 category, article_index는 int16으로 읽어 두므로
+        호출하는 쪽에서 다시 변환할 필요가 없습니다.
+        반환값은 캐시를 공유하는 읽기 전용 뷰이므로 수정하지 말고 필요하면 복사해서 사용합니다.
         """
+        columns = columns or self.columns
         if not os.path.exists(self.csv_path):
-            return pd.DataFrame(columns=self.columns)
+            return empty_history_frame(columns)
         
         try:
-            df = pd.read_csv(self.csv_path)
-            # 컬럼 정합성 확인 (필요시)
-            for col in self.columns:
-                if col not in df.columns:
-                    df[col] = None
-            return df[self.columns]
+            df = snapshot_cache.get(self.csv_path, self._parse_csv)
+            return df if columns == self.columns else df[columns]
         except Exception as e:
             print(f"[경고] CSV 로드 실패: {e}")
-            return pd.DataFrame(columns=self.columns)
+            return empty_history_frame(columns)
+
+    def _parse_csv(self, data: bytes, is_tail: bool = False) -> pd.DataFrame:
+        """
+        CSV 바이트를 파싱하고 컬럼 정합성을 맞춥니다. (캐시 미스 또는 추가분 갱신 시에만 호출)
+        결과는 타입이 지정된 DataFrame입니다. (search_time: datetime64, keyword: category, article_index: int16)
+        is_tail이면 헤더 없이 현재 컬럼 순서로 추가된 행으로 간주합니다.
+        현재 스키마로 스탬프된 파일("<CSV 경로>.meta.json")은 컬럼 보정 없이 그대로 반환합니다.
+        """
+        if not data.strip():
+            return empty_history_frame(self.columns)
+        if is_tail:
+            return parse_history_csv(data, names=self.columns)
+
+        df = parse_history_csv(data)
+        if is_current_schema(self.csv_path, data):
+            return df
+        # 컬럼 정합성 확인 (필요시)
+        for col in self.columns:
+            if col not in df.columns:
+                df[col] = None
+        return df[self.columns]
+
+    def cache_stats(self) -> Dict[str, int]:
+        """
+        스냅샷 캐시의 적중/미스 카운터를 반환합니다.
+        """
+        return snapshot_cache.stats()
 
     def save(self, search_result: SearchResult) -> bool:
         """
-        검색 결과를 CSV 파일에 추가 저장합니다.
+        검색 결과를 CSV 파일 끝에 추가(append) 저장합니다.
+        기존 파일을 다시 읽지 않고 새 행만 기록하므로 저장 비용이 누적 기록 크기와 무관합니다.
+        write_batch_ms가 설정되어 있으면 같은 파일의 다른 세션 저장과 묶어서 한 번에 기록하며,
+        어느 경우든 파일에 기록된 뒤에 반환합니다.
         """
         try:
-            new_df = search_result.to_dataframe()
-            if os.path.exists(self.csv_path):
-                existing_df = pd.read_csv(self.csv_path)
-                combined_df = pd.concat([existing_df, new_df], ignore_index=True)
-            else:
-                combined_df = new_df
-                
-            combined_df.to_csv(self.csv_path, index=False, encoding='utf-8-sig')
+            new_df = search_result.to_dataframe()[self.columns]
+        except Exception as e:
+            print(f"[에러] CSV 저장 실패: {e}")
+            return False
+
+        if self.write_batch_ms > 0:
+            saved = write_coordinator.submit(self.csv_path, new_df, self._write_frames, self.write_batch_ms)
+        else:
+            saved = self._write_frames([new_df])
+
+        # 이 프로세스에서 전문 검색 색인을 쓰고 있으면 방금 추가된 행까지 색인
+        index = text_indexes.opened(self.csv_path + TEXT_INDEX_SUFFIX)
+        if saved and index is not None:
+            try:
+                self._sync_text_index(index)
+            except Exception as e:
+                print(f"[경고] 검색 색인 갱신 실패: {e}")
+        return saved
+
+    def _write_frames(self, frames: List[pd.DataFrame]) -> bool:
+        """
+        행 묶음들을 파일 잠금을 잡은 상태에서 한 번의 쓰기로 추가합니다.
+        헤더와 BOM은 파일을 새로 만들 때만 기록하며, 이전 스키마 파일은 먼저 업그레이드합니다.
+        새 파일 생성과 스키마 업그레이드는 임시 파일에 쓴 뒤 교체하므로 읽는 쪽이 쓰다 만 파일을 보지 않습니다.
+        """
+        try:
+            new_df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+            with file_lock(self.csv_path):
+                header = self._read_header()
+
+                if header is None:
+                    # 새 파일: 헤더 + BOM(utf-8-sig) 포함하여 생성
+                    atomic_write(self.csv_path, lambda tmp: new_df.to_csv(tmp, index=False, encoding='utf-8-sig'))
+                    write_schema_stamp(self.csv_path)
+                    snapshot_cache.invalidate(self.csv_path)
+                    return True
+
+                if header != self.columns:
+                    # 컬럼 구성이 다른 이전 스키마 파일은 1회 업그레이드
+                    self._upgrade_schema()
+                    snapshot_cache.invalidate(self.csv_path)
+                elif read_schema_stamp(self.csv_path) != CURRENT_SCHEMA_VERSION:
+                    # 스탬프 도입 전에 만든 현재 스키마 파일은 다음 로드부터 컬럼 보정을 건너뛰도록 스탬프만 기록
+                    write_schema_stamp(self.csv_path)
+
+                # 기존 파일: BOM/헤더 없이 새 행만 추가
+                payload = new_df.to_csv(index=False, header=False, lineterminator="\n")
+                if not self._ends_with_newline():
+                    payload = "\n" + payload
+                data = payload.encode("utf-8")
+
+                before = file_stat(self.csv_path)
+                with open(self.csv_path, "ab") as f:
+                    f.write(data)
+
+                # 방금 쓴 행만 파일에서 읽을 때와 같은 방식으로 파싱하여 캐시에 이어 붙임
+                snapshot_cache.append(self.csv_path, before, data, self._parse_csv)
             return True
         except Exception as e:
             print(f"[에러] CSV 저장 실패: {e}")
             return False
 
+    def _read_header(self) -> Optional[List[str]]:
+        """
+        CSV 파일의 헤더(첫 줄)만 읽어 컬럼 리스트로 반환합니다.
+        파일이 없거나 비어 있으면 None을 반환합니다.
+        """
+        return read_header(self.csv_path)
+
+    def _ends_with_newline(self) -> bool:
+        """
+        파일의 마지막 바이트가 줄바꿈인지 확인합니다. (수동 편집된 파일 대비)
+        """
+        with open(self.csv_path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) in (b"\n", b"\r")
+
+    def _upgrade_schema(self):
+        """
+        이전 스키마(예: related_keywords 없는 8컬럼) 파일을 현재 컬럼 구성으로 다시 기록하고 스키마 스탬프를 남깁니다.
+        행 묶음 단위로 스트리밍하여 변환하므로 파일 전체를 메모리에 올리지 않습니다.
+        (호출하는 쪽에서 파일 잠금을 잡고 있어야 함)
+        """
+        migrate_locked(self.csv_path)
+
     def get_all_keys(self) -> List[str]:
         """
         저장된 모든 search_key를 검색 시간 기준 최신순으로 정렬하여 반환합니다.
+        스냅샷마다 (search_time, search_key) 순으로 정렬해 두는 검색 목록을 뒤집어 반환하므로 시각을 다시 파싱하지 않습니다.
         """
-        df = self.load()
-        if df.empty:
+        if not os.path.exists(self.csv_path):
             return []
-        
-        # search_key별로 그룹화하여 가장 늦은 search_time을 기준으로 정렬
-        # (하나의 search_key에 여러 기사가 있으므로 중복 제거 필요)
-        keys_df = df[["search_key", "search_time"]].drop_duplicates()
-        keys_df['search_time'] = pd.to_datetime(keys_df['search_time'])
-        sorted_keys = keys_df.sort_values(by="search_time", ascending=False)["search_key"].tolist()
-        return sorted_keys
+        try:
+            return snapshot_cache.get_history_listing(self.csv_path, self._parse_csv).keys_newest_first()
+        except Exception as e:
+            print(f"[경고] CSV 로드 실패: {e}")
+            return []
+
+    def list_history(
+        self,
+        cursor: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        keyword_prefix: Optional[str] = None
+    ) -> HistoryPage:
+        """
+        검색 기록을 검색 시간 최신순으로 한 페이지씩 반환합니다. (목록 표시용 라벨 포함)
+        스냅샷마다 한 번 만들어 두는 정렬된 검색 목록에서 커서 위치를 이진 탐색하므로
+        기록이 아무리 많아도 한 페이지를 꺼내는 비용은 페이지 크기에 비례합니다.
+
+        Args:
+            cursor (str): 이전 페이지의 next_cursor (없으면 가장 최근 검색부터)
+            page_size (int): 한 페이지의 최대 항목 수
+            start (datetime): 이 시각 이후(포함) 검색만 나열
+            end (datetime): 이 시각 이전(포함) 검색만 나열
+            keyword_prefix (str): 검색어가 이 문자열로 시작하는 기록만 나열
+
+        Returns:
+            HistoryPage: 검색 시간 최신순 항목들과 다음 페이지 커서
+        """
+        if not os.path.exists(self.csv_path):
+            return HistoryPage()
+        try:
+            listing = snapshot_cache.get_history_listing(self.csv_path, self._parse_csv)
+            return listing.page(cursor, page_size, start, end, keyword_prefix)
+        except Exception as e:
+            print(f"[경고] 검색 기록 목록 조회 실패: {e}")
+            return HistoryPage()
 
     def find_by_key(self, search_key: str) -> Optional[SearchResult]:
         """
         특정 search_key에 해당하는 검색 결과를 SearchResult 객체로 복원하여 반환합니다.
+        스냅샷마다 미리 만들어 둔 search_key -> 행 범위 인덱스로 해당 행만 잘라내므로
+        전체 기록을 훑지 않습니다.
         """
-        df = self.load()
-        if df.empty:
-            return None
-        
-        target_df = df[df["search_key"] == search_key]
-        if target_df.empty:
+        if not os.path.exists(self.csv_path):
             return None
-            
-        # 첫 번째 행에서 기본 정보 추출
-        first_row = target_df.iloc[0]
-        
-        articles = []
-        for _, row in target_df.iterrows():
-            if row["article_index"] > 0: # 기사가 있는 경우만
-                articles.append(NewsArticle(
-                    title=str(row["title"]) if pd.notna(row["title"]) else "",
-                    url=str(row["url"]) if pd.notna(row["url"]) else "",
-                    snippet=str(row["snippet"]) if pd.notna(row["snippet"]) else ""
-                ))
-        
+
         try:
-            search_time = datetime.strptime(str(first_row["search_time"]), "%Y-%m-%d %H:%M:%S")
-        except:
-            search_time = datetime.now()
-            
-        # 연관 키워드 복원
-        rel_keywords_raw = str(first_row["related_keywords"]) if pd.notna(first_row.get("related_keywords")) else ""
-        related_keywords = [k.strip() for k in rel_keywords_raw.split("|") if k.strip()]
-
-        return SearchResult(
-            search_key=str(first_row["search_key"]),
-            search_time=search_time,
-            keyword=str(first_row["keyword"]),
-            articles=articles,
-            ai_summary=str(first_row["ai_summary"]) if pd.notna(first_row["ai_summary"]) else "",
-            related_keywords=related_keywords
-        )
+            rows, key_index = snapshot_cache.get_with_key_index(self.csv_path, self._parse_csv)
+        except Exception as e:
+            print(f"[경고] CSV 로드 실패: {e}")
+            return None
+
+        # 조회 도중 다른 세션의 저장으로 인덱스가 확장되었을 수 있으므로 현재 스냅샷 범위만 사용
+        ranges = [(start, stop) for start, stop in key_index.get(search_key, []) if start < len(rows)]
+        if not ranges:
+            return None
+
+        if len(ranges) == 1:
+            start, stop = ranges[0]
+            target_df = rows.slice(start, stop)
+        else:
+            target_df = pd.concat([rows.slice(start, stop) for start, stop in ranges])
+        return SearchResult.from_dataframe(target_df)
 
     def get_all_as_csv(self) -> str:
         """
         전체 데이터를 CSV 형식의 문자열로 반환합니다.
+        (대용량 기록은 iter_csv_chunks()로 스트리밍하는 것을 권장합니다.)
+        """
+        return b"".join(self.iter_csv_chunks()).decode("utf-8-sig")
+
+    def iter_csv_chunks(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        keyword: Optional[str] = None,
+        chunk_rows: int = 5000,
+        chunk_bytes: int = 1 << 20
+    ) -> Iterator[bytes]:
         """
+        검색 기록을 CSV 바이트 청크로 나누어 스트리밍합니다. (첫 청크에 BOM + 헤더 포함)
+        필터가 없고 파일이 현재 스키마이면 파일 바이트를 그대로 흘려보내 전체를 메모리에 올리지 않습니다.
+
+        Args:
+            start (datetime): 이 시각 이후(포함) 검색만 내보냄
+            end (datetime): 이 시각 이전(포함) 검색만 내보냄
+            keyword (str): 이 키워드로 검색한 기록만 내보냄
+            chunk_rows (int): 필터 적용 시 한 청크에 담을 행 수
+            chunk_bytes (int): 파일을 그대로 흘려보낼 때 한 청크의 바이트 수
+        """
+        if not os.path.exists(self.csv_path):
+            return
+
+        if start is None and end is None and keyword is None and self._read_header() == self.columns:
+            with open(self.csv_path, "rb") as f:
+                # 잠금을 잡고 잰 크기까지만 보내서 다른 세션이 쓰는 중인 행은 포함하지 않음
+                # (append는 앞부분을 바꾸지 않고, 재작성은 새 파일로 교체되므로 열어 둔 파일은 그대로임)
+                with file_lock(self.csv_path, shared=True):
+                    remaining = os.fstat(f.fileno()).st_size
+                chunk = f.read(min(chunk_bytes, remaining))
+                remaining -= len(chunk)
+                if not chunk.startswith(UTF8_BOM):
+                    chunk = UTF8_BOM + chunk
+                while chunk:
+                    yield chunk
+                    chunk = f.read(min(chunk_bytes, remaining))
+                    remaining -= len(chunk)
+            return
+
         df = self.load()
-        if df.empty:
-            return ""
-        return df.to_csv(index=False, encoding='utf-8-sig')
+        mask = pd.Series(True, index=df.index)
+        search_times = as_search_times(df["search_time"])
+        if start is not None:
+            mask &= search_times >= start
+        if end is not None:
+            mask &= search_times <= end
+        if keyword is not None:
+            mask &= df["keyword"] == keyword
+        df = df[mask]
+
+        frames = (df.iloc[i:i + chunk_rows] for i in range(0, len(df), chunk_rows))
+        yield from iter_csv_bytes(frames, self.columns)
 
     def get_trending_keywords(self, hours: int = 24, limit: int = 10) -> List[str]:
         """
         최근 hours 시간 기준 keyword count를 집계하여 상위 리스트를 반환합니다.
+        보관 기간(TRENDING_RETENTION_HOURS) 이내 조회는 저장 시점에 갱신되는 시간 버킷 집계를 사용하고,
+        그보다 긴 구간은 전체 기록을 집계합니다.
+        trending_mode가 "approx"이면 버킷 집계에 메모리가 고정된 Space-Saving 스케치를 사용합니다.
         """
-        df = self.load()
-        if df.empty:
+        if not os.path.exists(self.csv_path):
             return []
-            
+
         try:
-            # search_time을 datetime으로 변환
-            df['search_time'] = pd.to_datetime(df['search_time'])
-            
-            # 최근 N시간 이내의 데이터 필터링
-            now = datetime.now()
-            threshold = now - pd.Timedelta(hours=hours)
-            recent_df = df[df['search_time'] >= threshold]
-            
-            if recent_df.empty:
-                return []
-                
-            # 키워드별 중복 제거 (search_key 기준 1회만 카운트하여 키워드 노출 빈도 측정)
-            keyword_counts = recent_df[['search_key', 'keyword']].drop_duplicates()['keyword'].value_counts()
-            
-            return keyword_counts.head(limit).index.tolist()
+            if hours <= TRENDING_RETENTION_HOURS:
+                counter = snapshot_cache.get_trending_counter(
+                    self.csv_path, self._parse_csv, TRENDING_RETENTION_HOURS,
+                    mode=self.trending_mode, sketch_capacity=self.sketch_capacity
+                )
+                return counter.top(hours=hours, limit=limit)
+            return count_keywords_exact(
+                self.load(columns=["search_key", "search_time", "keyword"]), hours=hours, limit=limit
+            )
         except Exception as e:
             print(f"[경고] 인기 검색어 집계 실패: {e}")
             return []
+
+    def get_keyword_timeseries(
+        self,
+        keyword: str,
+        start: TimeBound = None,
+        end: TimeBound = None,
+        granularity: str = "hour"
+    ) -> pd.DataFrame:
+        """
+        키워드의 시간/일 단위 검색 수 추이를 반환합니다. (빈 구간은 0)
+        스냅샷마다 한 번 만들어 두고 저장 시 추가된 행만 반영하는 롤업에서 읽으므로 기사 행을 다시 집계하지 않습니다.
+
+        Args:
+            keyword (str): 조회할 검색 키워드
+            start (datetime | date): 이 시각이 속한 구간부터 포함 (없으면 첫 검색 구간부터)
+            end (datetime | date): 이 시각이 속한 구간까지 포함 (없으면 마지막 검색 구간까지)
+            granularity (str): "hour" | "day"
+
+        Returns:
+            pd.DataFrame: bucket(구간 시작 시각), search_count(검색 수) 컬럼
+        """
+        try:
+            return self._keyword_rollup().timeseries(keyword, start, end, granularity)
+        except Exception as e:
+            print(f"[경고] 키워드 추이 집계 실패: {e}")
+            return fill_buckets({}, None, None, granularity)
+
+    def get_top_keywords_by_day(self, day: Union[datetime, date], limit: int = 10) -> List[Tuple[str, int]]:
+        """
+        해당 날짜에 많이 검색된 키워드 상위 limit개를 (키워드, 검색 수)로 반환합니다.
+        """
+        try:
+            return self._keyword_rollup().top_by_day(day, limit)
+        except Exception as e:
+            print(f"[경고] 일별 인기 검색어 집계 실패: {e}")
+            return []
+
+    def get_daily_search_counts(self, start: TimeBound = None, end: TimeBound = None) -> pd.DataFrame:
+        """
+        날짜별 검색 수(서로 다른 search_key 수)를 반환합니다. (bucket, search_count 컬럼, 빈 날짜는 0)
+        """
+        try:
+            return self._keyword_rollup().daily_searches(start, end)
+        except Exception as e:
+            print(f"[경고] 일별 검색 수 집계 실패: {e}")
+            return fill_buckets({}, None, None, "day")
+
+    def _keyword_rollup(self) -> KeywordRollup:
+        """
+        현재 스냅샷의 키워드 롤업을 반환합니다. (파일이 없으면 빈 롤업)
+        """
+        if not os.path.exists(self.csv_path):
+            return KeywordRollup()
+        return snapshot_cache.get_keyword_rollup(self.csv_path, self._parse_csv)
+
+    def count_searches_for_url(self, url: str) -> int:
+        """
+        해당 기사 URL(정규화 기준)을 결과로 보여 준 검색 수를 반환합니다.
+        CSV는 기사를 검색마다 행으로 저장하므로, 스냅샷마다 URL별 검색 수 카운터를 한 번 만들어 두고
+        이후 추가된 행만 반영하여 조회는 딕셔너리 조회 한 번으로 처리합니다.
+        """
+        if not os.path.exists(self.csv_path):
+            return 0
+        try:
+            return snapshot_cache.get_url_counts(self.csv_path, self._parse_csv).get(normalize_url(url), 0)
+        except Exception as e:
+            print(f"[경고] CSV 로드 실패: {e}")
+            return 0
+
+    def search_text(self, query: str, limit: int = 20) -> List[TextSearchHit]:
+        """
+        저장된 기사의 제목, 스니펫, AI 요약에서 검색어를 찾아 관련도(BM25) 순으로 반환합니다.
+        색인은 "<CSV 경로>.textidx"에 보관되며, 처음 호출 시 기록 전체를 한 번 색인하고
+        이후에는 save()나 다른 세션이 추가한 행만 색인합니다.
+
+        Args:
+            query (str): 검색어 (한글은 띄어쓰기/조사와 무관하게 부분 일치)
+            limit (int): 반환할 최대 결과 수
+
+        Returns:
+            List[TextSearchHit]: 관련도 순 검색 결과
+        """
+        if not query.strip() or not os.path.exists(self.csv_path):
+            return []
+
+        try:
+            index = text_indexes.get(self.csv_path + TEXT_INDEX_SUFFIX)
+            rows = self._sync_text_index(index)
+            ranked = index.search(query, limit=limit, max_doc=len(rows))
+            # 색인 위치의 행만 꺼낸 뒤 문서 키로 짝지음 (색인과 스냅샷이 어긋나도 다른 기사를 돌려주지 않음)
+            docs, scores = index.docs(ranked)
+            return hits_for_docs(rows.take([doc_id for doc_id, _ in ranked]), docs, scores)
+        except Exception as e:
+            print(f"[경고] 기록 검색 실패: {e}")
+            return []
+
+    def _sync_text_index(self, index: TextIndex) -> ChunkedRows:
+        """
+        현재 스냅샷의 행까지 색인을 맞추고, 결과를 꺼낼 때 쓸 그 스냅샷의 행 위치 뷰를 반환합니다.
+        (새로 색인할 구간만 조각에서 잘라 읽으므로 전체 DataFrame을 만들지 않음)
+        """
+        rows = snapshot_cache.get_rows(self.csv_path, self._parse_csv)
+        index.sync(len(rows), lambda i: str(rows.slice(i, i + 1)["search_key"].iat[0]), rows.slice)
+        return rows
@@ -0,0 +1,449 @@
+import os
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from repositories.history_frame import concat_history_frames
+from repositories.history_listing import HistoryListing
+from repositories.keyword_rollup import KeywordRollup
+from repositories.trending_counter import TrendingCounter
+from repositories.write_coordinator import file_lock
+from utils.url_normalizer import normalize_url
+
+# (파일 크기, 수정 시각 ns) - 파일 버전 식별용
+FileStat = Tuple[int, int]
+
+# search_key -> 해당 키의 행 범위 [(start, stop), ...] (iloc 기준)
+KeyIndex = Dict[str, List[Tuple[int, int]]]
+
+# 정규화 URL -> 해당 기사를 결과로 보여 준 검색 수
+UrlCounts = Counter
+
+# CSV 바이트를 DataFrame으로 파싱하는 함수 (data, is_tail) - is_tail이면 헤더 없는 추가분
+CsvParser = Callable[[bytes, bool], pd.DataFrame]
+
+# 파일이 다시 쓰였는지 확인할 때 비교하는 바이트 수 (파일 앞부분 / 마지막으로 읽은 위치 직전)
+PROBE_SIZE = 64
+
+
+def merge_tail_chunks(chunks: List[pd.DataFrame]) -> List[pd.DataFrame]:
+    """
+    마지막 조각이 바로 앞 조각보다 크거나 같아지는 동안 둘을 합칩니다. (이진 카운터 방식)
+    조각 수는 행 수의 로그 수준으로 유지되고, 각 행이 다시 복사되는 횟수도 로그 수준이므로
+    추가할 때마다 전체 기록을 복사하지 않습니다. (전체 기록이 담긴 첫 조각은 추가분이 그만큼 쌓였을 때만 합쳐짐)
+    """
+    while len(chunks) > 1 and len(chunks[-2]) <= len(chunks[-1]):
+        merged = concat_history_frames(chunks[-2:], list(chunks[-2].columns))
+        chunks = chunks[:-2] + [merged]
+    return chunks
+
+
+def build_key_index(keys: np.ndarray, offset: int = 0, index: Optional[KeyIndex] = None) -> KeyIndex:
+    """
+    search_key 배열에서 키가 바뀌는 지점을 찾아 키별 연속 행 범위 인덱스를 만듭니다.
+    한 검색의 행들은 연속으로 저장되므로 범위 수는 행 수가 아니라 검색 수에 비례합니다.
+
+    Args:
+        keys (np.ndarray): search_key 컬럼 값 배열
+        offset (int): 배열 첫 행의 전체 DataFrame 기준 위치 (이어 붙일 때 사용)
+        index (KeyIndex): 확장할 기존 인덱스 (없으면 새로 생성)
+    """
+    index = {} if index is None else index
+    if len(keys) == 0:
+        return index
+
+    boundaries = np.flatnonzero(keys[1:] != keys[:-1]) + 1
+    starts = np.concatenate(([0], boundaries)) + offset
+    stops = np.concatenate((boundaries, [len(keys)])) + offset
+
+    for key, start, stop in zip(keys[starts - offset].tolist(), starts.tolist(), stops.tolist()):
+        ranges = index.setdefault(key, [])
+        if ranges and ranges[-1][1] == start:
+            # 기존 마지막 범위와 바로 이어지는 경우 병합
+            ranges[-1] = (ranges[-1][0], stop)
+        else:
+            ranges.append((start, stop))
+    return index
+
+
+def count_urls(df: pd.DataFrame, counts: Optional[UrlCounts] = None) -> UrlCounts:
+    """
+    행들의 기사 URL을 정규화하여 URL별 검색 수를 셉니다. (같은 검색 안의 중복 URL은 1회)
+
+    Args:
+        df (pd.DataFrame): search_key, url 컬럼을 포함한 행들
+        counts (UrlCounts): 누적할 기존 카운터 (없으면 새로 생성)
+    """
+    counts = Counter() if counts is None else counts
+    pairs = df[["search_key", "url"]].dropna().drop_duplicates()
+    if pairs.empty:
+        return counts
+    # 같은 URL 문자열은 한 번만 정규화
+    unique_urls = pairs["url"].astype(str).unique()
+    normalized = dict(zip(unique_urls, map(normalize_url, unique_urls)))
+    pairs = pairs.assign(url=pairs["url"].astype(str).map(normalized)).drop_duplicates()
+    counts.update(url for url in pairs["url"].tolist() if url)
+    return counts
+
+
+def file_stat(path: str) -> Optional[FileStat]:
+    """
+    파일의 (크기, mtime_ns)를 반환합니다. 파일이 없으면 None을 반환합니다.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_size, st.st_mtime_ns)
+
+
+class ChunkedRows:
+    """
+    스냅샷의 행 조각들을 하나로 합치지 않고 전체 기준 행 위치(iloc)로 읽는 읽기 전용 뷰입니다.
+    검색 1건이나 색인할 구간처럼 일부 행만 필요한 조회는 전체 DataFrame을 만들지 않고 해당 조각에서 잘라 냅니다.
+    """
+    def __init__(self, chunks: List[pd.DataFrame]):
+        self.chunks = chunks
+        self.columns = list(chunks[0].columns)
+        self.starts = np.cumsum([0] + [len(chunk) for chunk in chunks])
+
+    def __len__(self) -> int:
+        return int(self.starts[-1])
+
+    def slice(self, start: int, stop: int) -> pd.DataFrame:
+        """
+        전체 기준 [start, stop) 행을 반환합니다.
+        """
+        first = max(int(np.searchsorted(self.starts, start, side="right")) - 1, 0)
+        parts = []
+        for chunk, chunk_start in zip(self.chunks[first:], self.starts[first:].tolist()):
+            if chunk_start >= stop:
+                break
+            parts.append(chunk.iloc[max(start - chunk_start, 0):stop - chunk_start])
+        return concat_history_frames(parts, self.columns)
+
+    def take(self, positions: List[int]) -> pd.DataFrame:
+        """
+        전체 기준 행 위치들의 행을 주어진 순서대로 반환합니다.
+        """
+        return concat_history_frames([self.slice(i, i + 1) for i in positions], self.columns)
+
+
+@dataclass
+class Snapshot:
+    """
+    특정 시점의 CSV 파일 내용을 파싱한 DataFrame 스냅샷입니다.
+    저장/증분 읽기로 추가된 행은 기존 DataFrame에 바로 합치지 않고 조각(chunk)으로 덧붙여 두었다가,
+    전체 DataFrame이 필요한 조회(df)에서 한 번에 합칩니다. (일부 행만 필요한 조회는 ChunkedRows로 조각에서 바로 읽음)
+
+    Attributes:
+        stat (FileStat): 스냅샷이 반영한 파일의 (크기, mtime_ns)
+        chunks (List[pd.DataFrame]): 파일 순서대로 이어지는 행 조각들
+        offset (int): 파싱을 마친 바이트 위치 (다음 증분 읽기의 시작점)
+        head_probe (bytes): 파일 앞부분 바이트 (헤더 변경/재작성 감지용)
+        tail_probe (bytes): offset 직전 바이트 (중간 내용 변경 감지용)
+        key_index (KeyIndex): search_key별 행 범위 인덱스 (처음 필요할 때 생성)
+        trending (TrendingCounter): 시간 버킷별 인기 검색어 집계 (처음 필요할 때 생성)
+        url_counts (UrlCounts): 정규화 URL별 검색 수 (처음 필요할 때 생성)
+        rollup (KeywordRollup): 키워드별 시간/일 단위 검색 수 롤업 (처음 필요할 때 생성)
+        history (HistoryListing): 검색 시간순 검색 목록 (처음 필요할 때 생성)
+    """
+    stat: FileStat
+    chunks: List[pd.DataFrame]
+    offset: int = 0
+    head_probe: bytes = b""
+    tail_probe: bytes = b""
+    key_index: Optional[KeyIndex] = None
+    trending: Optional[TrendingCounter] = None
+    url_counts: Optional[UrlCounts] = None
+    rollup: Optional[KeywordRollup] = None
+    history: Optional[HistoryListing] = None
+
+    @property
+    def row_count(self) -> int:
+        return sum(len(chunk) for chunk in self.chunks)
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """
+        전체 행을 하나로 합친 DataFrame을 반환합니다. (쌓인 조각은 이때 한 번 합쳐 두고 이후 재사용)
+        """
+        if len(self.chunks) > 1:
+            self.chunks = [concat_history_frames(self.chunks, list(self.chunks[0].columns))]
+        return self.chunks[0]
+
+
+class SnapshotCache:
+    """
+    파일 경로별 DataFrame 스냅샷을 프로세스 전역으로 공유하는 캐시입니다.
+    Streamlit의 rerun/세션 간에 재사용되며, 파일 크기나 mtime이 바뀌면 다시 읽습니다.
+
+    파일이 append로만 커진 경우에는 마지막으로 읽은 바이트 위치(offset) 이후의 추가분만
+    파싱하여 기존 스냅샷에 이어 붙이고, 파일이 줄었거나 앞부분이 바뀌었으면 전체를 다시 읽습니다.
+    조회는 파일 공유 잠금을 잡고 수행하므로 다른 세션/프로세스가 쓰는 도중의 행을 읽지 않습니다.
+
+    Attributes:
+        hits (int): 캐시 적중 횟수
+        misses (int): 캐시 미스(전체 재파싱) 횟수
+        tail_reads (int): 추가분만 파싱한 증분 갱신 횟수
+    """
+    def __init__(self):
+        self._entries: Dict[str, Snapshot] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.tail_reads = 0
+
+    def get(self, path: str, parser: CsvParser) -> pd.DataFrame:
+        """
+        캐시된 스냅샷의 읽기 전용 뷰(얕은 복사본)를 반환합니다.
+        캐시가 없거나 파일이 변경되었으면 추가분 또는 전체를 parser로 파싱하여 갱신합니다.
+        """
+        with file_lock(path, shared=True), self._lock:
+            return self._get_snapshot(path, parser).df.copy(deep=False)
+
+    def get_rows(self, path: str, parser: CsvParser) -> ChunkedRows:
+        """
+        get()과 같은 스냅샷을 조각을 합치지 않은 행 위치 뷰로 반환합니다. (일부 행만 읽는 조회용)
+        """
+        with file_lock(path, shared=True), self._lock:
+            return ChunkedRows(list(self._get_snapshot(path, parser).chunks))
+
+    def get_with_key_index(self, path: str, parser: CsvParser) -> Tuple[ChunkedRows, KeyIndex]:
+        """
+        get_rows()와 같이 스냅샷의 행 위치 뷰를 반환하면서, search_key별 행 범위 인덱스를 함께 반환합니다.
+        인덱스는 스냅샷마다 한 번만 만들어지고 이후 증분 갱신 시에는 확장됩니다.
+        """
+        with file_lock(path, shared=True), self._lock:
+            snapshot = self._get_snapshot(path, parser)
+            if snapshot.key_index is None:
+                snapshot.key_index = {}
+                start = 0
+                for chunk in snapshot.chunks:
+                    build_key_index(chunk["search_key"].to_numpy(), offset=start, index=snapshot.key_index)
+                    start += len(chunk)
+            return ChunkedRows(list(snapshot.chunks)), snapshot.key_index
+
+    def get_url_counts(self, path: str, parser: CsvParser) -> UrlCounts:
+        """
+        스냅샷의 정규화 URL별 검색 수 카운터를 반환합니다.
+        스냅샷마다 한 번만 만들어지고 이후 증분 갱신 시에는 추가된 행만 반영됩니다.
+        """
+        with file_lock(path, shared=True), self._lock:
+            snapshot = self._get_snapshot(path, parser)
+            if snapshot.url_counts is None:
+                snapshot.url_counts = Counter()
+                for chunk in snapshot.chunks:
+                    count_urls(chunk, snapshot.url_counts)
+            return snapshot.url_counts
+
+    def get_keyword_rollup(self, path: str, parser: CsvParser) -> KeywordRollup:
+        """
+        스냅샷의 키워드 검색 수 롤업을 반환합니다.
+        스냅샷마다 한 번만 만들어지고 이후 증분 갱신 시에는 추가된 행만 반영됩니다.
+        """
+        with file_lock(path, shared=True), self._lock:
+            snapshot = self._get_snapshot(path, parser)
+            if snapshot.rollup is None:
+                snapshot.rollup = KeywordRollup()
+                for chunk in snapshot.chunks:
+                    snapshot.rollup.add_rows(chunk)
+            return snapshot.rollup
+
+    def get_history_listing(self, path: str, parser: CsvParser) -> HistoryListing:
+        """
+        스냅샷의 검색 시간순 검색 목록을 반환합니다.
+        스냅샷마다 한 번만 만들어지고 이후 증분 갱신 시에는 추가된 행만 반영됩니다.
+        """
+        with file_lock(path, shared=True), self._lock:
+            snapshot = self._get_snapshot(path, parser)
+            if snapshot.history is None:
+                snapshot.history = HistoryListing()
+                for chunk in snapshot.chunks:
+                    snapshot.history.add_rows(chunk)
+            return snapshot.history
+
+    def get_trending_counter(
+        self,
+        path: str,
+        parser: CsvParser,
+        retention_hours: int,
+        mode: str = "exact",
+        sketch_capacity: int = 1000
+    ) -> TrendingCounter:
+        """
+        스냅샷에 딸린 인기 검색어 집계기를 반환합니다.
+        프로세스 시작 후 처음 호출될 때(또는 집계 설정이 바뀌었을 때) 저장된 기록으로 한 번 만들어지고,
+        이후에는 save()나 증분 읽기로 추가되는 행만 반영됩니다.
+        """
+        with file_lock(path, shared=True), self._lock:
+            snapshot = self._get_snapshot(path, parser)
+            trending = snapshot.trending
+            if (
+                trending is None
+                or trending.retention_hours < retention_hours
+                or trending.mode != mode
+                or trending.sketch_capacity != sketch_capacity
+            ):
+                trending = TrendingCounter(retention_hours=retention_hours, mode=mode, sketch_capacity=sketch_capacity)
+                for chunk in snapshot.chunks:
+                    trending.add_rows(chunk)
+                snapshot.trending = trending
+            return snapshot.trending
+
+    def _get_snapshot(self, path: str, parser: CsvParser) -> Snapshot:
+        """
+        (잠금을 잡은 상태에서 호출) 최신 스냅샷을 반환하고, 필요하면 증분/전체 파싱으로 갱신합니다.
+        """
+        key = os.path.abspath(path)
+        stat = file_stat(path)
+        entry = self._entries.get(key)
+        if entry is not None and entry.stat == stat:
+            self.hits += 1
+            return entry
+
+        if entry is not None and stat is not None:
+            refreshed = self._read_tail(path, entry, stat, parser)
+            if refreshed is not None:
+                self.tail_reads += 1
+                self._entries[key] = refreshed
+                return refreshed
+
+        self.misses += 1
+        snapshot = self._read_full(path, parser)
+        if snapshot is not None:
+            self._entries[key] = snapshot
+            return snapshot
+
+        # 파일이 없거나 쓰는 중이라 행 경계가 맞지 않으면 캐시하지 않고 그대로 파싱
+        self._entries.pop(key, None)
+        if stat is None:
+            return Snapshot(stat=(0, 0), chunks=[parser(b"", False)])
+        with open(path, "rb") as f:
+            return Snapshot(stat=stat, chunks=[parser(f.read(), False)])
+
+    def _read_full(self, path: str, parser: CsvParser) -> Optional[Snapshot]:
+        """
+        파일 전체를 읽어 새 스냅샷을 만듭니다. 읽은 바이트 수를 offset으로 기록합니다.
+        마지막 행이 줄바꿈으로 끝나지 않으면(다른 세션이 쓰는 중) None을 반환합니다.
+        """
+        # 읽기 전에 stat을 먼저 기록해야 읽는 도중 변경되어도 다음 조회에서 다시 확인됨
+        stat = file_stat(path)
+        if stat is None:
+            return None
+        with open(path, "rb") as f:
+            data = f.read(stat[0])
+        if data and not data.endswith(b"\n"):
+            return None
+        return Snapshot(
+            stat=stat,
+            chunks=[parser(data, False)],
+            offset=len(data),
+            head_probe=data[:PROBE_SIZE],
+            tail_probe=data[-PROBE_SIZE:]
+        )
+
+    def _read_tail(self, path: str, entry: Snapshot, stat: FileStat, parser: CsvParser) -> Optional[Snapshot]:
+        """
+        파일이 append로만 커졌다면 entry.offset 이후 추가분만 파싱하여 확장한 스냅샷을 반환합니다.
+        파일이 줄었거나 앞부분/기존 끝부분이 달라졌으면(재작성) None을 반환하여 전체 읽기로 넘깁니다.
+        """
+        if stat[0] < entry.offset or entry.offset == 0:
+            return None
+
+        with open(path, "rb") as f:
+            if f.read(len(entry.head_probe)) != entry.head_probe:
+                return None
+            f.seek(entry.offset - len(entry.tail_probe))
+            if f.read(len(entry.tail_probe)) != entry.tail_probe:
+                return None
+            tail = f.read(stat[0] - entry.offset)
+
+        if not tail:
+            # 내용은 그대로이고 mtime만 바뀐 경우
+            return Snapshot(stat=stat, chunks=entry.chunks, offset=entry.offset, head_probe=entry.head_probe,
+                            tail_probe=entry.tail_probe, key_index=entry.key_index, trending=entry.trending,
+                            url_counts=entry.url_counts, rollup=entry.rollup,
+                            history=entry.history)
+        if not tail.endswith(b"\n"):
+            return None
+        return self._extend(entry, stat, tail, parser(tail, True))
+
+    def _extend(self, entry: Snapshot, stat: FileStat, tail: bytes, new_rows: pd.DataFrame) -> Snapshot:
+        """
+        기존 스냅샷 뒤에 추가분 행을 조각으로 덧붙이고 offset/probe/인덱스를 갱신한 새 스냅샷을 만듭니다.
+        기존 행은 복사하지 않으며, 인덱스와 집계도 추가분 행만 반영하므로 비용은 추가분 크기에 비례합니다.
+        """
+        key_index = entry.key_index
+        if key_index is not None:
+            build_key_index(new_rows["search_key"].to_numpy(), offset=entry.row_count, index=key_index)
+        if entry.trending is not None:
+            entry.trending.add_rows(new_rows)
+        if entry.url_counts is not None:
+            count_urls(new_rows, entry.url_counts)
+        if entry.rollup is not None:
+            entry.rollup.add_rows(new_rows)
+        if entry.history is not None:
+            entry.history.add_rows(new_rows)
+        return Snapshot(
+            stat=stat,
+            chunks=merge_tail_chunks(entry.chunks + [new_rows]) if len(new_rows) else entry.chunks,
+            offset=entry.offset + len(tail),
+            head_probe=entry.head_probe,
+            tail_probe=(entry.tail_probe + tail)[-PROBE_SIZE:],
+            key_index=key_index,
+            trending=entry.trending,
+            url_counts=entry.url_counts,
+            rollup=entry.rollup,
+            history=entry.history
+        )
+
+    def append(self, path: str, before: Optional[FileStat], data: bytes, parser: CsvParser):
+        """
+        save()로 파일 끝에 행을 추가한 뒤 호출하여, 방금 쓴 바이트만 파싱해 스냅샷을 갱신합니다.
+        캐시가 추가 직전 파일 상태와 일치하고 그 사이 다른 쓰기가 없었을 때만 이어 붙이며,
+        그 외에는 다음 조회 때 증분 읽기로 따라잡도록 그대로 둡니다.
+
+        Args:
+            path (str): CSV 파일 경로
+            before (FileStat): 추가 직전의 파일 stat
+            data (bytes): 이번에 추가한 바이트
+            parser (CsvParser): 추가분 파싱 함수
+        """
+        key = os.path.abspath(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            after = file_stat(path)
+            if (
+                entry is None or before is None or after is None
+                or entry.stat != before
+                or entry.offset != before[0]
+                or after[0] != before[0] + len(data)
+            ):
+                return
+            self._entries[key] = self._extend(entry, after, data, parser(data, True))
+
+    def invalidate(self, path: str):
+        """
+        해당 경로의 스냅샷을 캐시에서 제거합니다.
+        """
+        with self._lock:
+            self._entries.pop(os.path.abspath(path), None)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        캐시 적중/미스/증분 갱신 카운터와 보관 중인 스냅샷 수를 반환합니다.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "tail_reads": self.tail_reads,
+                "entries": len(self._entries)
+            }
+
+
+# 프로세스 전역에서 공유하는 싱글톤 인스턴스
+snapshot_cache = SnapshotCache()
@@ -0,0 +1,741 @@
+import os
+import sys
+import sqlite3
+import pandas as pd
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from datetime import date, datetime, timedelta
+from domain.search_result import SearchResult
+from domain.text_search_hit import TextSearchHit
+from domain.history_page import HistoryPage
+from repositories.csv_export import format_search_time, iter_csv_bytes
+from repositories.keyword_rollup import TimeBound, bucket_start, fill_buckets, top_counts
+from repositories.history_listing import DEFAULT_PAGE_SIZE, decode_cursor, make_entry, make_page
+from repositories.text_index import TEXT_INDEX_COLUMNS, TEXT_INDEX_SUFFIX, TextIndex, hits_for_docs, text_indexes
+from utils.url_normalizer import normalize_url, url_hash
+
+# 이전 구조의 테이블을 이관할 때 한 번에 읽는 행 수
+MIGRATION_BATCH_ROWS = 10000
+
+class SqliteSearchRepository:
+    """
+    SQLite 파일을 이용하여 검색 기록을 로드, 저장 및 조회하는 리포지토리 클래스입니다.
+    SearchRepository(CSV)와 같은 공개 메서드를 제공하므로 그대로 교체하여 사용할 수 있습니다.
+    WAL 모드를 사용하여 여러 Streamlit 세션이 읽는 동안에도 한 세션이 쓸 수 있습니다.
+
+    검색 1건 = searches 1행으로 정규화하여 저장하므로 AI 요약과 연관 키워드가 기사 행마다 반복 저장되지 않습니다.
+    기사는 정규화한 URL의 해시(article_id)를 키로 articles에 한 번만 저장되고,
+    검색은 search_articles로 기사를 참조합니다. (여러 검색에 같은 기사가 나와도 제목/스니펫은 1번만 저장)
+    articles.search_count에 기사를 노출한 검색 수를 함께 유지하여 URL별 노출 횟수를 키 조회 한 번으로 반환합니다.
+    검색을 저장할 때 keyword_hourly/keyword_daily(키워드별 시간/일 단위 검색 수)와 daily_searches(일별 검색 수)
+    롤업 테이블도 같은 트랜잭션에서 갱신하여, 추이/인기 검색어 조회는 원본 행 대신 작은 집계 테이블을 읽습니다.
+
+    Attributes:
+        db_path (str): 데이터가 저장될 SQLite 파일 경로
+        columns (List[str]): load()가 반환하는 Long format 컬럼 리스트 (CSV와 동일)
+    """
+    def __init__(self, db_path: str):
+        """
+        SqliteSearchRepository를 초기화합니다. 필요한 경우 데이터 디렉토리와 테이블/인덱스를 생성합니다.
+
+        Args:
+            db_path (str): 검색 기록을 저장할 SQLite 파일 경로
+        """
+        self.db_path = db_path
+        self.columns = [
+            "search_key", "search_time", "keyword", "article_index",
+            "title", "url", "snippet", "ai_summary", "related_keywords"
+        ]
+        # data/ 폴더가 없으면 자동 생성
+        os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        self._init_schema()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """
+        작업 단위마다 새 커넥션을 열고, 정상 종료 시 커밋 / 예외 시 롤백한 뒤 닫습니다.
+        (Streamlit 세션마다 스레드가 다르므로 커넥션을 공유하지 않습니다.)
+        """
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _init_schema(self):
+        """
+        WAL 모드를 켜고 searches/articles/search_articles 테이블, 키워드 롤업 테이블과 조회용 인덱스를 생성합니다.
+        이전 버전의 Long format 테이블(search_history)이나 검색별 기사 테이블이 있으면 새 구조로 이관하고,
+        롤업 테이블이 없던 DB는 기존 searches로 롤업을 한 번 채웁니다.
+        """
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+
+            # 검색별로 기사를 저장하던 이전 articles 테이블은 이름을 바꿔 두고 아래에서 이관
+            article_columns = [row[1] for row in conn.execute("PRAGMA table_info(articles)")]
+            if "search_id" in article_columns:
+                conn.execute("ALTER TABLE articles RENAME TO articles_by_search")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS searches (
+                    search_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    search_key TEXT NOT NULL,
+                    search_time TEXT NOT NULL,
+                    keyword TEXT NOT NULL,
+                    ai_summary TEXT,
+                    related_keywords TEXT
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS articles (
+                    article_id INTEGER PRIMARY KEY,
+                    url TEXT,
+                    title TEXT,
+                    snippet TEXT,
+                    pub_date TEXT,
+                    search_count INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS search_articles (
+                    search_id INTEGER NOT NULL REFERENCES searches(search_id),
+                    article_index INTEGER NOT NULL,
+                    article_id INTEGER NOT NULL REFERENCES articles(article_id),
+                    PRIMARY KEY (search_id, article_index)
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_search_articles_article ON search_articles(article_id, search_id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_searches_search_key ON searches(search_key)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_searches_search_time ON searches(search_time)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_searches_keyword ON searches(keyword)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_searches_time_key ON searches(search_time, search_key)")
+
+            has_rollups = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'daily_searches'"
+            ).fetchone()
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS keyword_hourly (
+                    keyword TEXT NOT NULL,
+                    hour TEXT NOT NULL,
+                    search_count INTEGER NOT NULL,
+                    PRIMARY KEY (keyword, hour)
+                ) WITHOUT ROWID
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS keyword_daily (
+                    day TEXT NOT NULL,
+                    keyword TEXT NOT NULL,
+                    search_count INTEGER NOT NULL,
+                    PRIMARY KEY (day, keyword)
+                ) WITHOUT ROWID
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS daily_searches (
+                    day TEXT PRIMARY KEY,
+                    search_count INTEGER NOT NULL
+                ) WITHOUT ROWID
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_keyword_hourly_hour ON keyword_hourly(hour)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_keyword_daily_keyword ON keyword_daily(keyword, day)")
+            if not has_rollups:
+                # 이관보다 먼저 채워야 아래 이관으로 추가되는 검색이 두 번 집계되지 않음
+                self._backfill_rollups(conn)
+
+            legacy = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'search_history'"
+            ).fetchone()
+            if legacy:
+                self._migrate_legacy_table(conn)
+
+            by_search = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'articles_by_search'"
+            ).fetchone()
+            if by_search:
+                self._migrate_articles_by_search(conn)
+
+    def _migrate_legacy_table(self, conn: sqlite3.Connection):
+        """
+        Long format 테이블(search_history)의 행을 searches/articles로 옮기고 기존 테이블을 삭제합니다.
+        """
+        chunks = pd.read_sql_query(
+            f"SELECT {', '.join(self.columns)} FROM search_history ORDER BY rowid", conn, chunksize=10000
+        )
+        self._insert_long_rows(conn, chunks)
+        conn.execute("DROP TABLE search_history")
+
+    def _migrate_articles_by_search(self, conn: sqlite3.Connection):
+        """
+        검색별 기사 테이블(articles_by_search)의 행을 URL 기준 articles + search_articles로 옮기고 기존 테이블을 삭제합니다.
+        (테이블 전체를 메모리에 올리지 않도록 MIGRATION_BATCH_ROWS행씩 나누어 읽음)
+        """
+        cursor = conn.execute("""
+            SELECT search_id, article_index, title, url, snippet, pub_date
+            FROM articles_by_search ORDER BY search_id, article_index
+        """)
+        columns = [c[0] for c in cursor.description]
+        while True:
+            rows = cursor.fetchmany(MIGRATION_BATCH_ROWS)
+            if not rows:
+                break
+            for row in rows:
+                record = dict(zip(columns, row))
+                self._insert_articles(conn, record.pop("search_id"), [record])
+        conn.execute("DROP TABLE articles_by_search")
+
+    def _backfill_rollups(self, conn: sqlite3.Connection):
+        """
+        이미 저장된 searches 행으로 키워드 롤업 테이블을 채웁니다. (롤업 테이블을 처음 만들 때 1회)
+        """
+        conn.execute("""
+            INSERT INTO keyword_hourly (keyword, hour, search_count)
+            SELECT keyword, substr(search_time, 1, 13) || ':00:00', COUNT(*)
+            FROM searches GROUP BY 1, 2
+        """)
+        conn.execute("""
+            INSERT INTO keyword_daily (day, keyword, search_count)
+            SELECT substr(search_time, 1, 10), keyword, COUNT(*)
+            FROM searches GROUP BY 1, 2
+        """)
+        conn.execute("""
+            INSERT INTO daily_searches (day, search_count)
+            SELECT substr(search_time, 1, 10), COUNT(*)
+            FROM searches GROUP BY 1
+        """)
+
+    def load(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        전체 검색 기록을 저장 순서대로 Long format(기사 1건=1행) DataFrame으로 로드합니다.
+        기사가 없는 검색은 article_index 0인 행 하나로 표현됩니다.
+        columns를 지정하면 해당 컬럼만 조회합니다.
+        """
+        columns = columns or self.columns
+        try:
+            with self._connect() as conn:
+                return pd.read_sql_query(
+                    f"SELECT {', '.join(columns)} FROM ({self._long_format_sql()})", conn
+                )
+        except Exception as e:
+            print(f"[경고] DB 로드 실패: {e}")
+            return pd.DataFrame(columns=columns)
+
+    def _long_format_sql(self, where: str = "", with_search_id: bool = False) -> str:
+        """
+        searches/search_articles/articles를 조인하여 CSV와 같은 Long format 컬럼으로 펼치는 SQL을 반환합니다.
+        where에는 searches(s) 기준 조건식을 넘길 수 있고, with_search_id이면 맨 앞에 search_id 컬럼을 붙입니다.
+        """
+        return f"""
+            SELECT {"s.search_id, " if with_search_id else ""}s.search_key, s.search_time, s.keyword,
+                   COALESCE(sa.article_index, 0) AS article_index,
+                   a.title, a.url, a.snippet, s.ai_summary, s.related_keywords
+            FROM searches s
+            LEFT JOIN search_articles sa ON sa.search_id = s.search_id
+            LEFT JOIN articles a ON a.article_id = sa.article_id
+            {"WHERE " + where if where else ""}
+            ORDER BY s.search_id, sa.article_index
+        """
+
+    def save(self, search_result: SearchResult) -> bool:
+        """
+        검색 결과를 하나의 트랜잭션으로 searches 1행 + search_articles N행으로 저장합니다.
+        이미 저장된 URL의 기사는 새로 저장하지 않고 참조와 노출 횟수만 추가합니다.
+        """
+        try:
+            search_record, article_records = search_result.to_records()
+            with self._connect() as conn:
+                self._insert_search(conn, search_record, article_records)
+        except Exception as e:
+            print(f"[에러] DB 저장 실패: {e}")
+            return False
+
+        # 이 프로세스에서 전문 검색 색인을 쓰고 있으면 방금 추가된 행까지 색인
+        index = text_indexes.opened(self.db_path + TEXT_INDEX_SUFFIX)
+        if index is not None:
+            try:
+                self._sync_text_index(index)
+            except Exception as e:
+                print(f"[경고] 검색 색인 갱신 실패: {e}")
+        return True
+
+    def _insert_search(self, conn: sqlite3.Connection, search_record: Dict, article_records: List[Dict]) -> int:
+        """
+        검색 레코드 1건과 기사 레코드들을 삽입하고 키워드 롤업을 갱신한 뒤 새 search_id를 반환합니다.
+        """
+        cursor = conn.execute(
+            """
+            INSERT INTO searches (search_key, search_time, keyword, ai_summary, related_keywords)
+            VALUES (:search_key, :search_time, :keyword, :ai_summary, :related_keywords)
+            """,
+            search_record
+        )
+        search_id = cursor.lastrowid
+        self._insert_articles(conn, search_id, article_records)
+        self._update_rollups(conn, search_record["keyword"], str(search_record["search_time"]))
+        return search_id
+
+    def _update_rollups(self, conn: sqlite3.Connection, keyword: str, search_time: str):
+        """
+        검색 1건을 키워드 시간/일 단위 검색 수와 일별 검색 수에 더합니다.
+        (search_time은 "YYYY-MM-DD HH:MM:SS" 문자열이므로 앞부분을 잘라 구간 키로 사용)
+        """
+        hour, day = search_time[:13] + ":00:00", search_time[:10]
+        conn.execute(
+            """
+            INSERT INTO keyword_hourly (keyword, hour, search_count) VALUES (?, ?, 1)
+            ON CONFLICT(keyword, hour) DO UPDATE SET search_count = search_count + 1
+            """,
+            (keyword, hour)
+        )
+        conn.execute(
+            """
+            INSERT INTO keyword_daily (day, keyword, search_count) VALUES (?, ?, 1)
+            ON CONFLICT(day, keyword) DO UPDATE SET search_count = search_count + 1
+            """,
+            (day, keyword)
+        )
+        conn.execute(
+            """
+            INSERT INTO daily_searches (day, search_count) VALUES (?, 1)
+            ON CONFLICT(day) DO UPDATE SET search_count = search_count + 1
+            """,
+            (day,)
+        )
+
+    def _insert_articles(self, conn: sqlite3.Connection, search_id: int, article_records: List[Dict]):
+        """
+        기사들을 URL 해시 키로 articles에 (없을 때만) 저장하고 search_articles로 검색과 연결합니다.
+        같은 검색에서 처음 연결되는 기사만 search_count를 1 증가시킵니다.
+        """
+        for record in article_records:
+            article_id = self._article_id(record)
+            conn.execute(
+                """
+                INSERT INTO articles (article_id, url, title, snippet, pub_date)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(article_id) DO UPDATE SET
+                    pub_date = COALESCE(NULLIF(articles.pub_date, ''), excluded.pub_date)
+                """,
+                (article_id, record.get("url"), record.get("title"), record.get("snippet"), record.get("pub_date") or "")
+            )
+            already_linked = conn.execute(
+                "SELECT 1 FROM search_articles WHERE article_id = ? AND search_id = ?", (article_id, search_id)
+            ).fetchone()
+            conn.execute(
+                "INSERT OR IGNORE INTO search_articles (search_id, article_index, article_id) VALUES (?, ?, ?)",
+                (search_id, int(record["article_index"]), article_id)
+            )
+            if not already_linked:
+                conn.execute("UPDATE articles SET search_count = search_count + 1 WHERE article_id = ?", (article_id,))
+
+    @staticmethod
+    def _article_id(record: Dict) -> int:
+        """
+        기사 키를 계산합니다. URL이 없는 기사는 제목+스니펫으로 대신 구분합니다.
+        """
+        if normalize_url(record.get("url") or ""):
+            return url_hash(record["url"])
+        return url_hash(f"text:{record.get('title') or ''}\n{record.get('snippet') or ''}")
+
+    def _insert_long_rows(self, conn: sqlite3.Connection, chunks: Iterable[pd.DataFrame], skip_keys: Optional[Set[str]] = None) -> int:
+        """
+        Long format 행 묶음들을 검색 단위로 다시 묶어 searches/articles에 삽입합니다.
+        한 검색의 행들은 연속해서 저장되어 있으므로, (search_key, search_time)이 바뀌는 지점마다
+        새 검색 레코드를 만들며 청크 경계를 넘어가는 검색도 이어서 처리합니다.
+
+        Returns:
+            int: 삽입한 Long format 행 수
+        """
+        skip_keys = skip_keys or set()
+        current = None     # 현재 처리 중인 (search_key, search_time)
+        search_id = None
+        inserted = 0
+
+        for chunk in chunks:
+            # 구 버전(8컬럼) 데이터 호환
+            for col in self.columns:
+                if col not in chunk.columns:
+                    chunk[col] = None
+            chunk = chunk[self.columns].astype(object).where(chunk[self.columns].notna(), None)
+
+            for row in chunk.itertuples(index=False):
+                if row.search_key in skip_keys:
+                    continue
+                block = (row.search_key, str(row.search_time))
+                if block != current:
+                    current = block
+                    search_id = self._insert_search(conn, {
+                        "search_key": row.search_key,
+                        "search_time": str(row.search_time),
+                        "keyword": row.keyword,
+                        "ai_summary": row.ai_summary,
+                        "related_keywords": row.related_keywords
+                    }, [])
+                if row.article_index is not None and int(row.article_index) > 0:
+                    self._insert_articles(conn, search_id, [{
+                        "article_index": int(row.article_index),
+                        "title": row.title,
+                        "url": row.url,
+                        "snippet": row.snippet,
+                        "pub_date": ""
+                    }])
+                inserted += 1
+        return inserted
+
+    def get_all_keys(self) -> List[str]:
+        """
+        저장된 모든 search_key를 검색 시간 기준 최신순으로 정렬하여 반환합니다.
+        """
+        with self._connect() as conn:
+            rows = conn.execute("""
+                SELECT search_key, MAX(search_time) AS latest
+                FROM searches
+                GROUP BY search_key
+                ORDER BY latest DESC, search_key DESC
+            """).fetchall()
+        return [row[0] for row in rows]
+
+    def list_history(
+        self,
+        cursor: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        keyword_prefix: Optional[str] = None
+    ) -> HistoryPage:
+        """
+        검색 기록을 검색 시간 최신순으로 한 페이지씩 반환합니다. (목록 표시용 라벨 포함)
+        (search_time, search_key) 인덱스를 커서 위치부터 역순으로 page_size + 1행만 읽습니다.
+
+        Args:
+            cursor (str): 이전 페이지의 next_cursor (없으면 가장 최근 검색부터)
+            page_size (int): 한 페이지의 최대 항목 수
+            start (datetime): 이 시각 이후(포함) 검색만 나열
+            end (datetime): 이 시각 이전(포함) 검색만 나열
+            keyword_prefix (str): 검색어가 이 문자열로 시작하는 기록만 나열
+
+        Returns:
+            HistoryPage: 검색 시간 최신순 항목들과 다음 페이지 커서
+        """
+        conditions, params = [], []
+        if cursor:
+            conditions.append("(search_time, search_key) < (?, ?)")
+            params.extend(decode_cursor(cursor))
+        if start is not None:
+            conditions.append("search_time >= ?")
+            params.append(format_search_time(start))
+        if end is not None:
+            conditions.append("search_time <= ?")
+            params.append(format_search_time(end))
+        if keyword_prefix:
+            conditions.append("substr(keyword, 1, ?) = ?")
+            params.extend([len(keyword_prefix), keyword_prefix])
+        try:
+            with self._connect() as conn:
+                rows = conn.execute(
+                    f"""
+                    SELECT search_key, search_time, keyword FROM searches
+                    {"WHERE " + " AND ".join(conditions) if conditions else ""}
+                    ORDER BY search_time DESC, search_key DESC
+                    LIMIT ?
+                    """,
+                    params + [page_size + 1]
+                ).fetchall()
+            return make_page([make_entry(*row) for row in rows], page_size)
+        except Exception as e:
+            print(f"[경고] 검색 기록 목록 조회 실패: {e}")
+            return HistoryPage()
+
+    def find_by_key(self, search_key: str) -> Optional[SearchResult]:
+        """
+        특정 search_key에 해당하는 검색 레코드와 기사 레코드를 인덱스로 조회하여 SearchResult 객체로 복원합니다.
+        (같은 키로 저장된 검색이 여럿이면 기사를 이어 붙입니다.)
+        """
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            searches = conn.execute(
+                """
+                SELECT search_id, search_key, search_time, keyword, ai_summary, related_keywords
+                FROM searches WHERE search_key = ? ORDER BY search_id
+                """,
+                (search_key,)
+            ).fetchall()
+            if not searches:
+                return None
+
+            search_ids = [row["search_id"] for row in searches]
+            articles = conn.execute(
+                f"""
+                SELECT sa.article_index, a.title, a.url, a.snippet, a.pub_date
+                FROM search_articles sa JOIN articles a ON a.article_id = sa.article_id
+                WHERE sa.search_id IN ({', '.join('?' for _ in search_ids)})
+                ORDER BY sa.search_id, sa.article_index
+                """,
+                search_ids
+            ).fetchall()
+
+        return SearchResult.from_records(dict(searches[0]), [dict(row) for row in articles])
+
+    def get_all_as_csv(self) -> str:
+        """
+        전체 데이터를 CSV 형식의 문자열로 반환합니다.
+        (대용량 기록은 iter_csv_chunks()로 스트리밍하는 것을 권장합니다.)
+        """
+        return b"".join(self.iter_csv_chunks()).decode("utf-8-sig")
+
+    def iter_csv_chunks(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        keyword: Optional[str] = None,
+        chunk_rows: int = 5000
+    ) -> Iterator[bytes]:
+        """
+        검색 기록을 Long format CSV 바이트 청크로 나누어 스트리밍합니다. (첫 청크에 BOM + 헤더 포함)
+        기간/키워드 조건은 search_time, keyword 인덱스를 사용하여 DB에서 거릅니다.
+
+        Args:
+            start (datetime): 이 시각 이후(포함) 검색만 내보냄
+            end (datetime): 이 시각 이전(포함) 검색만 내보냄
+            keyword (str): 이 키워드로 검색한 기록만 내보냄
+            chunk_rows (int): 한 청크에 담을 행 수
+        """
+        conditions, params = [], []
+        if start is not None:
+            conditions.append("s.search_time >= ?")
+            params.append(format_search_time(start))
+        if end is not None:
+            conditions.append("s.search_time <= ?")
+            params.append(format_search_time(end))
+        if keyword is not None:
+            conditions.append("s.keyword = ?")
+            params.append(keyword)
+
+        with self._connect() as conn:
+            frames = pd.read_sql_query(
+                self._long_format_sql(" AND ".join(conditions)), conn, params=params, chunksize=chunk_rows
+            )
+            yield from iter_csv_bytes(frames, self.columns)
+
+    def get_trending_keywords(self, hours: int = 24, limit: int = 10) -> List[str]:
+        """
+        최근 hours 시간 기준 keyword count를 집계하여 상위 리스트를 반환합니다.
+        저장 시 갱신되는 keyword_hourly 롤업의 시간 구간만 합산하므로 원본 검색 행을 훑지 않습니다.
+        (집계 단위가 1시간이므로 구간 시작 시각이 걸친 1시간은 통째로 포함)
+        """
+        threshold = format_search_time(bucket_start(datetime.now() - timedelta(hours=hours), "hour"))
+        try:
+            with self._connect() as conn:
+                rows = conn.execute("""
+                    SELECT keyword, SUM(search_count) AS cnt
+                    FROM keyword_hourly
+                    WHERE hour >= ?
+                    GROUP BY keyword
+                    ORDER BY cnt DESC, MAX(hour) DESC
+                    LIMIT ?
+                """, (threshold, limit)).fetchall()
+            return [row[0] for row in rows]
+        except Exception as e:
+            print(f"[경고] 인기 검색어 집계 실패: {e}")
+            return []
+
+    def get_keyword_timeseries(
+        self,
+        keyword: str,
+        start: TimeBound = None,
+        end: TimeBound = None,
+        granularity: str = "hour"
+    ) -> pd.DataFrame:
+        """
+        키워드의 시간/일 단위 검색 수 추이를 keyword_hourly/keyword_daily 롤업에서 읽어 반환합니다. (빈 구간은 0)
+
+        Args:
+            keyword (str): 조회할 검색 키워드
+            start (datetime | date): 이 시각이 속한 구간부터 포함 (없으면 첫 검색 구간부터)
+            end (datetime | date): 이 시각이 속한 구간까지 포함 (없으면 마지막 검색 구간까지)
+            granularity (str): "hour" | "day"
+
+        Returns:
+            pd.DataFrame: bucket(구간 시작 시각), search_count(검색 수) 컬럼
+        """
+        table, column, fmt = (
+            ("keyword_hourly", "hour", "%Y-%m-%d %H:00:00") if granularity == "hour"
+            else ("keyword_daily", "day", "%Y-%m-%d")
+        )
+        conditions, params = ["keyword = ?"], [keyword]
+        if start is not None:
+            conditions.append(f"{column} >= ?")
+            params.append(bucket_start(start, granularity).strftime(fmt))
+        if end is not None:
+            conditions.append(f"{column} <= ?")
+            params.append(bucket_start(end, granularity).strftime(fmt))
+        try:
+            with self._connect() as conn:
+                rows = conn.execute(
+                    f"SELECT {column}, search_count FROM {table} WHERE {' AND '.join(conditions)}", params
+                ).fetchall()
+            counts = {pd.Timestamp(bucket).to_pydatetime(): count for bucket, count in rows}
+            return fill_buckets(counts, start, end, granularity)
+        except Exception as e:
+            print(f"[경고] 키워드 추이 집계 실패: {e}")
+            return fill_buckets({}, None, None, granularity)
+
+    def get_top_keywords_by_day(self, day: Union[datetime, date], limit: int = 10) -> List[Tuple[str, int]]:
+        """
+        해당 날짜에 많이 검색된 키워드 상위 limit개를 keyword_daily 롤업에서 읽어 (키워드, 검색 수)로 반환합니다.
+        """
+        try:
+            with self._connect() as conn:
+                rows = conn.execute(
+                    """
+                    SELECT keyword, search_count FROM keyword_daily
+                    WHERE day = ? ORDER BY search_count DESC, keyword LIMIT ?
+                    """,
+                    (bucket_start(day, "day").strftime("%Y-%m-%d"), limit)
+                ).fetchall()
+            return top_counts(dict(rows), limit)
+        except Exception as e:
+            print(f"[경고] 일별 인기 검색어 집계 실패: {e}")
+            return []
+
+    def get_daily_search_counts(self, start: TimeBound = None, end: TimeBound = None) -> pd.DataFrame:
+        """
+        날짜별 검색 수를 daily_searches 롤업에서 읽어 반환합니다. (bucket, search_count 컬럼, 빈 날짜는 0)
+        """
+        conditions, params = [], []
+        if start is not None:
+            conditions.append("day >= ?")
+            params.append(bucket_start(start, "day").strftime("%Y-%m-%d"))
+        if end is not None:
+            conditions.append("day <= ?")
+            params.append(bucket_start(end, "day").strftime("%Y-%m-%d"))
+        try:
+            with self._connect() as conn:
+                rows = conn.execute(
+                    f"SELECT day, search_count FROM daily_searches {'WHERE ' + ' AND '.join(conditions) if conditions else ''}",
+                    params
+                ).fetchall()
+            counts = {pd.Timestamp(day).to_pydatetime(): count for day, count in rows}
+            return fill_buckets(counts, start, end, "day")
+        except Exception as e:
+            print(f"[경고] 일별 검색 수 집계 실패: {e}")
+            return fill_buckets({}, None, None, "day")
+
+    def count_searches_for_url(self, url: str) -> int:
+        """
+        해당 기사 URL(정규화 기준)을 결과로 보여 준 검색 수를 반환합니다. (기본 키 조회 1회)
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT search_count FROM articles WHERE article_id = ?", (url_hash(url),)
+            ).fetchone()
+        return row[0] if row else 0
+
+    def search_text(self, query: str, limit: int = 20) -> List[TextSearchHit]:
+        """
+        저장된 기사의 제목, 스니펫, AI 요약에서 검색어를 찾아 관련도(BM25) 순으로 반환합니다.
+        색인은 "<DB 경로>.textidx"에 보관되며 load()와 같은 행 순서(search_id, article_index)로 문서를 추가하고,
+        결과 행은 색인에 기록된 search_id로 한 번에 조회하여 (search_id, article_index)로 짝짓습니다.
+        (레거시 분 단위 키처럼 search_key가 중복돼도 다른 검색의 행과 섞이지 않음)
+        """
+        if not query.strip():
+            return []
+
+        try:
+            index = text_indexes.get(self.db_path + TEXT_INDEX_SUFFIX)
+            self._sync_text_index(index)
+            ranked = index.search(query, limit=limit)
+            if not ranked:
+                return []
+
+            docs, scores = index.docs_by_search_id(ranked)
+            search_ids = list(dict.fromkeys(search_id for search_id, _ in docs if search_id is not None))
+            if not search_ids:
+                return []
+            with self._connect() as conn:
+                df = pd.read_sql_query(
+                    self._long_format_sql(f"s.search_id IN ({', '.join('?' * len(search_ids))})", with_search_id=True),
+                    conn, params=search_ids
+                )
+            return hits_for_docs(df, docs, scores, key_column="search_id")
+        except Exception as e:
+            print(f"[경고] 기록 검색 실패: {e}")
+            return []
+
+    def _sync_text_index(self, index: TextIndex):
+        """
+        색인을 DB의 현재 Long format 행까지 맞춥니다.
+        SQLite의 행은 (search_id, article_index) 순서로 뒤에만 추가되고 다시 쓰이지 않으므로,
+        색인된 마지막 문서의 위치(search_id, article_index)를 기준점으로 그 뒤의 행만 세고 읽습니다.
+        (저장할 때마다 기록 전체를 OFFSET으로 훑지 않음)
+        search_id는 문서를 색인할 때 색인 로그에 함께 기록해 두므로, 같은 search_key가 여러 번 저장된
+        레거시 기록에서도 기준점이 정확합니다.
+        색인의 문서가 DB의 같은 search_id에 없으면(DB 교체 등, search_id 없이 기록된 이전 로그 포함) 처음부터 다시 색인합니다.
+        """
+        after_mark = "s.search_id >= ? AND (s.search_id > ? OR COALESCE(sa.article_index, 0) > ?)"
+        join = "FROM searches s LEFT JOIN search_articles sa ON sa.search_id = s.search_id"
+
+        with self._connect() as conn:
+            def mark_after(doc_count: int) -> Optional[Tuple[int, int]]:
+                """앞 doc_count개 문서 다음 행의 기준점(마지막 문서의 search_id, article_index), 찾지 못하면 None"""
+                if doc_count == 0:
+                    return (0, -1)
+                key, article_index = index.doc(doc_count - 1)
+                search_id = index.doc_search_id(doc_count - 1)
+                if search_id is None:
+                    return None
+                row = conn.execute("SELECT search_key FROM searches WHERE search_id = ?", (search_id,)).fetchone()
+                return (search_id, article_index) if row is not None and row[0] == key else None
+
+            indexed = index.doc_count
+            mark = mark_after(indexed)
+            if mark is None:
+                total_rows = conn.execute(f"SELECT COUNT(*) {join}").fetchone()[0]
+            else:
+                total_rows = indexed + conn.execute(
+                    f"SELECT COUNT(*) {join} WHERE {after_mark}", (mark[0], mark[0], mark[1])
+                ).fetchone()[0]
+
+            def key_at(i: int) -> Optional[str]:
+                if i == 0:
+                    row = conn.execute("SELECT search_key FROM searches ORDER BY search_id LIMIT 1").fetchone()
+                    return row[0] if row else None
+                # 색인된 문서가 DB에 그대로 있으면 같은 위치로 봄 (행이 다시 쓰이지 않으므로)
+                return index.doc(i)[0] if mark_after(i + 1) is not None else None
+
+            def fetch_rows(start: int, stop: int) -> pd.DataFrame:
+                search_id, article_index = mark_after(start)
+                # 색인 로그에 문서별 search_id를 남기도록 함께 읽음
+                return pd.read_sql_query(
+                    f"SELECT search_id, {', '.join(TEXT_INDEX_COLUMNS)} "
+                    f"FROM ({self._long_format_sql(after_mark, with_search_id=True)}) LIMIT ?",
+                    conn, params=(search_id, search_id, article_index, stop - start)
+                )
+
+            index.sync(total_rows, key_at, fetch_rows)
+
+    def import_csv(self, csv_path: str, chunksize: int = 10000) -> int:
+        """
+        기존 Long format CSV 검색 기록을 searches/articles 테이블로 변환하여 가져옵니다. (1회성 이관용)
+        이미 DB에 있는 search_key의 행은 건너뛰므로 여러 번 실행해도 중복되지 않습니다.
+
+        Args:
+            csv_path (str): 가져올 CSV 파일 경로
+            chunksize (int): 한 번에 읽을 행 수
+
+        Returns:
+            int: 새로 가져온 Long format 행 수
+        """
+        with self._connect() as conn:
+            existing = {row[0] for row in conn.execute("SELECT DISTINCT search_key FROM searches")}
+
+        with self._connect() as conn:
+            return self._insert_long_rows(conn, pd.read_csv(csv_path, chunksize=chunksize), existing)
+
+
+if __name__ == "__main__":
+    # 사용법: python -m repositories.sqlite_search_repository <CSV 경로> <DB 경로>
+    if len(sys.argv) != 3:
+        print("사용법: python -m repositories.sqlite_search_repository <CSV 경로> <DB 경로>")
+        sys.exit(1)
+    count = SqliteSearchRepository(sys.argv[2]).import_csv(sys.argv[1])
+    print(f"{count}개 행을 {sys.argv[2]}로 가져왔습니다.")
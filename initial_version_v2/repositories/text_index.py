@@ -0,0 +1,405 @@
+import os
+import re
+import json
+import math
+import threading
+import unicodedata
+from array import array
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+from domain.text_search_hit import TextSearchHit
+from repositories.write_coordinator import atomic_write, file_lock
+
+# 전문 검색 색인 파일 접미사 (저장 파일 옆에 "<경로>.textidx"로 생성)
+TEXT_INDEX_SUFFIX = ".textidx"
+
+# 색인에 필요한 컬럼 (기사 1건 = 문서 1개)
+TEXT_INDEX_COLUMNS = ["search_key", "article_index", "title", "snippet", "ai_summary"]
+
+# BM25 파라미터
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# 제목에 나온 토큰의 가중치 (제목 일치를 본문 일치보다 우선)
+TITLE_WEIGHT = 2
+
+# 검색어 토큰 중 이 비율 이상을 포함한 문서만 결과로 반환 (바이그램 부분 일치로 인한 잡음 제거)
+MIN_MATCH_RATIO = 0.6
+
+# 색인 로그 한 줄(세그먼트)에 담을 최대 문서 수
+SEGMENT_ROWS = 20000
+
+# 영문/숫자 묶음, 그 외 문자(한글, 한자 등) 묶음
+_TOKEN_RUN = re.compile(r"[a-z0-9]+|[^\W_a-z0-9]+")
+
+def tokenize(text) -> List[str]:
+    """
+    텍스트를 색인 토큰으로 나눕니다.
+    영문/숫자는 단어 단위로, 한글 등 그 외 문자는 띄어쓰기/조사와 무관하게 찾을 수 있도록
+    글자 2개씩 겹쳐 자른 바이그램으로 만듭니다. (예: "삼성전자" → 삼성, 성전, 전자)
+    """
+    text = unicodedata.normalize("NFKC", str(text)).lower()
+    tokens = []
+    for run in _TOKEN_RUN.findall(text):
+        if run.isascii() or len(run) == 1:
+            tokens.append(run)
+        else:
+            tokens.extend(map(str.__add__, run, run[1:]))
+    return tokens
+
+def hits_from_frame(df: pd.DataFrame, ranked: List[Tuple[int, float]]) -> List[TextSearchHit]:
+    """
+    (행 번호, 점수) 목록을 Long format 행들에서 꺼내 TextSearchHit 리스트로 변환합니다.
+    """
+    if not ranked:
+        return []
+    rows = df.iloc[[doc_id for doc_id, _ in ranked]]
+    # category/datetime 컬럼도 함께 문자열로 풀기 위해 object로 바꾼 뒤 결측값을 채움
+    texts = rows[["search_key", "search_time", "keyword", "title", "url", "snippet"]].astype(object).fillna("").astype(str)
+    article_index = pd.to_numeric(rows["article_index"], errors="coerce").fillna(0).astype(int)
+    return [
+        TextSearchHit(
+            search_key=key, search_time=search_time, keyword=keyword, article_index=int(idx),
+            title=title, url=url, snippet=snippet, score=score
+        )
+        for (key, search_time, keyword, title, url, snippet), idx, (_, score) in zip(
+            texts.itertuples(index=False, name=None), article_index.tolist(), ranked
+        )
+    ]
+
+def hits_for_docs(
+    df: pd.DataFrame,
+    docs: List[Tuple[str, int]],
+    scores: List[float],
+    key_column: str = "search_key"
+) -> List[TextSearchHit]:
+    """
+    색인이 기록한 문서 키((search_key, article_index))로 결과 행을 찾아 TextSearchHit 리스트로 변환합니다.
+    df는 결과 행을 포함하는 임의의 행 묶음이며, 행 위치가 아니라 키로 짝지으므로
+    일부 행이 없거나 순서가 달라도 다른 검색의 행이 결과로 섞이지 않습니다. (찾지 못한 문서는 제외)
+
+    Args:
+        df (pd.DataFrame): 결과 후보 행들 (Long format)
+        docs (List[Tuple[str, int]]): 점수순 문서의 (search_key, article_index)
+        scores (List[float]): docs와 같은 순서의 점수
+        key_column (str): 문서 키의 첫 값과 비교할 컬럼 (SQLite는 검색 키가 중복될 수 있어 search_id로 짝지음)
+    """
+    if df.empty or not docs:
+        return []
+    keys = df[key_column].astype(object).fillna("").astype(str).tolist()
+    article_index = pd.to_numeric(df["article_index"], errors="coerce").fillna(0).astype(int).tolist()
+    positions: Dict[Tuple[str, int], int] = {}
+    for position, doc_key in enumerate(zip(keys, article_index)):
+        positions.setdefault(doc_key, position)
+
+    ranked = []
+    for (key, idx), score in zip(docs, scores):
+        position = positions.get((str(key), int(idx)))
+        if position is not None:
+            ranked.append((position, score))
+    return hits_from_frame(df, ranked)
+
+class TextIndex:
+    """
+    저장된 기사(제목, 스니펫, AI 요약)에 대한 역색인(inverted index)과 BM25 순위 검색을 제공합니다.
+    문서 번호는 원본 기록의 행 순서(Long format 기준)와 같으며, 기록이 뒤에 추가되면 추가된 행만 색인합니다.
+
+    색인은 "<원본>.textidx" 로그 파일에 세그먼트 단위(JSON 한 줄)로 이어 쓰므로
+    프로세스를 다시 시작해도 기록 전체를 다시 토큰화하지 않고, 다른 프로세스가 추가한 세그먼트도 읽어 들입니다.
+    원본이 다시 쓰여 행 순서가 달라진 경우(앞/마지막 search_key 불일치)에는 처음부터 다시 색인합니다.
+
+    Attributes:
+        log_path (str): 색인 로그 파일 경로
+    """
+    def __init__(self, log_path: str):
+        self.log_path = log_path
+        self._lock = threading.Lock()
+        self._clear()
+
+    def _clear(self):
+        self._postings: Dict[str, Tuple[array, array]] = {}
+        # 조회용 numpy 배열 캐시 (세그먼트가 추가되면 해당 토큰만 무효화)
+        self._arrays: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._keys: List[str] = []
+        self._article_index = array("i")
+        # 원본이 문서별 행 번호를 넘겨 준 경우(SQLite의 search_id)에만 채움 (없는 문서는 -1)
+        self._search_ids = array("q")
+        self._lengths = array("I")
+        self._total_length = 0
+        self._norm: Optional[np.ndarray] = None
+        self._log_offset = 0
+
+    @property
+    def doc_count(self) -> int:
+        return len(self._keys)
+
+    def doc(self, doc_id: int) -> Tuple[str, int]:
+        """
+        문서 번호의 (search_key, article_index)를 반환합니다.
+        """
+        return self._keys[doc_id], self._article_index[doc_id]
+
+    def doc_search_id(self, doc_id: int) -> Optional[int]:
+        """
+        문서를 색인할 때 원본이 함께 넘겨 준 search_id를 반환합니다. (기록하지 않은 문서는 None)
+        """
+        if doc_id < len(self._search_ids) and self._search_ids[doc_id] >= 0:
+            return self._search_ids[doc_id]
+        return None
+
+    def docs(self, ranked: List[Tuple[int, float]]) -> Tuple[List[Tuple[str, int]], List[float]]:
+        """
+        search() 결과의 문서 키 목록과 점수 목록을 반환합니다. (hits_for_docs에 넘길 형태)
+        """
+        with self._lock:
+            return [self.doc(doc_id) for doc_id, _ in ranked], [score for _, score in ranked]
+
+    def docs_by_search_id(self, ranked: List[Tuple[int, float]]) -> Tuple[List[Tuple[Optional[int], int]], List[float]]:
+        """
+        docs()와 같지만 문서 키의 첫 값으로 search_key 대신 색인할 때 기록한 search_id를 반환합니다.
+        """
+        with self._lock:
+            return (
+                [(self.doc_search_id(doc_id), self._article_index[doc_id]) for doc_id, _ in ranked],
+                [score for _, score in ranked]
+            )
+
+    # ------------------------------------------------------------------
+    # 원본 기록과 동기화
+    # ------------------------------------------------------------------
+    def sync(
+        self,
+        total_rows: int,
+        key_at: Callable[[int], str],
+        fetch_rows: Callable[[int, int], pd.DataFrame]
+    ):
+        """
+        원본 기록의 앞 total_rows행까지 색인되도록 맞춥니다. (이미 맞으면 아무것도 읽지 않음)
+
+        Args:
+            total_rows (int): 원본 기록의 현재 행 수
+            key_at (Callable[[int], str]): i번째 행의 search_key를 반환하는 함수 (순서 검증용)
+            fetch_rows (Callable[[int, int], pd.DataFrame]): [start, stop) 행의 TEXT_INDEX_COLUMNS를 반환하는 함수
+                (search_id 컬럼도 있으면 문서별로 로그에 기록하여 doc_search_id()로 돌려줌)
+        """
+        with self._lock:
+            if self.doc_count >= total_rows and self._matches(total_rows, key_at):
+                return
+
+            with file_lock(self.log_path):
+                try:
+                    self._read_log()
+                except ValueError as e:
+                    print(f"[경고] 검색 색인 로그 손상, 다시 색인합니다: {e}")
+                    self._reset()
+                if not self._matches(total_rows, key_at):
+                    self._reset()
+
+                for start in range(self.doc_count, total_rows, SEGMENT_ROWS):
+                    segment = self._build_segment(start, fetch_rows(start, min(start + SEGMENT_ROWS, total_rows)))
+                    line = (json.dumps(segment, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+                    with open(self.log_path, "ab") as f:
+                        f.write(line)
+                    self._apply(segment)
+                    self._log_offset += len(line)
+
+    def _matches(self, total_rows: int, key_at: Callable[[int], str]) -> bool:
+        """
+        색인된 문서와 원본 행이 겹치는 구간의 첫/마지막 search_key가 같은지 확인합니다.
+        """
+        overlap = min(self.doc_count, total_rows)
+        if overlap == 0:
+            return True
+        return key_at(0) == self._keys[0] and key_at(overlap - 1) == self._keys[overlap - 1]
+
+    def _reset(self):
+        """
+        메모리 색인과 로그 파일을 비웁니다. (호출하는 쪽에서 로그 파일 잠금을 잡고 있어야 함)
+        """
+        self._clear()
+        atomic_write(self.log_path, b"")
+
+    def _read_log(self):
+        """
+        로그 파일에서 아직 반영하지 않은 세그먼트(다른 프로세스가 추가한 것 포함)를 읽어 반영합니다.
+        로그가 비워졌으면(다른 프로세스의 재색인) 처음부터 다시 읽고, 쓰다 만 마지막 줄은 잘라 냅니다.
+        """
+        if not os.path.exists(self.log_path):
+            self._clear()
+            return
+        if os.path.getsize(self.log_path) < self._log_offset:
+            self._clear()
+
+        with open(self.log_path, "rb") as f:
+            f.seek(self._log_offset)
+            data = f.read()
+        for line in data.splitlines(keepends=True):
+            if not line.endswith(b"\n"):
+                with open(self.log_path, "rb+") as f:
+                    f.truncate(self._log_offset)
+                break
+            segment = json.loads(line)
+            if segment["start"] != self.doc_count:
+                raise ValueError(f"세그먼트 시작 위치 불일치 ({segment['start']} != {self.doc_count})")
+            self._apply(segment)
+            self._log_offset += len(line)
+
+    def _build_segment(self, start: int, df: pd.DataFrame) -> Dict:
+        """
+        행들을 토큰화하여 세그먼트(문서 메타데이터 + 토큰별 문서 목록/빈도)를 만듭니다.
+        """
+        texts = df[["search_key", "title", "snippet", "ai_summary"]].astype(object).fillna("").astype(str)
+        article_index = pd.to_numeric(df["article_index"], errors="coerce").fillna(0).astype(int).tolist()
+
+        terms: Dict[str, Tuple[List[int], List[int]]] = {}
+        lengths = []
+        # AI 요약은 같은 검색의 기사 행마다 반복되므로 토큰화 결과를 재사용
+        summary_tokens: Dict[str, List[str]] = {}
+        for doc, (title, snippet, summary) in enumerate(
+            zip(texts["title"].tolist(), texts["snippet"].tolist(), texts["ai_summary"].tolist())
+        ):
+            tokens = summary_tokens.get(summary)
+            if tokens is None:
+                tokens = summary_tokens[summary] = tokenize(summary)
+            counts = Counter(tokenize(snippet))
+            counts.update(tokens)
+            for token in tokenize(title):
+                counts[token] += TITLE_WEIGHT
+            lengths.append(sum(counts.values()))
+            for token, tf in counts.items():
+                entry = terms.get(token)
+                if entry is None:
+                    entry = terms[token] = ([], [])
+                entry[0].append(doc)
+                entry[1].append(tf if tf < 65536 else 65535)
+
+        segment = {
+            "start": start,
+            "keys": texts["search_key"].tolist(),
+            "article_index": article_index,
+            "lengths": lengths,
+            "terms": terms
+        }
+        if "search_id" in df.columns:
+            segment["search_ids"] = df["search_id"].astype(int).tolist()
+        return segment
+
+    def _apply(self, segment: Dict):
+        """
+        세그먼트를 메모리 색인에 이어 붙입니다.
+        """
+        start = segment["start"]
+        self._keys.extend(segment["keys"])
+        self._article_index.extend(segment["article_index"])
+        if "search_ids" in segment:
+            self._search_ids.extend([-1] * (start - len(self._search_ids)))
+            self._search_ids.extend(segment["search_ids"])
+        self._lengths.extend(segment["lengths"])
+        self._total_length += sum(segment["lengths"])
+        self._norm = None
+        for token, (docs, tfs) in segment["terms"].items():
+            posting = self._postings.get(token)
+            if posting is None:
+                posting = self._postings[token] = (array("I"), array("H"))
+            posting[0].extend(map(start.__add__, docs))
+            posting[1].extend(tfs)
+            self._arrays.pop(token, None)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def search(self, query: str, limit: int = 20, max_doc: Optional[int] = None) -> List[Tuple[int, float]]:
+        """
+        검색어와 관련도가 높은 문서를 BM25 점수순으로 반환합니다.
+
+        Args:
+            query (str): 검색어
+            limit (int): 반환할 최대 문서 수
+            max_doc (int): 이 번호 미만 문서만 반환 (호출하는 쪽 스냅샷보다 색인이 앞서 있을 때)
+
+        Returns:
+            List[Tuple[int, float]]: (문서 번호, 점수) 리스트
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        with self._lock:
+            n = self.doc_count
+            if not terms or n == 0:
+                return []
+
+            norm = self._length_norm()
+            scores = np.zeros(n, dtype=np.float32)
+            matched = np.zeros(n, dtype=np.uint16)
+            for term in terms:
+                arrays = self._term_arrays(term)
+                if arrays is None:
+                    continue
+                ids, tfs = arrays
+                idf = math.log(1 + (n - len(ids) + 0.5) / (len(ids) + 0.5))
+                scores[ids] += idf * tfs * (BM25_K1 + 1) / (tfs + norm[ids])
+                matched[ids] += 1
+
+        required = max(1, math.ceil(len(terms) * MIN_MATCH_RATIO))
+        candidates = np.flatnonzero(matched >= required)
+        if max_doc is not None:
+            candidates = candidates[candidates < max_doc]
+        if len(candidates) > limit:
+            candidates = candidates[np.argpartition(-scores[candidates], limit - 1)[:limit]]
+        order = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return [(int(doc_id), float(scores[doc_id])) for doc_id in order]
+
+    def _length_norm(self) -> np.ndarray:
+        """
+        문서 길이 정규화 항 k1 * (1 - b + b * len / avg_len)을 계산해 둡니다. (문서가 추가되면 다시 계산)
+        """
+        if self._norm is None or len(self._norm) != self.doc_count:
+            lengths = np.frombuffer(self._lengths, dtype=np.uint32).astype(np.float32)
+            avg_length = (self._total_length / self.doc_count) or 1.0
+            self._norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths / avg_length)
+        return self._norm
+
+    def _term_arrays(self, term: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        토큰의 문서 목록/빈도를 numpy 배열로 반환합니다. (array 버퍼를 복사해 두어 이후 색인 추가를 막지 않음)
+        """
+        arrays = self._arrays.get(term)
+        if arrays is None:
+            posting = self._postings.get(term)
+            if posting is None:
+                return None
+            arrays = (
+                np.frombuffer(posting[0], dtype=np.uint32).astype(np.int64),
+                np.frombuffer(posting[1], dtype=np.uint16).astype(np.float32)
+            )
+            self._arrays[term] = arrays
+        return arrays
+
+class TextIndexRegistry:
+    """
+    색인 로그 경로별 TextIndex를 프로세스 전역으로 공유합니다. (세션마다 색인을 다시 읽지 않도록)
+    """
+    def __init__(self):
+        self._indexes: Dict[str, TextIndex] = {}
+        self._lock = threading.Lock()
+
+    def get(self, log_path: str) -> TextIndex:
+        """
+        경로의 색인을 반환합니다. 처음 요청되면 빈 색인을 만들고, 첫 sync()에서 로그를 읽습니다.
+        """
+        key = os.path.abspath(log_path)
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is None:
+                index = self._indexes[key] = TextIndex(log_path)
+            return index
+
+    def opened(self, log_path: str) -> Optional[TextIndex]:
+        """
+        이미 사용 중인 색인만 반환합니다. (save()에서 색인을 쓰지 않는 경우 불필요한 색인 생성을 피함)
+        """
+        with self._lock:
+            return self._indexes.get(os.path.abspath(log_path))
+
+# 프로세스 전역 인스턴스
+text_indexes = TextIndexRegistry()
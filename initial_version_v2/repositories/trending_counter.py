@@ -0,0 +1,130 @@
+import threading
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Union
+import pandas as pd
+from repositories.heavy_hitters import SpaceSaving
+from repositories.history_frame import as_search_times
+
+# 인기 검색어 집계 방식: 정확 집계(exact) / Space-Saving 스케치 근사 집계(approx)
+TRENDING_MODES = ("exact", "approx")
+
+def count_keywords_exact(df: pd.DataFrame, hours: int = 24, limit: int = 10, now: Optional[datetime] = None) -> List[str]:
+    """
+    전체 기록에서 최근 hours 시간 이내 행을 걸러 키워드별 검색 수를 pandas로 직접 집계합니다.
+    (search_key 기준 1회만 카운트)
+    """
+    if df.empty:
+        return []
+
+    # search_time을 datetime으로 변환 (로더가 이미 변환한 컬럼은 그대로 사용)
+    search_times = as_search_times(df['search_time'])
+    
+    # 최근 N시간 이내의 데이터 필터링
+    now = now or datetime.now()
+    threshold = now - pd.Timedelta(hours=hours)
+    recent_df = df[search_times >= threshold]
+    
+    if recent_df.empty:
+        return []
+        
+    # 키워드별 중복 제거 (search_key 기준 1회만 카운트하여 키워드 노출 빈도 측정)
+    # (category 컬럼의 value_counts는 구간에 없는 키워드도 0으로 포함하므로 문자열로 풀어서 셈)
+    keyword_counts = recent_df[['search_key', 'keyword']].drop_duplicates()['keyword'].astype(object).value_counts()
+    
+    return keyword_counts.head(limit).index.tolist()
+
+class TrendingCounter:
+    """
+    검색 기록을 1시간 단위 버킷별 키워드 검색 수로 집계해 두는 인메모리 인기 검색어 집계기입니다.
+    저장되는 행을 받을 때마다 해당 버킷만 갱신하고 보관 기간이 지난 버킷은 버리므로,
+    상위 키워드 조회 비용은 전체 기록 크기가 아니라 조회 구간의 버킷 수에 비례합니다.
+
+    집계 단위가 1시간이므로 조회 구간의 시작 시각이 걸쳐 있는 버킷은 통째로 포함됩니다.
+    (예: 24시간 조회 시 최대 25시간 전 검색까지 포함될 수 있음)
+
+    mode가 "approx"이면 버킷마다 Counter 대신 최대 sketch_capacity개 키워드만 추적하는
+    Space-Saving 스케치를 사용하여, 키워드 종류가 아무리 많아도 버킷당 메모리가 고정됩니다.
+    이때 조회 구간의 각 키워드 추정치는 실제 검색 수와 최대 N / sketch_capacity 만큼 차이 날 수 있습니다.
+    (N = 조회 구간의 전체 검색 수)
+
+    Attributes:
+        retention_hours (int): 버킷을 보관하는 최대 시간 (이보다 긴 조회는 지원하지 않음)
+        mode (str): "exact" | "approx"
+        sketch_capacity (int): approx 모드에서 버킷당 추적할 최대 키워드 수
+    """
+    def __init__(self, retention_hours: int = 24 * 7, mode: str = "exact", sketch_capacity: int = 1000):
+        if mode not in TRENDING_MODES:
+            raise ValueError(f"지원하지 않는 인기 검색어 집계 방식입니다: {mode}")
+        self.retention_hours = retention_hours
+        self.mode = mode
+        self.sketch_capacity = sketch_capacity
+        self._buckets: Dict[datetime, Union[Counter, SpaceSaving]] = {}
+        self._lock = threading.Lock()
+
+    def add_rows(self, df: pd.DataFrame, now: Optional[datetime] = None):
+        """
+        Long format 행들을 버킷에 반영합니다. (search_key 기준 1회만 카운트)
+        보관 기간 밖의 행은 버킷을 계산하기 전에 먼저 걸러냅니다.
+
+        Args:
+            df (pd.DataFrame): search_key, search_time, keyword 컬럼을 포함한 행들
+            now (datetime): 보관 기간 계산 기준 시각 (기본값: 현재 시각)
+        """
+        now = now or datetime.now()
+        oldest = self._bucket_start(now) - timedelta(hours=self.retention_hours)
+
+        searches = df[["search_key", "search_time", "keyword"]].dropna()
+        searches = searches.assign(search_time=as_search_times(searches["search_time"]))
+        searches = searches[searches["search_time"] >= oldest]
+        searches = searches.drop_duplicates(subset=["search_key", "keyword"])
+        if searches.empty:
+            self.expire(now)
+            return
+
+        hours = searches["search_time"].dt.floor("h")
+        counts = searches.assign(hour=hours).groupby(["hour", "keyword"], observed=True).size()
+
+        with self._lock:
+            for (hour, keyword), count in counts.items():
+                bucket = self._buckets.get(hour.to_pydatetime())
+                if bucket is None:
+                    bucket = Counter() if self.mode == "exact" else SpaceSaving(self.sketch_capacity)
+                    self._buckets[hour.to_pydatetime()] = bucket
+                if self.mode == "exact":
+                    bucket[keyword] += int(count)
+                else:
+                    bucket.update(keyword, int(count))
+        self.expire(now)
+
+    def expire(self, now: Optional[datetime] = None):
+        """
+        보관 기간이 지난 버킷을 제거합니다.
+        """
+        oldest = self._bucket_start(now or datetime.now()) - timedelta(hours=self.retention_hours)
+        with self._lock:
+            for hour in [h for h in self._buckets if h < oldest]:
+                del self._buckets[hour]
+
+    def top(self, hours: int = 24, limit: int = 10, now: Optional[datetime] = None) -> List[str]:
+        """
+        최근 hours 시간 구간에 걸친 버킷들의 키워드 수를 합산하여 상위 limit개를 반환합니다.
+        """
+        now = now or datetime.now()
+        first_bucket = self._bucket_start(now - timedelta(hours=hours))
+        with self._lock:
+            buckets = [bucket for hour, bucket in self._buckets.items() if hour >= first_bucket]
+            if self.mode == "exact":
+                total = Counter()
+                for bucket in buckets:
+                    total.update(bucket)
+                return [keyword for keyword, _ in total.most_common(limit)]
+
+            merged = SpaceSaving(self.sketch_capacity)
+            for bucket in buckets:
+                merged.merge(bucket)
+        return [keyword for keyword, _ in merged.top(limit)]
+
+    @staticmethod
+    def _bucket_start(value: datetime) -> datetime:
+        return value.replace(minute=0, second=0, microsecond=0)
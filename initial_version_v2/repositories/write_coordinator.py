@@ -0,0 +1,198 @@
+import os
+import time
+import tempfile
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Tuple, Union
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# 여러 세션/프로세스가 같은 저장 파일을 쓸 때 사용하는 잠금 파일 접미사
+LOCK_SUFFIX = ".lock"
+
+@contextmanager
+def file_lock(path: str, shared: bool = False, poll_interval: float = 0.01) -> Iterator[None]:
+    """
+    path에 대한 advisory lock을 잡습니다. (잠금 대상은 "<path>.lock" 파일)
+    잠금은 열린 파일 단위이므로 같은 프로세스의 다른 스레드와 다른 프로세스 모두를 막으며,
+    프로세스가 죽으면 운영체제가 자동으로 풀어 줍니다.
+
+    읽기용 공유 잠금은 잠금 파일을 읽기 전용으로 열고, 잠금 파일이 없는데 만들 수도 없으면
+    (읽기 전용 데이터 디렉토리 등) 잠금 없이 진행합니다. (그런 디렉토리에는 쓰는 쪽도 없음)
+
+    Args:
+        path (str): 보호할 저장 파일 경로
+        shared (bool): True이면 읽기용 공유 잠금 (Windows는 공유 잠금이 없어 배타적 잠금으로 대신함)
+        poll_interval (float): Windows에서 잠금을 다시 시도하기 전 대기 시간(초)
+    """
+    lock_path = path + LOCK_SUFFIX
+    f = _open_lock_file(lock_path, shared)
+    if f is None:
+        yield
+        return
+    with f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        else:
+            # msvcrt.locking은 대기 없이 실패하는 모드로 반복 시도 (첫 바이트 잠금)
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+                    break
+                except OSError:
+                    time.sleep(poll_interval)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+def _open_lock_file(lock_path: str, shared: bool):
+    """
+    잠금 파일을 엽니다. 배타적 잠금은 없으면 만들어 쓰기 모드로 열고,
+    공유 잠금은 읽기 전용으로 열되 없으면 만들어 보고, 만들 수 없으면 None을 반환합니다.
+    (Windows의 msvcrt.locking은 쓰기 권한이 필요하므로 공유 잠금도 쓰기 모드로 먼저 시도)
+    """
+    if not shared:
+        return open(lock_path, "a+b")
+    if fcntl is None:
+        try:
+            return open(lock_path, "a+b")
+        except OSError:
+            return None
+    try:
+        return open(lock_path, "rb")
+    except FileNotFoundError:
+        pass
+    try:
+        return open(lock_path, "a+b")
+    except OSError:
+        return None
+
+def atomic_write(path: str, data: Union[bytes, Callable[[str], None]]):
+    """
+    같은 디렉토리의 임시 파일에 내용을 모두 쓴 뒤 os.replace로 교체합니다.
+    읽는 쪽은 교체 전 파일 또는 완성된 새 파일만 보게 되고, 쓰다가 실패하면 기존 파일이 그대로 남습니다.
+
+    Args:
+        path (str): 교체할 파일 경로
+        data (bytes | Callable[[str], None]): 기록할 바이트, 또는 임시 파일 경로를 받아 내용을 쓰는 함수
+    """
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory)
+    try:
+        if callable(data):
+            os.close(fd)
+            data(tmp_path)
+        else:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+        with open(tmp_path, "rb+") as f:
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+class WriteBatcher:
+    """
+    여러 세션의 저장 요청을 interval_ms 동안 모아 한 번에 기록하는 그룹 커밋 버퍼입니다.
+    구간의 첫 요청 스레드가 대기 후 모인 요청 전체를 flush 함수로 기록하고,
+    나머지 요청 스레드는 자신이 포함된 flush가 끝날 때까지 기다렸다가 같은 결과를 돌려받습니다.
+    (별도 백그라운드 스레드 없이 동작하며, 저장이 반환되면 이미 파일에 기록된 상태입니다.)
+
+    Attributes:
+        interval_ms (int): 요청을 모으는 시간(밀리초)
+        flushes (int): 지금까지 수행한 flush 횟수
+        items (int): 지금까지 flush로 기록한 요청 수
+    """
+    def __init__(self, interval_ms: int):
+        self.interval_ms = interval_ms
+        self.flushes = 0
+        self.items = 0
+        self._pending: List = []
+        self._waiters: List[Future] = []
+        self._collecting = False
+        self._lock = threading.Lock()
+
+    def submit(self, item, flush: Callable[[List], bool]) -> bool:
+        """
+        저장 요청을 버퍼에 넣고 해당 요청이 기록될 때까지 기다립니다.
+        구간의 첫 요청(leader)이 넘긴 flush 함수로 모인 요청 전체를 기록합니다.
+        (같은 파일을 쓰는 요청끼리만 모이므로 어느 인스턴스의 flush 함수든 결과가 같음)
+
+        Returns:
+            bool: 요청이 포함된 flush의 성공 여부
+        """
+        waiter = Future()
+        with self._lock:
+            self._pending.append(item)
+            self._waiters.append(waiter)
+            is_leader = not self._collecting
+            self._collecting = True
+
+        if is_leader:
+            time.sleep(self.interval_ms / 1000)
+            with self._lock:
+                batch, waiters = self._pending, self._waiters
+                self._pending, self._waiters = [], []
+                self._collecting = False
+            try:
+                ok = flush(batch)
+            except Exception as e:
+                print(f"[에러] 묶음 저장 실패: {e}")
+                ok = False
+            with self._lock:
+                self.flushes += 1
+                self.items += len(batch)
+            for w in waiters:
+                w.set_result(ok)
+
+        return waiter.result()
+
+class WriteCoordinator:
+    """
+    (저장 파일 경로, 묶음 시간)별 WriteBatcher를 프로세스 전역으로 관리합니다.
+    같은 파일을 쓰는 리포지토리 인스턴스(세션)가 여러 개여도 하나의 버퍼를 공유합니다.
+    """
+    def __init__(self):
+        self._batchers: Dict[Tuple[str, int], WriteBatcher] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, path: str, item, flush: Callable[[List], bool], interval_ms: int) -> bool:
+        """
+        (path, interval_ms)의 버퍼에 저장 요청을 넣고 기록될 때까지 기다립니다.
+        묶음은 요청마다 넘긴 flush 함수로 기록하므로, 버퍼를 처음 만든 인스턴스에 묶이지 않습니다.
+        """
+        key = (os.path.abspath(path), interval_ms)
+        with self._lock:
+            batcher = self._batchers.get(key)
+            if batcher is None:
+                batcher = WriteBatcher(interval_ms)
+                self._batchers[key] = batcher
+        return batcher.submit(item, flush)
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        경로별 flush 횟수와 기록한 요청 수를 반환합니다. (같은 경로의 묶음 시간이 여러 개이면 합산)
+        """
+        stats: Dict[str, Dict[str, int]] = {}
+        with self._lock:
+            for (path, _), b in self._batchers.items():
+                entry = stats.setdefault(path, {"flushes": 0, "items": 0})
+                entry["flushes"] += b.flushes
+                entry["items"] += b.items
+        return stats
+
+# 프로세스 전역 인스턴스
+write_coordinator = WriteCoordinator()
@@ -4,6 +4,10 @@ from google import genai
 from config.settings import settings
 from domain.news_article import NewsArticle
 from utils.exceptions import AppError
+from utils.single_flight import SingleFlight
+
+# 동시에 들어온 같은 기사 목록의 요약 요청을 한 번의 Gemini 호출로 합침
+_summary_flight = SingleFlight()
 
 @dataclass
 class AiOutput:
@@ -23,6 +27,15 @@ def summarize_news_with_keywords(articles: List[NewsArticle]) -> AiOutput:
     if not settings.GEMINI_API_KEY:
         raise AppError("api_key_invalid")
 
+    # 같은 모델로 같은 기사들을 요약 중이면 그 결과를 함께 받음 (공유 객체이므로 복사해서 반환)
+    key = (settings.GEMINI_MODEL, tuple((article.title, article.snippet) for article in articles))
+    output = _summary_flight.do(key, lambda: _generate_summary(articles))
+    return AiOutput(summary=output.summary, related_keywords=list(output.related_keywords))
+
+def _generate_summary(articles: List[NewsArticle]) -> AiOutput:
+    """
+    Gemini API를 호출하여 요약과 연관 키워드를 생성합니다. (summarize_news_with_keywords의 single-flight leader만 실행)
+    """
     try:
         client = genai.Client(api_key=settings.GEMINI_API_KEY)
         
@@ -0,0 +1,220 @@
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+import unicodedata
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import asdict
+from typing import Dict, Iterator, List, Optional, Tuple
+from config.settings import settings
+from domain.news_article import NewsArticle
+from domain.search_filters import SearchFilters
+from utils.query_builder import resolve_days
+
+# 검색 1회(search_depth="advanced")에 차감되는 Tavily 크레딧 수 (절약량 추정용)
+TAVILY_CREDITS_PER_SEARCH = 2
+
+# 디스크 캐시에서 만료 항목을 지우는 주기 (저장 N회마다 1번)
+DISK_PURGE_EVERY = 100
+
+def _normalize_term(term: str) -> str:
+    """
+    검색어를 NFC로 정규화하고 앞뒤/중복 공백을 정리합니다.
+    (조합형/완성형 한글처럼 모양은 같지만 코드가 다른 입력을 같은 키로 취급)
+    """
+    return " ".join(unicodedata.normalize("NFC", term).split())
+
+def _term_set(terms: List[str]) -> List[str]:
+    return sorted({normalized for normalized in map(_normalize_term, terms or []) if normalized})
+
+def canonical_filters(filters: SearchFilters, max_results: int, fanout: str = "off") -> Dict:
+    """
+    검색 결과가 같아지는 필터들을 같은 값으로 모은 정규형을 만듭니다.
+    - 검색어: NFC 정규화, 중복 제거, 정렬 (OR/AND/NOT 각 묶음 안의 순서는 결과에 영향 없음)
+    - 기간: 실제 요청에 쓰이는 days 값 (custom은 오늘 날짜 기준으로 계산되므로 날짜가 바뀌면 다른 키가 됨)
+    - 도메인: 소문자, 중복 제거, 정렬
+    - 결과 수: API에 요청하는 max_results (표시 개수가 달라도 요청이 같으면 같은 키)
+    - 분할 검색(fan-out) 방식: 결과가 달라지므로 "off"가 아닐 때만 키에 포함
+    """
+    canonical = {
+        "main": _term_set(filters.main_terms),
+        "and": _term_set(filters.and_terms),
+        "not": _term_set(filters.not_terms),
+        "days": resolve_days(filters.date_filter_mode, filters.custom_start, filters.custom_end),
+        "domains": sorted({d.strip().lower() for d in filters.include_domains or [] if d.strip()}),
+        "max_results": max_results,
+    }
+    if fanout != "off":
+        canonical["fanout"] = fanout
+    return canonical
+
+def cache_key(filters: SearchFilters, max_results: int, fanout: str = "off") -> str:
+    """
+    정규화한 필터의 해시를 캐시 키로 사용합니다.
+    """
+    canonical = json.dumps(canonical_filters(filters, max_results, fanout), ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+class SearchCache:
+    """
+    search_news 결과를 필터 정규형 기준으로 보관하는 TTL + LRU 캐시입니다.
+    인기 검색어 칩이나 연관 키워드처럼 여러 사용자가 같은 조건으로 검색하면 Tavily를 다시 호출하지 않습니다.
+
+    - 메모리: 최근 사용 순으로 최대 max_entries개를 보관하고 넘치면 가장 오래 쓰지 않은 항목부터 버림
+    - TTL: 기간 필터별로 다름 (24시간 검색은 새 기사가 자주 나오므로 짧게, 30일/직접 지정은 길게)
+    - 디스크(선택): disk_path를 주면 SQLite 파일에도 저장하여 같은 서버의 다른 워커 프로세스와 공유하고,
+      메모리에 없을 때 디스크에서 찾아 메모리로 올림
+
+    Attributes:
+        max_entries (int): 메모리에 보관할 최대 항목 수 (0이면 캐시 사용 안 함)
+        ttls (Dict[str, int]): 기간 필터(date_filter_mode)별 보관 시간(초)
+        disk_path (Optional[str]): 디스크 캐시 SQLite 파일 경로
+    """
+    def __init__(self, max_entries: int = 256, ttls: Optional[Dict[str, int]] = None, disk_path: Optional[str] = None):
+        self.max_entries = max_entries
+        self.ttls = ttls or {"24h": 300, "7d": 1800, "30d": 7200, "custom": 7200}
+        self.disk_path = disk_path or None
+        self._entries: "OrderedDict[str, Tuple[float, List[NewsArticle]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counts = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+        self._disk_puts = 0
+        if self.disk_path:
+            with self._connect() as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS search_cache ("
+                    "cache_key TEXT PRIMARY KEY, expires_at REAL NOT NULL, articles TEXT NOT NULL)"
+                )
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.disk_path, timeout=10)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: str, now: Optional[float] = None, record: bool = True) -> Optional[List[NewsArticle]]:
+        """
+        만료되지 않은 캐시 항목을 반환합니다. 없으면 None을 반환합니다. (빈 리스트도 유효한 결과)
+        record=False이면 적중/실패 통계에 반영하지 않습니다. (같은 검색 안에서 다시 확인할 때 사용)
+        """
+        if not self.enabled:
+            return None
+        now = now or time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self._counts["memory_hits"] += record
+                return list(entry[1])
+            if entry is not None:
+                del self._entries[key]
+
+        articles = self._disk_get(key, now)
+        with self._lock:
+            if articles is None:
+                self._counts["misses"] += record
+                return None
+            self._counts["disk_hits"] += record
+        return list(articles)
+
+    def put(self, key: str, articles: List[NewsArticle], date_filter_mode: str, now: Optional[float] = None):
+        """
+        검색 결과를 기간 필터에 맞는 TTL로 저장합니다.
+        """
+        if not self.enabled:
+            return
+        now = now or time.time()
+        expires_at = now + self.ttls.get(date_filter_mode, self.ttls["custom"])
+        self._remember(key, expires_at, list(articles))
+        if self.disk_path:
+            try:
+                self._disk_put(key, expires_at, articles, now)
+            except sqlite3.Error as e:
+                print(f"[경고] 검색 디스크 캐시 저장 실패: {e}")
+
+    def _remember(self, key: str, expires_at: float, articles: List[NewsArticle]):
+        with self._lock:
+            self._entries[key] = (expires_at, articles)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counts["evictions"] += 1
+
+    def _disk_get(self, key: str, now: float) -> Optional[List[NewsArticle]]:
+        """
+        디스크 캐시에서 만료되지 않은 항목을 찾아 메모리에도 올립니다.
+        """
+        if not self.disk_path:
+            return None
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT expires_at, articles FROM search_cache WHERE cache_key = ? AND expires_at > ?", (key, now)
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"[경고] 검색 디스크 캐시 조회 실패: {e}")
+            return None
+        if row is None:
+            return None
+        articles = [NewsArticle(**item) for item in json.loads(row[1])]
+        self._remember(key, row[0], articles)
+        return articles
+
+    def _disk_put(self, key: str, expires_at: float, articles: List[NewsArticle], now: float):
+        payload = json.dumps([asdict(article) for article in articles], ensure_ascii=False)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO search_cache (cache_key, expires_at, articles) VALUES (?, ?, ?)",
+                (key, expires_at, payload)
+            )
+            self._disk_puts += 1
+            if self._disk_puts % DISK_PURGE_EVERY == 0:
+                conn.execute("DELETE FROM search_cache WHERE expires_at <= ?", (now,))
+
+    def stats(self) -> Dict[str, float]:
+        """
+        이 프로세스의 캐시 적중 통계를 반환합니다.
+        hits = 캐시로 응답하여 Tavily를 호출하지 않은 검색 수, saved_credits = 절약한 크레딧 추정치
+        """
+        with self._lock:
+            counts = dict(self._counts)
+            entries = len(self._entries)
+        hits = counts["memory_hits"] + counts["disk_hits"]
+        lookups = hits + counts["misses"]
+        return {
+            **counts,
+            "hits": hits,
+            "lookups": lookups,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "saved_credits": hits * TAVILY_CREDITS_PER_SEARCH,
+            "entries": entries,
+        }
+
+    def clear(self):
+        """
+        메모리 캐시와 통계를 비웁니다. (디스크 캐시는 다른 프로세스와 공유하므로 그대로 둠)
+        """
+        with self._lock:
+            self._entries.clear()
+            self._counts = dict.fromkeys(self._counts, 0)
+
+# 프로세스 전역 검색 결과 캐시
+search_cache = SearchCache(
+    max_entries=settings.SEARCH_CACHE_SIZE,
+    ttls={
+        "24h": settings.SEARCH_CACHE_TTL_24H,
+        "7d": settings.SEARCH_CACHE_TTL_7D,
+        "30d": settings.SEARCH_CACHE_TTL_30D,
+        "custom": settings.SEARCH_CACHE_TTL_CUSTOM,
+    },
+    disk_path=settings.SEARCH_CACHE_PATH
+)
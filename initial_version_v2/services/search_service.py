@@ -1,36 +1,199 @@
 import requests
 import time
-from typing import List
-from tavily import TavilyClient
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, List, Optional, Sequence, Tuple
 from config.settings import settings
 from domain.news_article import NewsArticle
+from domain.result_cursor import ResultCursor
 from domain.search_filters import SearchFilters
+from services.search_cache import cache_key, search_cache
+from services.tavily_client import TavilyHttpClient, get_tavily_client
 from utils.exceptions import AppError
-from utils.query_builder import build_query, resolve_days
+from utils.query_builder import build_fanout_queries, build_query, resolve_days
+from utils.single_flight import SingleFlight
+from utils.url_normalizer import normalize_url
 
-def search_news(filters: SearchFilters, num_results: int = 5) -> List[NewsArticle]:
+# 동시에 들어온 같은 조건의 검색을 한 번의 API 호출로 합침
+_search_flight = SingleFlight()
+
+def search_news(filters: SearchFilters, num_results: int = 5, fanout: Optional[str] = None) -> List[NewsArticle]:
     """
     Tavily API를 사용하여 조건 기반 뉴스를 검색하고 NewsArticle 리스트를 반환합니다.
+    fanout("off" | "terms" | "domains", 기본값 settings.SEARCH_FANOUT)을 지정하면
+    OR 검색어별 또는 도메인 카테고리별로 나눈 요청을 동시에 보내고 결과를 합칩니다.
+    """
+    return search_news_cursor(filters, num_results, fanout).visible
+
+def search_news_cursor(filters: SearchFilters, num_results: int = 5, fanout: Optional[str] = None) -> ResultCursor:
+    """
+    search_news와 같은 검색을 수행하되, 표시할 num_results개 뒤의 나머지 결과도 담은 ResultCursor를 반환합니다.
+    ("더 보기" 시 load_more_news로 API 호출 없이 다음 페이지를 보여줌)
     """
     if not settings.TAVILY_API_KEY:
         raise AppError("api_key_invalid")
 
-    client = TavilyClient(api_key=settings.TAVILY_API_KEY)
-    
+    fanout = fanout or settings.SEARCH_FANOUT
+
+    # 충분한 결과를 가져와서 최신순으로 정렬하기 위해 max_results 조정
+    max_count = max(num_results * 5, 20)
+    articles = _search_all(filters, max_count, fanout)
+    return ResultCursor(
+        filters=filters,
+        page_size=num_results,
+        articles=articles,
+        shown=min(num_results, len(articles)),
+        max_results=max_count,
+        # 요청한 수보다 적게 왔으면 더 받아 올 결과가 없음
+        exhausted=len(articles) < max_count,
+        fanout=fanout
+    )
+
+def load_more_news(cursor: ResultCursor) -> int:
+    """
+    cursor의 다음 페이지를 보여주도록 위치를 옮기고, 새로 보여주게 된 기사 수를 반환합니다.
+    받아 둔 결과가 남아 있으면 API를 호출하지 않으며, 모자랄 때만 요청 결과 수를 2배로 늘려 다시 검색하여
+    이미 받은 기사(정규화한 URL 기준)를 제외한 새 기사만 뒤에 붙입니다. (새 기사가 없으면 exhausted)
+    """
+    if cursor.buffered < cursor.page_size and not cursor.exhausted:
+        max_count = cursor.max_results * 2
+        seen = {normalize_url(article.url) for article in cursor.articles}
+        fresh = [
+            article for article in _search_all(cursor.filters, max_count, cursor.fanout)
+            if normalize_url(article.url) not in seen
+        ]
+        cursor.articles.extend(fresh)
+        cursor.max_results = max_count
+        cursor.exhausted = not fresh
+
+    before = cursor.shown
+    cursor.shown = min(cursor.shown + cursor.page_size, len(cursor.articles))
+    return cursor.shown - before
+
+def _search_all(filters: SearchFilters, max_count: int, fanout: str) -> List[NewsArticle]:
+    """
+    max_count개를 요청한 검색 결과 전체를 최신순으로 반환합니다. (캐시/동시 동일 검색 합치기 적용)
+    """
     # 쿼리 생성
     query = build_query(filters)
     if not query:
         return []
 
+    # 같은 조건의 최근 검색 결과가 있으면 API를 호출하지 않고 재사용
+    key = cache_key(filters, max_count, fanout)
+    cached = search_cache.get(key)
+    if cached is not None:
+        return cached
+
+    # 같은 조건의 검색이 이미 진행 중이면 그 결과를 함께 받음 (결과 리스트는 공유되므로 복사해서 반환)
+    return list(_search_flight.do(key, lambda: _fetch_news(filters, max_count, query, key, fanout)))
+
+def _fetch_news(filters: SearchFilters, max_count: int, query: str, key: str, fanout: str) -> List[NewsArticle]:
+    """
+    Tavily API를 호출하여 검색 결과를 가져오고 캐시에 저장합니다. (_search_all의 single-flight leader만 실행)
+    """
+    # 앞선 동일 검색이 캐시 확인 직후에 끝났을 수 있으므로 한 번 더 확인
+    cached = search_cache.get(key, record=False)
+    if cached is not None:
+        return cached
+
+    # 프로세스 전역 클라이언트의 keep-alive 연결을 재사용 (검색마다 TLS 핸드셰이크를 하지 않음)
+    client = get_tavily_client()
+
     # 검색 기간(days) 설정
     days = resolve_days(filters.date_filter_mode, filters.custom_start, filters.custom_end)
-    
-    # 도메인 필터링
-    include_domains = filters.include_domains if filters.include_domains else []
-    
-    # 충분한 결과를 가져와서 최신순으로 정렬하기 위해 max_results 조정
-    max_count = max(num_results * 5, 20)
-    
+
+    requests_to_send = [(query, filters.include_domains)]
+    if fanout != "off":
+        requests_to_send = build_fanout_queries(filters, fanout, settings.DOMAIN_CATEGORIES)
+
+    if len(requests_to_send) == 1:
+        sub_query, include_domains = requests_to_send[0]
+        results = _request_results(client, sub_query, days, include_domains or [], max_count)
+    else:
+        results = _fanout_results(client, requests_to_send, days, max_count)
+
+    # 표시할 개수만 남기지 않고 전체를 보관 ("더 보기"에서 사용)
+    news_articles = _to_articles(results)
+    search_cache.put(key, news_articles, filters.date_filter_mode)
+    return news_articles
+
+def _to_articles(results: List[Dict]) -> List[NewsArticle]:
+    """
+    검색 결과를 최신순으로 정렬하여 NewsArticle로 변환합니다.
+    """
+    # 최신순 정렬 (published_date 기준 내림차순)
+    results = sorted(results, key=lambda x: x.get('published_date') or '0000-00-00', reverse=True)
+
+    news_articles = []
+    for res in results:
+        news_articles.append(NewsArticle(
+            title=res.get('title', '제목 없음'),
+            url=res.get('url', ''),
+            snippet=res.get('content', ''),
+            pub_date=res.get('published_date', '')
+        ))
+    return news_articles
+
+def _fanout_results(
+    client: TavilyHttpClient,
+    requests_to_send: List[Tuple[str, List[str]]],
+    days: Optional[int],
+    max_count: int
+) -> List[Dict]:
+    """
+    나눈 요청들을 스레드 풀에서 동시에 보내고, 정규화한 URL 기준으로 중복을 제거하여 합칩니다.
+    전체 제한 시간(settings.SEARCH_FANOUT_DEADLINE) 안에 끝난 요청의 결과만 사용하며,
+    일부 요청이 실패해도 나머지 결과로 응답합니다. (모두 실패하면 첫 오류를 그대로 전달)
+    """
+    executor = ThreadPoolExecutor(
+        max_workers=min(settings.SEARCH_FANOUT_WORKERS, len(requests_to_send)),
+        thread_name_prefix="search-fanout"
+    )
+    try:
+        futures = [
+            executor.submit(_request_results, client, sub_query, days, include_domains or [], max_count)
+            for sub_query, include_domains in requests_to_send
+        ]
+        done, not_done = wait(futures, timeout=settings.SEARCH_FANOUT_DEADLINE)
+    finally:
+        # 제한 시간을 넘긴 요청은 기다리지 않음 (아직 시작하지 않은 요청은 취소)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    if not_done:
+        print(f"[경고] 분할 검색 {len(not_done)}/{len(futures)}건이 제한 시간({settings.SEARCH_FANOUT_DEADLINE}초) 안에 끝나지 않아 제외합니다.")
+
+    merged: Dict[str, Dict] = {}
+    errors = []
+    succeeded = 0
+    # 요청 순서대로 합쳐서 같은 기사는 앞선 요청의 결과를 유지
+    for future in futures:
+        if future not in done:
+            continue
+        if future.exception() is not None:
+            errors.append(future.exception())
+            continue
+        succeeded += 1
+        for res in future.result():
+            merged.setdefault(normalize_url(res.get('url', '')) or id(res), res)
+
+    if not succeeded:
+        if errors:
+            raise errors[0]
+        raise AppError("network_error")
+    if errors:
+        print(f"[경고] 분할 검색 {len(errors)}/{len(futures)}건 실패: {errors[0]}")
+    return list(merged.values())
+
+def _request_results(
+    client: TavilyHttpClient,
+    query: str,
+    days: Optional[int],
+    include_domains: Sequence[str],
+    max_count: int
+) -> List[Dict]:
+    """
+    Tavily 검색 요청 1건을 보내고 결과 목록을 반환합니다. (네트워크 오류는 1회 재시도, 오류는 AppError로 변환)
+    """
     # 타임아웃 및 재시도 로직
     max_retries = 1
     retry_delay = 1 # 초
@@ -45,27 +208,7 @@ def search_news(filters: SearchFilters, num_results: int = 5) -> List[NewsArticl
                 max_results=max_count,
                 topic="news"
             )
-            
-            results = response.get('results', [])
-            if not results:
-                return []
-                
-            # 최신순 정렬 (published_date 기준 내림차순)
-            results.sort(key=lambda x: x.get('published_date', '0000-00-00'), reverse=True)
-            
-            # 상위 num_results 만큼만 선택
-            top_results = results[:num_results]
-            
-            news_articles = []
-            for res in top_results:
-                news_articles.append(NewsArticle(
-                    title=res.get('title', '제목 없음'),
-                    url=res.get('url', ''),
-                    snippet=res.get('content', ''),
-                    pub_date=res.get('published_date', '')
-                ))
-                
-            return news_articles
+            return response.get('results', []) or []
 
         except requests.exceptions.HTTPError as e:
             status_code = e.response.status_code if e.response is not None else None
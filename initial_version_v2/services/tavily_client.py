@@ -0,0 +1,105 @@
+import json
+import threading
+from typing import Dict, Optional, Sequence
+import requests
+from requests.adapters import HTTPAdapter
+from config.settings import settings
+
+# Tavily REST API 기본 주소
+TAVILY_API_BASE_URL = "https://api.tavily.com"
+
+class TavilyHttpClient:
+    """
+    연결 풀을 공유하는 장수명 Tavily 검색 클라이언트입니다.
+    검색마다 클라이언트를 새로 만들면 매번 TCP 연결과 TLS 핸드셰이크를 다시 하므로,
+    프로세스에서 하나의 HTTPAdapter(urllib3 연결 풀)를 만들어 두고 keep-alive 연결을 재사용합니다.
+
+    연결 풀은 스레드 안전하지만 requests.Session(쿠키, 헤더 등 상태)은 그렇지 않으므로
+    스레드(Streamlit 세션 실행 스레드)마다 Session을 따로 두고 같은 어댑터를 붙여 연결만 공유합니다.
+
+    Attributes:
+        base_url (str): Tavily API 기본 주소
+        pool_size (int): 호스트당 유지하는 최대 연결 수 (동시 요청이 더 많으면 남는 연결은 쓰고 닫음)
+        timeout (Tuple[float, float]): (연결, 응답 읽기) 타임아웃(초)
+    """
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = TAVILY_API_BASE_URL,
+        pool_size: int = 10,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 30.0
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.pool_size = pool_size
+        self.timeout = (connect_timeout, read_timeout)
+        self._headers = {"Content-Type": "application/json", "Authorization": f"Bearer {api_key}"}
+        # 재시도는 search_service에서 오류 종류별로 처리하므로 어댑터 자체 재시도는 끔
+        self._adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self._local = threading.local()
+
+    def _session(self) -> requests.Session:
+        """
+        현재 스레드의 Session을 반환합니다. (처음 호출 시 공유 어댑터를 붙여 생성)
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self._headers)
+            session.mount("https://", self._adapter)
+            session.mount("http://", self._adapter)
+            self._local.session = session
+        return session
+
+    def search(
+        self,
+        query: str,
+        search_depth: str = "basic",
+        topic: str = "general",
+        days: Optional[int] = None,
+        max_results: int = 5,
+        include_domains: Optional[Sequence[str]] = None
+    ) -> Dict:
+        """
+        Tavily /search API를 호출하고 응답 JSON을 반환합니다.
+        HTTP 오류는 requests.exceptions.HTTPError, 연결/응답 지연은 ConnectionError/Timeout으로 전달됩니다.
+        """
+        payload = {
+            "query": query,
+            "search_depth": search_depth,
+            "topic": topic,
+            "days": days,
+            "max_results": max_results,
+            "include_domains": list(include_domains) if include_domains else None,
+        }
+        payload = {k: v for k, v in payload.items() if v is not None}
+
+        response = self._session().post(f"{self.base_url}/search", data=json.dumps(payload), timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def close(self):
+        """
+        풀에 남아 있는 연결을 모두 닫습니다.
+        """
+        self._adapter.close()
+
+_client: Optional[TavilyHttpClient] = None
+_client_lock = threading.Lock()
+
+def get_tavily_client() -> TavilyHttpClient:
+    """
+    프로세스 전역 Tavily 클라이언트를 반환합니다. (처음 호출 시 settings 값으로 생성, 이후 재사용)
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = TavilyHttpClient(
+                    api_key=settings.TAVILY_API_KEY,
+                    base_url=settings.TAVILY_API_BASE_URL,
+                    pool_size=settings.TAVILY_POOL_SIZE,
+                    connect_timeout=settings.TAVILY_CONNECT_TIMEOUT,
+                    read_timeout=settings.TAVILY_READ_TIMEOUT
+                )
+    return _client
@@ -0,0 +1,50 @@
+"""
+테스트 공통 설정입니다.
+
+config.settings는 가져올 때 필수 환경 변수를 검사하므로, 프로젝트 모듈보다 먼저 테스트용 값을 넣습니다.
+Tavily 검색은 로컬 HTTPS 스텁 서버(benchmarks/tavily_stub.py)로 보내며 실제 API는 호출하지 않습니다.
+"""
+import os
+import tempfile
+
+# .env보다 먼저 설정 (load_dotenv는 이미 있는 환경 변수를 덮어쓰지 않음)
+os.environ.update(
+    TAVILY_API_KEY="stub-key",
+    GEMINI_API_KEY="test-key",
+    CSV_PATH=os.path.join(tempfile.gettempdir(), "trendtracker-test-history.csv"),
+    SEARCH_CACHE_PATH="",
+    SEARCH_FANOUT="off",
+)
+
+import pytest
+from benchmarks.tavily_stub import StubServer
+from config.settings import settings
+from services import tavily_client
+from services.search_cache import search_cache
+
+# 동시 호출이 모두 같은 요청을 기다리도록 스텁 응답을 늦춤
+STUB_RESPONSE_DELAY_MS = 200
+
+@pytest.fixture(scope="session")
+def stub_server():
+    """
+    세션 동안 하나의 스텁 서버를 띄우고 Tavily 클라이언트가 이 서버를 가리키게 합니다.
+    """
+    with StubServer(response_delay_ms=STUB_RESPONSE_DELAY_MS) as server:
+        os.environ["REQUESTS_CA_BUNDLE"] = server.cert_path
+        settings.TAVILY_API_BASE_URL = server.base_url
+        tavily_client._client = None
+        yield server
+        tavily_client._client = None
+
+@pytest.fixture
+def stub(stub_server):
+    """
+    테스트마다 스텁 서버의 요청 수/실패 응답 설정과 검색 캐시를 비운 상태로 시작합니다.
+    """
+    search_cache.clear()
+    stub_server.stats.reset()
+    stub_server.fail_status = None
+    yield stub_server
+    stub_server.fail_status = None
+    search_cache.clear()
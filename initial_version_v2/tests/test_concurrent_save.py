@@ -0,0 +1,48 @@
+"""
+여러 스레드가 같은 검색 기록에 동시에 저장해도 행이 사라지지 않는지 확인합니다.
+(자세한 부하 테스트는 benchmarks/stress_concurrent_save.py)
+"""
+import threading
+import pytest
+from benchmarks.stress_concurrent_save import ARTICLES_PER_SEARCH, make_result
+from repositories.repository_factory import create_search_repository
+
+WORKERS = 8
+SAVES = 10
+
+@pytest.mark.parametrize(
+    "file_name, backend, batch_ms",
+    [
+        ("history.csv", "csv", 0),
+        ("history.csv", "csv", 20),
+        ("history.db", "sqlite", 0),
+        ("history/", "partitioned", 0),
+        ("history.parquet", "parquet", 0),
+    ],
+)
+def test_concurrent_saves_lose_no_rows(tmp_path, file_name, backend, batch_ms):
+    if backend == "parquet":
+        pytest.importorskip("pyarrow")
+    path = str(tmp_path / file_name)
+    start = threading.Barrier(WORKERS)
+    failures = []
+
+    def worker(worker_id: int):
+        # 세션마다 리포지토리를 따로 만드는 Streamlit 환경처럼 스레드별 인스턴스를 사용
+        repository = create_search_repository(path, backend, write_batch_ms=batch_ms)
+        start.wait()
+        for seq in range(SAVES):
+            if not repository.save(make_result(worker_id, seq)):
+                failures.append((worker_id, seq))
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(WORKERS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    df = create_search_repository(path, backend).load()
+    assert failures == []
+    assert len(df) == WORKERS * SAVES * ARTICLES_PER_SEARCH
+    assert df["search_key"].nunique() == WORKERS * SAVES
+    assert df.groupby("search_key", observed=True).size().eq(ARTICLES_PER_SEARCH).all()
@@ -0,0 +1,36 @@
+"""
+"더 보기"(load_more_news)가 받아 둔 결과를 다 보여준 뒤에만 Tavily를 다시 호출하는지 확인합니다.
+"""
+from domain.search_filters import SearchFilters
+from services.search_service import load_more_news, search_news_cursor
+
+PAGE_SIZE = 5
+
+def test_load_more_refetches_only_after_buffer_is_used_up(stub):
+    filters = SearchFilters(["반도체"], [], [], "7d", None, None, [])
+    cursor = search_news_cursor(filters, num_results=PAGE_SIZE)
+    assert stub.stats.requests == 1
+    assert (cursor.shown, cursor.max_results, cursor.buffered) == (PAGE_SIZE, 25, 20)
+
+    # 받아 둔 20개는 API 호출 없이 4페이지로 보여줌
+    for _ in range(4):
+        assert load_more_news(cursor) == PAGE_SIZE
+    assert stub.stats.requests == 1
+    assert cursor.buffered == 0
+
+    # 모자라면 2배 개수로 다시 요청하고 이미 받은 기사는 빼고 붙임
+    assert load_more_news(cursor) == PAGE_SIZE
+    assert stub.stats.requests == 2
+    assert cursor.max_results == 50
+    assert len(cursor.articles) == 50
+    assert len({a.url for a in cursor.articles}) == 50
+
+def test_load_more_stops_when_results_are_exhausted(stub):
+    filters = SearchFilters(["금리"], [], [], "7d", None, None, [])
+    cursor = search_news_cursor(filters, num_results=PAGE_SIZE)
+    cursor.exhausted = True
+    cursor.shown = len(cursor.articles)
+
+    assert load_more_news(cursor) == 0
+    assert not cursor.has_more
+    assert stub.stats.requests == 1
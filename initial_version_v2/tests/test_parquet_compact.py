@@ -0,0 +1,82 @@
+"""
+Parquet 저장소가 저장 중 파티션을 합쳐도 조회가 중복 행이나 사라진 파일을 보지 않는지 확인합니다.
+"""
+import os
+import threading
+import pytest
+from benchmarks.stress_concurrent_save import ARTICLES_PER_SEARCH, make_result
+
+pytest.importorskip("pyarrow")
+from repositories.parquet_search_repository import ParquetSearchRepository  # noqa: E402
+
+def _part_files(root: str):
+    return [
+        f for name in os.listdir(root) if name.startswith("search_date=")
+        for f in os.listdir(os.path.join(root, name)) if f.endswith(".parquet")
+    ]
+
+def test_save_compacts_partition_and_keeps_row_order(tmp_path):
+    root = str(tmp_path / "history.parquet")
+    repository = ParquetSearchRepository(root, compact_files=4)
+    results = [make_result(0, seq) for seq in range(10)]
+    for result in results[:3]:
+        repository.save(result)
+    assert len(repository.search_text("인용", limit=100)) == 3 * ARTICLES_PER_SEARCH
+
+    for result in results[3:]:
+        repository.save(result)
+
+    # 날짜가 바뀌는 순간에 걸리지 않았다면 파티션 하나에 파일이 4개 미만으로 유지됨
+    assert len(_part_files(root)) < 4 * len(os.listdir(root))
+    keys = repository.load(columns=["search_key"])["search_key"].tolist()
+    assert keys == [r.search_key for r in results for _ in range(ARTICLES_PER_SEARCH)]
+    # 합친 뒤에도 행 순서가 같으므로 색인의 문서 번호가 그대로 맞음
+    hits = repository.search_text("인용", limit=100)
+    assert sorted(h.title for h in hits) == sorted(a.title for r in results for a in r.articles)
+
+def test_reads_never_see_duplicates_while_compacting(tmp_path):
+    root = str(tmp_path / "history.parquet")
+    repository = ParquetSearchRepository(root, compact_files=3)
+    stop = threading.Event()
+    observed = []
+
+    def reader():
+        while not stop.is_set():
+            df = repository.load(columns=["search_key", "article_index"])
+            observed.append((len(df), int(df.duplicated().sum())))
+
+    readers = [threading.Thread(target=reader) for _ in range(3)]
+    for thread in readers:
+        thread.start()
+    try:
+        for seq in range(30):
+            assert repository.save(make_result(0, seq))
+    finally:
+        stop.set()
+        for thread in readers:
+            thread.join()
+
+    assert observed
+    assert all(duplicates == 0 for _, duplicates in observed)
+    assert max(rows for rows, _ in observed) <= 30 * ARTICLES_PER_SEARCH
+    assert len(repository.load()) == 30 * ARTICLES_PER_SEARCH
+
+def test_compaction_waits_for_open_reads_before_swapping_files(tmp_path):
+    root = str(tmp_path / "history.parquet")
+    repository = ParquetSearchRepository(root, compact_files=0)
+    for seq in range(4):
+        repository.save(make_result(0, seq))
+    search_date = max(os.listdir(root)).split("=", 1)[1]
+    files_before = sorted(_part_files(root))
+
+    # 조회 중(공유 잠금)에는 합친 파일을 만들어 두기만 하고 원래 파일은 지우지 않음
+    with repository._lock():
+        compacting = threading.Thread(target=repository.compact, args=(search_date,))
+        compacting.start()
+        compacting.join(timeout=0.5)
+        assert compacting.is_alive()
+        assert sorted(_part_files(root)) == files_before
+    compacting.join()
+
+    assert len(_part_files(root)) == len(os.listdir(root))
+    assert len(repository.load()) == 4 * ARTICLES_PER_SEARCH
@@ -0,0 +1,53 @@
+"""
+검색 결과 캐시(services/search_cache.py)의 TTL 만료와 LRU 제거를 확인합니다.
+"""
+from domain.news_article import NewsArticle
+from domain.search_filters import SearchFilters
+from services.search_cache import SearchCache, cache_key
+
+NOW = 1_800_000_000.0
+
+def _articles(n: int):
+    return [NewsArticle(f"기사 {i}", f"https://news.example.co.kr/{i}", "본문") for i in range(n)]
+
+def test_entry_expires_after_ttl_of_its_date_filter():
+    cache = SearchCache(max_entries=8, ttls={"24h": 60, "7d": 600, "30d": 3600, "custom": 3600})
+    cache.put("day", _articles(2), "24h", now=NOW)
+    cache.put("week", _articles(3), "7d", now=NOW)
+
+    assert len(cache.get("day", now=NOW + 59)) == 2
+    assert cache.get("day", now=NOW + 60) is None
+    assert len(cache.get("week", now=NOW + 599)) == 3
+    assert cache.get("week", now=NOW + 600) is None
+
+    stats = cache.stats()
+    assert (stats["memory_hits"], stats["misses"], stats["entries"]) == (2, 2, 0)
+
+def test_least_recently_used_entry_is_evicted_first():
+    cache = SearchCache(max_entries=2)
+    cache.put("a", _articles(1), "30d", now=NOW)
+    cache.put("b", _articles(1), "30d", now=NOW)
+    # a를 조회하면 가장 최근에 쓴 항목이 되므로 다음 저장 때 b가 빠짐
+    assert cache.get("a", now=NOW) is not None
+    cache.put("c", _articles(1), "30d", now=NOW)
+
+    assert cache.get("b", now=NOW) is None
+    assert cache.get("a", now=NOW) is not None
+    assert cache.get("c", now=NOW) is not None
+    assert cache.stats()["evictions"] == 1
+
+def test_disk_cache_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "cache.db")
+    SearchCache(disk_path=path).put("k", _articles(2), "7d", now=NOW)
+
+    other = SearchCache(disk_path=path)
+    assert [a.url for a in other.get("k", now=NOW)] == [a.url for a in _articles(2)]
+    assert other.stats()["disk_hits"] == 1
+    assert other.get("k", now=NOW + 10_000) is None
+
+def test_equivalent_filters_share_a_cache_key():
+    a = SearchFilters(["반도체", "금리"], [], [], "7d", None, None, ["Hankyung.com"])
+    b = SearchFilters(["금리 ", "반도체", "금리"], [], [], "7d", None, None, ["hankyung.com"])
+    assert cache_key(a, 25) == cache_key(b, 25)
+    assert cache_key(a, 25) != cache_key(a, 50)
+    assert cache_key(a, 25) != cache_key(a, 25, fanout="terms")
@@ -0,0 +1,52 @@
+"""
+동시에 들어온 같은 검색이 한 번의 Tavily 호출로 합쳐지고, 오류는 기다리던 모든 호출에 전달되는지 확인합니다.
+(스텁 서버 응답이 늦으므로 그 사이에 들어온 호출은 모두 첫 호출을 기다림)
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from domain.search_filters import SearchFilters
+from services.search_service import search_news
+from utils.exceptions import AppError
+from utils.single_flight import SingleFlight
+
+CALLERS = 16
+
+def _search_concurrently(callers: int):
+    barrier = threading.Barrier(callers)
+
+    def caller(i: int):
+        # 검색어 순서가 달라도 같은 검색으로 합쳐져야 함
+        terms = ["반도체", "금리"] if i % 2 else ["금리", "반도체"]
+        filters = SearchFilters(terms, [], [], "24h", None, None, [])
+        barrier.wait()
+        try:
+            return search_news(filters, num_results=5)
+        except AppError as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=callers) as executor:
+        return list(executor.map(caller, range(callers)))
+
+def test_concurrent_identical_searches_make_one_upstream_call(stub):
+    outcomes = _search_concurrently(CALLERS)
+
+    assert stub.stats.requests == 1
+    assert all(isinstance(articles, list) and len(articles) == 5 for articles in outcomes)
+    assert len({tuple(a.url for a in articles) for articles in outcomes}) == 1
+    # 호출마다 복사본을 받으므로 한 호출의 수정이 다른 호출에 보이지 않음
+    assert len({id(articles) for articles in outcomes}) == CALLERS
+
+def test_upstream_error_reaches_every_waiter(stub):
+    stub.fail_status = 500
+    outcomes = _search_concurrently(CALLERS)
+
+    assert stub.stats.requests == 1
+    assert all(isinstance(e, AppError) and e.error_type == "tavily_server_error" for e in outcomes)
+
+def test_key_is_released_after_a_call_finishes():
+    flight = SingleFlight()
+    calls = []
+    assert flight.do("k", lambda: calls.append(1) or "first") == "first"
+    assert flight.do("k", lambda: calls.append(2) or "second") == "second"
+    assert calls == [1, 2]
+    assert flight.stats() == {"executed": 2, "shared": 0, "in_flight": 0}
@@ -0,0 +1,127 @@
+"""
+CSV 스냅샷 캐시(repositories/snapshot_cache.py)가 저장된 행을 기존 DataFrame을 다시 만들지 않고 반영하는지 확인합니다.
+"""
+import os
+from datetime import datetime, timedelta
+import pandas as pd
+from benchmarks.stress_concurrent_save import ARTICLES_PER_SEARCH, make_result
+from repositories import history_frame
+from repositories.history_listing import HistoryListing
+from repositories.search_repository import SearchRepository
+from repositories.snapshot_cache import snapshot_cache
+
+def _entry(path: str):
+    return snapshot_cache._entries[os.path.abspath(path)]
+
+def test_save_adds_a_chunk_instead_of_copying_the_cached_frame(tmp_path):
+    path = str(tmp_path / "history.csv")
+    repository = SearchRepository(path)
+    for seq in range(20):
+        repository.save(make_result(0, seq))
+    assert len(repository.load()) == 20 * ARTICLES_PER_SEARCH
+    base = _entry(path).chunks[0]
+
+    for seq in range(20, 30):
+        repository.save(make_result(0, seq))
+
+    # 캐시된 전체 DataFrame은 그대로 두고 추가분만 조각으로 덧붙임
+    chunks = _entry(path).chunks
+    assert chunks[0] is base
+    assert len(chunks) > 1
+    assert sum(len(chunk) for chunk in chunks) == 30 * ARTICLES_PER_SEARCH
+
+    # 전체가 필요한 조회에서 한 번 합치고, 결과는 파일을 처음부터 읽은 것과 같음
+    merged = repository.load()
+    assert len(_entry(path).chunks) == 1
+    snapshot_cache.invalidate(path)
+    pd.testing.assert_frame_equal(merged.reset_index(drop=True), repository.load().reset_index(drop=True))
+
+def test_aggregates_follow_saves_without_merging(tmp_path):
+    path = str(tmp_path / "history.csv")
+    repository = SearchRepository(path)
+    repository.save(make_result(0, 0))
+    assert repository.get_all_keys() == ["w0-s0"]
+
+    for seq in range(1, 6):
+        repository.save(make_result(0, seq))
+
+    assert len(_entry(path).chunks) > 1
+    assert sorted(repository.get_all_keys()) == sorted(f"w0-s{seq}" for seq in range(6))
+    assert repository.count_searches_for_url("https://example.com/0/5/0") == 1
+
+def test_search_key_stays_plain_string_across_chunks(tmp_path, monkeypatch):
+    path = str(tmp_path / "history.csv")
+    repository = SearchRepository(path)
+    for seq in range(5):
+        repository.save(make_result(0, seq))
+    repository.load()
+    for seq in range(5, 8):
+        repository.save(make_result(0, seq))
+
+    # 이어 붙일 때 전체 키 집합을 다시 합치지 않도록 search_key는 category가 아님 (keyword만 category)
+    merged = repository.load()
+    assert not isinstance(merged["search_key"].dtype, pd.CategoricalDtype)
+    assert isinstance(merged["keyword"].dtype, pd.CategoricalDtype)
+    assert merged["search_key"].nunique() == 8
+
+    # 시각처럼 생긴 분 단위 레거시 키도 두 파서 모두 문자열 그대로 읽음
+    data = "search_key,keyword\n2024-01-01 10:00,a\n".encode("utf-8")
+    assert history_frame.parse_history_csv(data)["search_key"].tolist() == ["2024-01-01 10:00"]
+    monkeypatch.setattr(history_frame, "pa", None)
+    assert history_frame.parse_history_csv(data)["search_key"].tolist() == ["2024-01-01 10:00"]
+
+def _append_from_other_process(repository: SearchRepository, worker: int, seq: int):
+    # 다른 프로세스의 저장처럼 이 프로세스의 캐시를 거치지 않고 파일 끝에 바로 추가
+    rows = make_result(worker, seq).to_dataframe()[repository.columns]
+    rows["title"] = "다른 프로세스 저장 기사"
+    with open(repository.csv_path, "ab") as f:
+        f.write(rows.to_csv(index=False, header=False, lineterminator="\n").encode("utf-8"))
+
+def test_tail_refresh_serves_lookups_from_chunks(tmp_path):
+    path = str(tmp_path / "history.csv")
+    repository = SearchRepository(path)
+    for seq in range(10):
+        repository.save(make_result(0, seq))
+    assert repository.find_by_key("w0-s0") is not None
+    assert repository.search_text("인용") != []
+    base = _entry(path).chunks[0]
+
+    for seq in range(3):
+        _append_from_other_process(repository, 1, seq)
+
+    # 추가분만 읽어 조각으로 붙이고, 검색 1건 조회와 색인 갱신은 조각에서 바로 읽음
+    found = repository.find_by_key("w1-s2")
+    assert found is not None and len(found.articles) == ARTICLES_PER_SEARCH
+    hits = repository.search_text("프로세스", limit=50)
+    assert sorted({h.search_key for h in hits}) == ["w1-s0", "w1-s1", "w1-s2"]
+    assert len(hits) == 3 * ARTICLES_PER_SEARCH
+    assert _entry(path).chunks[0] is base
+    assert len(_entry(path).chunks) > 1
+    assert snapshot_cache.stats()["tail_reads"] >= 1
+    # 추가분 검색 시각이 기존 목록보다 앞서도 목록은 검색 시간순을 유지
+    assert repository.get_all_keys()[0] == "w1-s0"
+    assert len(repository.get_all_keys()) == 13
+
+def test_history_listing_appends_in_place_and_keeps_order():
+    listing = HistoryListing()
+    start = datetime(2026, 10, 1)
+
+    def rows(keys, minutes):
+        return pd.DataFrame({
+            "search_key": keys,
+            "search_time": [start + timedelta(minutes=m) for m in minutes],
+            "keyword": ["반도체"] * len(keys),
+        })
+
+    listing.add_rows(rows(["a", "b"], [0, 1]))
+    page = listing.page(page_size=1)
+    for i in range(100):
+        listing.add_rows(rows([f"k{i:03d}"], [10 + i]))
+    # 앞서 꺼낸 페이지와 그 커서는 뒤에 추가된 항목의 영향을 받지 않음
+    assert [e.search_key for e in page.entries] == ["b"]
+    assert [e.search_key for e in listing.page(cursor=page.next_cursor).entries] == ["a"]
+
+    listing.add_rows(rows(["late"], [5]))
+    keys = listing.keys_newest_first()
+    assert keys[:2] == ["k099", "k098"] and keys[-3:] == ["late", "b", "a"]
+    assert len(keys) == 103
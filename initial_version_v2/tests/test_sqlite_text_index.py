@@ -0,0 +1,50 @@
+"""
+SQLite 저장소의 전문 검색 색인이 search_key가 중복된 레거시 기록에서도 새 행을 빠짐없이 색인하는지 확인합니다.
+"""
+import json
+from benchmarks.stress_concurrent_save import ARTICLES_PER_SEARCH, make_result
+from repositories.sqlite_search_repository import SqliteSearchRepository
+from repositories.text_index import TEXT_INDEX_SUFFIX, text_indexes
+
+def _resaved_under_same_key(title: str):
+    # 분 단위 레거시 키처럼 이미 저장된 검색과 같은 search_key로 다시 저장되는 검색
+    result = make_result(0, 0)
+    for i, article in enumerate(result.articles):
+        article.title = f"{title} {i}"
+        article.url = f"https://example.com/resaved/{i}"
+    return result
+
+def test_duplicate_keys_are_indexed_from_the_recorded_search_id(tmp_path):
+    path = str(tmp_path / "history.db")
+    repository = SqliteSearchRepository(path)
+    repository.save(make_result(0, 0))
+    assert repository.search_text("인용") != []
+
+    repository.save(_resaved_under_same_key("다시 저장된 기사"))
+
+    hits = repository.search_text("저장된", limit=50)
+    assert sorted(hit.title for hit in hits) == [f"다시 저장된 기사 {i}" for i in range(ARTICLES_PER_SEARCH)]
+    # 결과 행은 키가 아니라 search_id로 짝지으므로 첫 검색의 기사와 섞이지 않음
+    assert all(hit.url.startswith("https://example.com/resaved/") for hit in hits)
+
+def test_log_without_search_ids_is_rebuilt(tmp_path):
+    path = str(tmp_path / "history.db")
+    repository = SqliteSearchRepository(path)
+    for seq in range(3):
+        repository.save(make_result(0, seq))
+    assert repository.search_text("인용") != []
+
+    # search_id를 기록하지 않던 이전 형식의 로그를 다른 프로세스가 처음 여는 상황
+    log_path = path + TEXT_INDEX_SUFFIX
+    with open(log_path, encoding="utf-8") as f:
+        segments = [json.loads(line) for line in f]
+    with open(log_path, "w", encoding="utf-8") as f:
+        for segment in segments:
+            segment.pop("search_ids")
+            f.write(json.dumps(segment, ensure_ascii=False) + "\n")
+    text_indexes._indexes.pop(log_path)
+
+    repository.save(_resaved_under_same_key("다시 저장된 기사"))
+    hits = repository.search_text("저장된", limit=50)
+    assert len(hits) == ARTICLES_PER_SEARCH
+    assert text_indexes.get(log_path).doc_count == 4 * ARTICLES_PER_SEARCH
@@ -1,10 +1,90 @@
+import os
+import threading
 from datetime import datetime
+from typing import Optional, Tuple
 
-def generate_search_key(keyword: str) -> str:
+# ULID 문자 집합 (Crockford Base32: I, L, O, U 제외) - 문자열 정렬 순서가 값의 순서와 같음
+CROCKFORD32 = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+# 키 길이: 밀리초 타임스탬프 48비트(10자) + 난수 80비트(16자)
+SEARCH_KEY_LENGTH = 26
+TIMESTAMP_LENGTH = 10
+RANDOM_BITS = 80
+
+# 이전 형식 키("키워드-yyyymmddhhmm")의 시각 부분 형식
+LEGACY_TIME_FORMAT = "%Y%m%d%H%M"
+
+_lock = threading.Lock()
+_last_ms = -1
+_last_random = 0
+
+def _encode(value: int, length: int) -> str:
+    chars = []
+    for _ in range(length):
+        value, digit = divmod(value, 32)
+        chars.append(CROCKFORD32[digit])
+    return "".join(reversed(chars))
+
+def generate_search_key(now: Optional[datetime] = None) -> str:
+    """
+    검색 시각을 앞에 담은 26자 ULID 형식 검색 키를 생성합니다. (예: "01JAB3K7Q2XQ4M8N9P0R5S6T7V")
+    앞 10자는 밀리초 타임스탬프, 뒤 16자는 난수이므로 같은 분에 같은 키워드를 검색해도 겹치지 않고,
+    키를 문자열로 정렬하면 생성 순서(시간순)가 됩니다.
+    현재 시각으로 만들 때 같은 밀리초 안에서(또는 시계가 뒤로 간 경우) 다시 호출되면 직전 키의 난수 부분을 1 증가시켜
+    한 프로세스에서 만든 키는 항상 직전 키보다 큽니다.
+    now를 지정하면 그 시각을 그대로 담고 난수만 새로 뽑습니다. (과거 기록 이관 등에서 지정한 시각이 바뀌지 않도록)
+
+    Args:
+        now (datetime): 키에 담을 검색 시각 (기본값: 현재 시각)
+    """
+    global _last_ms, _last_random
+    if now is not None:
+        ms, random_part = int(now.timestamp() * 1000), int.from_bytes(os.urandom(10), "big")
+        return _encode(ms, TIMESTAMP_LENGTH) + _encode(random_part, SEARCH_KEY_LENGTH - TIMESTAMP_LENGTH)
+
+    ms = int(datetime.now().timestamp() * 1000)
+    with _lock:
+        if ms <= _last_ms:
+            ms, random_part = _last_ms, _last_random + 1
+            if random_part >> RANDOM_BITS:
+                # 같은 밀리초에 난수 공간을 모두 쓴 경우 다음 밀리초로 넘김
+                ms, random_part = ms + 1, int.from_bytes(os.urandom(10), "big")
+        else:
+            random_part = int.from_bytes(os.urandom(10), "big")
+        _last_ms, _last_random = ms, random_part
+    return _encode(ms, TIMESTAMP_LENGTH) + _encode(random_part, SEARCH_KEY_LENGTH - TIMESTAMP_LENGTH)
+
+def is_ulid_key(search_key: str) -> bool:
+    """
+    ULID 형식(26자 Crockford Base32) 검색 키인지 확인합니다.
+    """
+    return (
+        len(search_key) == SEARCH_KEY_LENGTH
+        and search_key[0] in "01234567"  # 48비트 타임스탬프 범위
+        and all(c in CROCKFORD32 for c in search_key)
+    )
+
+def split_legacy_key(search_key: str) -> Optional[Tuple[str, datetime]]:
+    """
+    이전 형식 키("키워드-yyyymmddhhmm")를 (키워드, 분 단위 검색 시각)으로 나눕니다. 형식이 다르면 None을 반환합니다.
+    """
+    keyword, _, timestamp = search_key.rpartition("-")
+    if not keyword or len(timestamp) != 12:
+        return None
+    try:
+        return keyword, datetime.strptime(timestamp, LEGACY_TIME_FORMAT)
+    except ValueError:
+        return None
+
+def search_key_time(search_key: str) -> Optional[datetime]:
     """
-    현재 시간을 기준으로 검색 키를 생성합니다.
-    형식: "키워드-yyyymmddhhmm" (예: "AI트렌드-202601181430")
+    검색 키에 담긴 검색 시각을 반환합니다. (ULID 키는 밀리초, 이전 형식 키는 분 단위)
+    시각을 알 수 없는 키는 None을 반환합니다.
     """
-    now = datetime.now()
-    timestamp = now.strftime("%Y%m%d%H%M")
-    return f"{keyword}-{timestamp}"
+    if is_ulid_key(search_key):
+        ms = 0
+        for c in search_key[:TIMESTAMP_LENGTH]:
+            ms = ms * 32 + CROCKFORD32.index(c)
+        return datetime.fromtimestamp(ms / 1000)
+    legacy = split_legacy_key(search_key)
+    return legacy[1] if legacy else None
@@ -1,5 +1,6 @@
+from dataclasses import replace
 from datetime import date, datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from domain.search_filters import SearchFilters
 
 def parse_terms(raw: str) -> List[str]:
@@ -58,3 +59,43 @@ def resolve_days(
         return max(1, delta.days)
     
     return None
+
+def group_domains(domains: List[str], categories: Dict[str, List[str]]) -> List[List[str]]:
+    """
+    도메인 리스트를 카테고리(settings.DOMAIN_CATEGORIES)별 묶음으로 나눕니다.
+    어느 카테고리에도 없는 도메인은 마지막 묶음 하나로 모읍니다. (입력 순서 유지, 빈 묶음 제외)
+    """
+    owner = {}
+    for name, members in categories.items():
+        for domain in members:
+            owner.setdefault(domain, name)
+
+    groups: Dict[str, List[str]] = {}
+    others = []
+    for domain in dict.fromkeys(domains):
+        if domain in owner:
+            groups.setdefault(owner[domain], []).append(domain)
+        else:
+            others.append(domain)
+    return list(groups.values()) + ([others] if others else [])
+
+def build_fanout_queries(
+    filters: SearchFilters,
+    mode: str,
+    categories: Dict[str, List[str]]
+) -> List[Tuple[str, List[str]]]:
+    """
+    분할 검색(fan-out)용 (쿼리, 포함 도메인) 목록을 만듭니다.
+    - terms: OR 검색어마다 하나씩 (AND/NOT 조건과 도메인은 모두 같음)
+    - domains: 도메인 카테고리 묶음마다 하나씩 (쿼리는 같음)
+    나눌 것이 없으면 build_query와 같은 요청 하나만 반환합니다.
+    """
+    if mode == "terms" and len(filters.main_terms) > 1:
+        return [
+            (build_query(replace(filters, main_terms=[term])), filters.include_domains)
+            for term in dict.fromkeys(filters.main_terms)
+        ]
+    if mode == "domains" and filters.include_domains:
+        query = build_query(filters)
+        return [(query, group) for group in group_domains(filters.include_domains, categories)]
+    return [(build_query(filters), filters.include_domains)]
@@ -0,0 +1,60 @@
+import threading
+from concurrent.futures import Future
+from typing import Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+class SingleFlight:
+    """
+    같은 키로 동시에 들어온 호출을 하나로 합칩니다. (single-flight)
+    인기 검색어처럼 여러 세션이 몇 초 안에 같은 요청을 보내면, 먼저 온 호출(leader)만 실제로 실행하고
+    그 사이에 들어온 같은 키의 호출은 leader의 Future를 기다려 같은 결과를 받습니다.
+
+    - leader가 예외를 던지면 기다리던 모든 호출에도 같은 예외가 전달됩니다.
+    - 결과는 보관하지 않습니다. 실행이 끝나면 키를 지우므로 이후 호출은 다시 실행됩니다. (보관은 캐시의 역할)
+    - 결과 객체를 모든 호출이 공유하므로, 호출한 쪽에서 수정할 값이면 복사해서 사용해야 합니다.
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+        self._counts = {"executed": 0, "shared": 0}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """
+        key로 진행 중인 호출이 있으면 그 결과를 기다리고, 없으면 fn()을 실행하여 결과를 반환합니다.
+
+        Args:
+            key (Hashable): 같은 요청을 판별하는 키
+            fn (Callable[[], T]): 실제 호출 (인자 없음)
+
+        Returns:
+            T: fn()의 결과 (기다린 호출은 leader와 같은 객체)
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self._counts["shared"] += 1
+                leader = False
+            else:
+                future = self._calls[key] = Future()
+                self._counts["executed"] += 1
+                leader = True
+
+        if not leader:
+            return future.result()
+
+        try:
+            future.set_result(fn())
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                del self._calls[key]
+        return future.result()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        실제로 실행한 호출 수(executed)와 다른 호출의 결과를 기다려 받은 수(shared)를 반환합니다.
+        """
+        with self._lock:
+            return {**self._counts, "in_flight": len(self._calls)}
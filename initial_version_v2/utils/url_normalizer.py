@@ -0,0 +1,43 @@
+import hashlib
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 같은 기사를 가리키지만 유입 경로만 다른 URL에 붙는 추적용 파라미터
+TRACKING_PARAMS = {"fbclid", "gclid", "igshid", "ref", "ref_src", "cmpid", "ocid"}
+TRACKING_PREFIXES = ("utm_",)
+
+def normalize_url(url: str) -> str:
+    """
+    같은 기사를 가리키는 URL이 같은 문자열이 되도록 정규화합니다.
+    - 스킴/호스트 소문자화, http는 https로 통일, "www." 제거, 기본 포트(80/443) 제거
+    - 추적용 쿼리 파라미터(utm_*, fbclid 등)와 #fragment 제거, 나머지 파라미터는 이름순 정렬
+    - 경로 끝의 "/" 제거
+    예: "HTTPS://www.Hani.co.kr/arti/123/?utm_source=x#top" → "https://hani.co.kr/arti/123"
+    """
+    url = (url or "").strip()
+    if not url:
+        return ""
+
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower() or "https"
+    if scheme == "http":
+        scheme = "https"
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+
+    query = sorted(
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if name.lower() not in TRACKING_PARAMS and not name.lower().startswith(TRACKING_PREFIXES)
+    )
+    path = parts.path.rstrip("/")
+    return urlunsplit((scheme, host, path, urlencode(query), ""))
+
+def url_hash(url: str) -> int:
+    """
+    정규화한 URL의 SHA-1 앞 8바이트를 부호 있는 64비트 정수로 반환합니다. (SQLite INTEGER 키로 사용)
+    """
+    digest = hashlib.sha1(normalize_url(url).encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big", signed=True)